@@ -3,8 +3,15 @@
 Generate parameter sensitivity analysis figures for the manuscript.
 Creates sweep plots for delta (cooling weight), fmax (sleep fraction), 
 MinRest (cooling period), and computational trade-off analysis.
+
+Sweep figures are drawn from simulated results produced by
+    python -m smartfarm.sweeps --seeds 30 --out latex/data/sensitivity_sweeps.json
+and the computational trade-off from measured estimator timings produced by
+    python -m smartfarm.benchmarks --out latex/data/benchmarks.json
 """
 
+import argparse
+import json
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
@@ -29,20 +36,33 @@ plt.rcParams.update({
 output_dir = Path(__file__).parent.parent / 'figures'
 output_dir.mkdir(parents=True, exist_ok=True)
 
-def generate_sweep_delta():
+# Sweep results written by smartfarm.sweeps
+default_sweeps = Path(__file__).parent.parent / 'data' / 'sensitivity_sweeps.json'
+
+# Benchmark results written by smartfarm.benchmarks
+default_benchmarks = Path(__file__).parent.parent / 'data' / 'benchmarks.json'
+
+def sweep_series(sweeps, parameter, metric, scale=1.0):
+    """
+    Mean and 95% CI of a metric along one swept parameter, with the other
+    parameters held at the sweep defaults
+    """
+    defaults = sweeps['defaults']
+    points = [p for p in sweeps['points']
+              if all(p['params'][k] == v for k, v in defaults.items() if k != parameter)]
+    points.sort(key=lambda p: p['params'][parameter])
+
+    x = np.array([p['params'][parameter] for p in points])
+    mean = np.array([p['metrics'][metric]['mean'] for p in points], dtype=float) * scale
+    ci = np.array([p['metrics'][metric]['ci95'] for p in points], dtype=float) * scale
+    return x, mean, ci
+
+def generate_sweep_delta(sweeps):
     """Generate delta (cooling weight) sensitivity figure."""
-    delta_values = np.array([0.00, 0.05, 0.10, 0.15, 0.20, 0.25])
-    
-    # Simulated data based on results described in manuscript
-    # Optimal at delta=0.10
-    lifetime = np.array([285, 298, 324, 310, 285, 272])
-    energy_per_round = np.array([0.0920, 0.0885, 0.0847, 0.0862, 0.0895, 0.0918])
-    stability = np.array([0.825, 0.834, 0.879, 0.865, 0.852, 0.838])
-    
-    # 95% CI (simulate from 30 runs)
-    lifetime_ci = np.array([5.2, 5.5, 6.2, 6.0, 5.8, 5.5])
-    energy_ci = np.array([0.0018, 0.0017, 0.0015, 0.0016, 0.0017, 0.0018])
-    stability_ci = np.array([0.013, 0.012, 0.012, 0.012, 0.013, 0.013])
+    delta_values, lifetime, lifetime_ci = sweep_series(sweeps, 'delta', 'lifetime')
+    _, energy_per_round, energy_ci = sweep_series(sweeps, 'delta', 'energy_per_round')
+    _, stability, stability_ci = sweep_series(sweeps, 'delta', 'cluster_stability')
+    delta_default = sweeps['defaults']['delta']
     
     fig, axes = plt.subplots(1, 3, figsize=(14, 4))
     
@@ -50,8 +70,8 @@ def generate_sweep_delta():
     axes[0].errorbar(delta_values, lifetime, yerr=lifetime_ci, 
                      marker='o', color='#2E86AB', linewidth=2, 
                      markersize=8, capsize=5, capthick=2)
-    axes[0].axvline(x=0.10, color='red', linestyle='--', linewidth=1.5, 
-                    label=r'Optimal $\delta=0.10$')
+    axes[0].axvline(x=delta_default, color='red', linestyle='--', linewidth=1.5, 
+                    label=rf'Default $\delta={delta_default:.2f}$')
     axes[0].set_xlabel(r'Cooling Weight $\delta$')
     axes[0].set_ylabel('Network Lifetime (rounds)')
     axes[0].set_title('Impact on Lifetime')
@@ -62,7 +82,7 @@ def generate_sweep_delta():
     axes[1].errorbar(delta_values, energy_per_round, yerr=energy_ci, 
                      marker='s', color='#A23B72', linewidth=2, 
                      markersize=8, capsize=5, capthick=2)
-    axes[1].axvline(x=0.10, color='red', linestyle='--', linewidth=1.5)
+    axes[1].axvline(x=delta_default, color='red', linestyle='--', linewidth=1.5)
     axes[1].set_xlabel(r'Cooling Weight $\delta$')
     axes[1].set_ylabel('Energy per Round (J)')
     axes[1].set_title('Impact on Energy Efficiency')
@@ -72,7 +92,7 @@ def generate_sweep_delta():
     axes[2].errorbar(delta_values, stability, yerr=stability_ci, 
                      marker='^', color='#F18F01', linewidth=2, 
                      markersize=8, capsize=5, capthick=2)
-    axes[2].axvline(x=0.10, color='red', linestyle='--', linewidth=1.5)
+    axes[2].axvline(x=delta_default, color='red', linestyle='--', linewidth=1.5)
     axes[2].set_xlabel(r'Cooling Weight $\delta$')
     axes[2].set_ylabel('Cluster Stability')
     axes[2].set_title('Impact on Cluster Stability')
@@ -84,17 +104,11 @@ def generate_sweep_delta():
     print(f"✓ Generated: {output_path}")
     plt.close()
 
-def generate_sweep_fmax():
+def generate_sweep_fmax(sweeps):
     """Generate fmax (maximum sleep fraction) sensitivity figure."""
-    fmax_values = np.array([0.10, 0.15, 0.20, 0.25, 0.30])
-    
-    # Simulated data - inflection point at fmax=0.20
-    coverage = np.array([90.8, 90.1, 89.6, 84.2, 78.1])
-    energy_per_round = np.array([0.0921, 0.0882, 0.0847, 0.0818, 0.0761])
-    
-    # 95% CI
-    coverage_ci = np.array([0.7, 0.75, 0.8, 0.9, 1.1])
-    energy_ci = np.array([0.0016, 0.0015, 0.0015, 0.0016, 0.0017])
+    fmax_values, coverage, coverage_ci = sweep_series(sweeps, 'fmax', 'union_coverage', scale=100)
+    _, energy_per_round, energy_ci = sweep_series(sweeps, 'fmax', 'energy_per_round')
+    fmax_default = sweeps['defaults']['fmax']
     
     fig, axes = plt.subplots(1, 2, figsize=(12, 4.5))
     
@@ -104,9 +118,9 @@ def generate_sweep_fmax():
                      markersize=9, capsize=5, capthick=2, label='Coverage (%)')
     axes[0].axhline(y=80.0, color='red', linestyle='--', linewidth=1.5, 
                     label='80% Threshold')
-    axes[0].axvline(x=0.20, color='purple', linestyle='-.', linewidth=1.5, 
-                    label=r'Optimal $f_{max}=0.20$')
-    axes[0].axvspan(0.20, 0.30, alpha=0.15, color='red', 
+    axes[0].axvline(x=fmax_default, color='purple', linestyle='-.', linewidth=1.5, 
+                    label=rf'Default $f_{{max}}={fmax_default:.2f}$')
+    axes[0].axvspan(fmax_default, fmax_values.max(), alpha=0.15, color='red', 
                     label='Excessive Sleep Zone')
     axes[0].set_xlabel(r'Maximum Sleep Fraction $f_{max}$')
     axes[0].set_ylabel('Coverage (%)')
@@ -118,9 +132,9 @@ def generate_sweep_fmax():
     axes[1].errorbar(fmax_values, energy_per_round, yerr=energy_ci, 
                      marker='s', color='#D62246', linewidth=2.5, 
                      markersize=9, capsize=5, capthick=2, label='Energy/Round (J)')
-    axes[1].axvline(x=0.20, color='purple', linestyle='-.', linewidth=1.5, 
-                    label=r'Optimal $f_{max}=0.20$')
-    axes[1].axvspan(0.20, 0.30, alpha=0.15, color='red')
+    axes[1].axvline(x=fmax_default, color='purple', linestyle='-.', linewidth=1.5, 
+                    label=rf'Default $f_{{max}}={fmax_default:.2f}$')
+    axes[1].axvspan(fmax_default, fmax_values.max(), alpha=0.15, color='red')
     axes[1].set_xlabel(r'Maximum Sleep Fraction $f_{max}$')
     axes[1].set_ylabel('Energy per Round (J)')
     axes[1].set_title('Energy Efficiency vs. Sleep Fraction')
@@ -133,19 +147,12 @@ def generate_sweep_fmax():
     print(f"✓ Generated: {output_path}")
     plt.close()
 
-def generate_sweep_minrest():
+def generate_sweep_minrest(sweeps):
     """Generate MinRest (cooling rest period) sensitivity figure."""
-    minrest_values = np.array([1, 2, 3, 4, 5])
-    
-    # Simulated data - optimal at MinRest=2
-    pdr = np.array([0.958, 0.973, 0.968, 0.961, 0.942])
-    delay = np.array([19.8, 18.4, 19.1, 20.5, 22.1])
-    lifetime = np.array([318, 324, 322, 316, 312])
-    
-    # 95% CI
-    pdr_ci = np.array([0.006, 0.004, 0.005, 0.006, 0.007])
-    delay_ci = np.array([1.5, 1.2, 1.3, 1.4, 1.7])
-    lifetime_ci = np.array([6.0, 6.2, 6.1, 5.9, 5.8])
+    minrest_values, pdr, pdr_ci = sweep_series(sweeps, 'min_rest', 'pdr')
+    _, path_length, path_length_ci = sweep_series(sweeps, 'min_rest', 'average_path_length')
+    _, lifetime, lifetime_ci = sweep_series(sweeps, 'min_rest', 'lifetime')
+    minrest_default = sweeps['defaults']['min_rest']
     
     fig, axes = plt.subplots(1, 3, figsize=(14, 4))
     
@@ -153,8 +160,8 @@ def generate_sweep_minrest():
     axes[0].errorbar(minrest_values, pdr, yerr=pdr_ci, 
                      marker='o', color='#4A5899', linewidth=2, 
                      markersize=8, capsize=5, capthick=2)
-    axes[0].axvline(x=2, color='green', linestyle='--', linewidth=1.5, 
-                    label='Optimal MinRest=2')
+    axes[0].axvline(x=minrest_default, color='green', linestyle='--', linewidth=1.5, 
+                    label=f'Default MinRest={minrest_default:g}')
     axes[0].set_xlabel('MinRest (rounds)')
     axes[0].set_ylabel('Packet Delivery Ratio')
     axes[0].set_title('Impact on PDR')
@@ -162,14 +169,14 @@ def generate_sweep_minrest():
     axes[0].grid(alpha=0.3, linestyle=':')
     axes[0].legend()
     
-    # Center panel: Delay
-    axes[1].errorbar(minrest_values, delay, yerr=delay_ci, 
+    # Center panel: Path length
+    axes[1].errorbar(minrest_values, path_length, yerr=path_length_ci, 
                      marker='s', color='#C73E1D', linewidth=2, 
                      markersize=8, capsize=5, capthick=2)
-    axes[1].axvline(x=2, color='green', linestyle='--', linewidth=1.5)
+    axes[1].axvline(x=minrest_default, color='green', linestyle='--', linewidth=1.5)
     axes[1].set_xlabel('MinRest (rounds)')
-    axes[1].set_ylabel('End-to-End Delay (ms)')
-    axes[1].set_title('Impact on Latency')
+    axes[1].set_ylabel('Average Path Length (hops)')
+    axes[1].set_title('Impact on Path Length')
     axes[1].set_xticks(minrest_values)
     axes[1].grid(alpha=0.3, linestyle=':')
     
@@ -177,7 +184,7 @@ def generate_sweep_minrest():
     axes[2].errorbar(minrest_values, lifetime, yerr=lifetime_ci, 
                      marker='^', color='#6A994E', linewidth=2, 
                      markersize=8, capsize=5, capthick=2)
-    axes[2].axvline(x=2, color='green', linestyle='--', linewidth=1.5)
+    axes[2].axvline(x=minrest_default, color='green', linestyle='--', linewidth=1.5)
     axes[2].set_xlabel('MinRest (rounds)')
     axes[2].set_ylabel('Network Lifetime (rounds)')
     axes[2].set_title('Impact on Lifetime')
@@ -190,16 +197,21 @@ def generate_sweep_minrest():
     print(f"✓ Generated: {output_path}")
     plt.close()
 
-def generate_computation_tradeoff():
-    """Generate computational complexity vs accuracy trade-off figure."""
-    methods = ['Monte Carlo\n(M=50)', 'Grid\nDiscretization', 'Analytic Circle\nIntersection']
-    computation_time = np.array([1.2, 3.8, 8.7])  # ms per node
-    error = np.array([3.5, 2.1, 0.0])  # % error
+def generate_computation_tradeoff(benchmarks):
+    """Generate computational complexity vs accuracy trade-off figure from measured estimator benchmarks."""
+    tradeoff = benchmarks['coverage_estimators']
+    estimators = ['monte_carlo', 'grid', 'analytic']
+    methods = [f"Monte Carlo\n(M={tradeoff['coverage_samples']})",
+               f"Grid\n({tradeoff['grid_points_per_radius']} pts/radius)",
+               'Analytic Pairwise\nOverlap']
+    names = ['Monte Carlo', 'Grid', 'Analytic']
+    computation_time = np.array([tradeoff['estimators'][e]['ms_per_node'] for e in estimators])  # ms per node
+    error = np.array([tradeoff['estimators'][e]['mean_abs_error_pct'] for e in estimators])  # % error
     colors = ['#2E86AB', '#F18F01', '#A23B72']
     
     # Cumulative time over 324 rounds
-    total_time_per_round = computation_time * 200 / 1000  # seconds (200 nodes)
-    cumulative_time = total_time_per_round * 324 / 60  # minutes over 324 rounds
+    total_time_per_round = computation_time * tradeoff['nodes'] / 1000  # seconds per round
+    cumulative_time = total_time_per_round * 324  # seconds over 324 rounds
     
     fig, axes = plt.subplots(1, 2, figsize=(12, 4.5))
     
@@ -212,13 +224,17 @@ def generate_computation_tradeoff():
                          textcoords='offset points', fontsize=9,
                          bbox=dict(boxstyle='round,pad=0.3', facecolor=colors[i], alpha=0.3))
     
-    # Highlight Monte Carlo as optimal
-    axes[0].scatter([1.2], [3.5], s=400, facecolors='none', 
+    # Highlight the Pareto-optimal methods (no other method is both faster and more accurate)
+    optimal = [i for i in range(len(methods))
+               if not any(computation_time[j] <= computation_time[i] and error[j] <= error[i] and
+                          (computation_time[j], error[j]) != (computation_time[i], error[i])
+                          for j in range(len(methods)))]
+    axes[0].scatter(computation_time[optimal], error[optimal], s=400, facecolors='none', 
                     edgecolors='green', linewidths=3, zorder=4, 
-                    label='Optimal Choice')
+                    label='Pareto-optimal')
     
     axes[0].set_xlabel('Computation Time (ms/node)')
-    axes[0].set_ylabel('Coverage Error (%)')
+    axes[0].set_ylabel('Mean Coverage Error (%)')
     axes[0].set_title('Accuracy-Speed Pareto Frontier')
     axes[0].grid(alpha=0.3, linestyle=':')
     axes[0].legend()
@@ -226,7 +242,7 @@ def generate_computation_tradeoff():
     # Right panel: Cumulative time over 324 rounds
     bars = axes[1].bar(methods, cumulative_time, color=colors, 
                        alpha=0.7, edgecolor='black', linewidth=1.5)
-    axes[1].set_ylabel('Total Computation Time (minutes)\nover 324 rounds')
+    axes[1].set_ylabel(f"Total Computation Time (s)\nover 324 rounds ({tradeoff['nodes']} nodes)")
     axes[1].set_title('Cumulative Computational Cost')
     axes[1].grid(axis='y', alpha=0.3, linestyle=':')
     
@@ -234,14 +250,15 @@ def generate_computation_tradeoff():
     for bar, val in zip(bars, cumulative_time):
         height = bar.get_height()
         axes[1].text(bar.get_x() + bar.get_width()/2., height,
-                     f'{val:.2f} min', ha='center', va='bottom', fontsize=10, 
+                     f'{val:.2f} s', ha='center', va='bottom', fontsize=10, 
                      fontweight='bold')
     
-    # Add savings annotation
-    savings = cumulative_time[2] - cumulative_time[0]
-    axes[1].annotate(f'Saves {savings:.1f} min\nvs. Analytic', 
-                     xy=(0.5, cumulative_time[0] + 0.5), 
-                     xytext=(1.5, cumulative_time[1] + 2),
+    # Add savings annotation (fastest vs slowest method)
+    fastest, slowest = int(np.argmin(cumulative_time)), int(np.argmax(cumulative_time))
+    savings = cumulative_time[slowest] - cumulative_time[fastest]
+    axes[1].annotate(f'Saves {savings:.2f} s\nvs. {names[slowest]}', 
+                     xy=(fastest, cumulative_time[fastest]), 
+                     xytext=(1, cumulative_time.max() * 0.8),
                      fontsize=10, color='green', fontweight='bold',
                      arrowprops=dict(arrowstyle='->', color='green', lw=2))
     
@@ -253,14 +270,32 @@ def generate_computation_tradeoff():
 
 def main():
     """Generate all sensitivity analysis figures."""
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--sweeps', default=str(default_sweeps),
+                    help='Sweep results JSON from python -m smartfarm.sweeps')
+    ap.add_argument('--benchmarks', default=str(default_benchmarks),
+                    help='Benchmark results JSON from python -m smartfarm.benchmarks')
+    args = ap.parse_args()
+
     print("=" * 60)
     print("Generating Parameter Sensitivity & Trade-off Figures")
     print("=" * 60)
     
-    generate_sweep_delta()
-    generate_sweep_fmax()
-    generate_sweep_minrest()
-    generate_computation_tradeoff()
+    sweeps_path = Path(args.sweeps)
+    if sweeps_path.exists():
+        sweeps = json.loads(sweeps_path.read_text())
+        generate_sweep_delta(sweeps)
+        generate_sweep_fmax(sweeps)
+        generate_sweep_minrest(sweeps)
+    else:
+        print(f"! {sweeps_path} not found; run python -m smartfarm.sweeps to produce sweep figures")
+
+    benchmarks_path = Path(args.benchmarks)
+    benchmarks = json.loads(benchmarks_path.read_text()) if benchmarks_path.exists() else {}
+    if 'coverage_estimators' in benchmarks:
+        generate_computation_tradeoff(benchmarks)
+    else:
+        print(f"! {benchmarks_path} has no estimator benchmark; run python -m smartfarm.benchmarks to produce the trade-off figure")
     
     print("=" * 60)
     print("✓ All figures generated successfully!")
@@ -0,0 +1,25 @@
+"""
+Cooling-aware clustered sleep-wake optimization for smart farming WSNs
+
+Simulation core used by sleep_wake_coverage_optimization.ipynb and the
+experiment runners (python -m smartfarm.experiments).
+"""
+from .nodes import NodeState, NodeArrays, SmartFarmingNode, BaseStation
+from .deployment import Deployment, generate_deployment
+from .regions import RegionPartition, FixedRegions, GridRegions, KMeansRegions, QuadtreeRegions
+from .network import SpatialIndex, CoverageRaster, EventQueue, EnhancedSmartFarmingNetwork
+from .clustering import EnhancedClusterHeadSelection
+from .routing import CommunicationGraph, ShortestPathTree, CoolingAwareRouter
+from .sleep_wake import SleepWakeCoverageOptimizer
+from .simulation import run_comprehensive_simulation
+
+__all__ = [
+    'NodeState', 'NodeArrays', 'SmartFarmingNode', 'BaseStation',
+    'Deployment', 'generate_deployment',
+    'RegionPartition', 'FixedRegions', 'GridRegions', 'KMeansRegions', 'QuadtreeRegions',
+    'SpatialIndex', 'CoverageRaster', 'EventQueue', 'EnhancedSmartFarmingNetwork',
+    'EnhancedClusterHeadSelection',
+    'CommunicationGraph', 'ShortestPathTree', 'CoolingAwareRouter',
+    'SleepWakeCoverageOptimizer',
+    'run_comprehensive_simulation',
+]
@@ -0,0 +1,251 @@
+"""
+Scaling benchmarks for the simulator
+
+Each network size runs in a fresh worker process (so peak RSS is per size) at
+the paper's node density: the field grows as 500 m x sqrt(n / 200) and the
+coverage raster is coarsened to at most RASTER_CELLS cells. Deployment stages
+come from network.deployment_timings and round phases from a
+SimulationProfiler. With --baseline, results are compared against a stored run
+and phases or memory peaks that grew by more than --tolerance are flagged.
+
+The coverage-estimator benchmark times U(i) per node for the analytic, Monte
+Carlo and grid estimators on one deployment and measures their error against
+a dense lattice reference; latex/scripts/generate_sensitivity_figures.py plots
+it as the computational trade-off figure.
+
+Usage:
+    python -m smartfarm.benchmarks --out latex/data/benchmarks.json
+    python -m smartfarm.benchmarks --sizes 200 1000 --baseline benchmarks_baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from pathlib import Path
+from time import perf_counter_ns
+
+import numpy as np
+
+from .cache import code_version
+from .experiments import DEFAULT_CONFIG, build_simulation
+from .nodes import NodeState
+from .profiling import SimulationProfiler
+from .regions import PARTITIONERS
+from .simulation import run_comprehensive_simulation
+from .sleep_wake import SleepWakeCoverageOptimizer
+
+BENCHMARK_SIZES = (200, 1000, 5000, 20000, 100000)
+
+# Reference density: the paper's 200 nodes on a 500 m x 500 m field
+REFERENCE_NODES = 200
+REFERENCE_SIDE = 500
+
+RASTER_CELLS = 4_000_000  # Coverage raster size cap for large fields
+
+# Regressions smaller than these absolute amounts are treated as noise
+MIN_REGRESSION_MS = 1.0
+MIN_REGRESSION_MB = 16.0
+
+
+def scaled_config(total_nodes, rounds=3, partition='fixed'):
+    """Experiment config for total_nodes at the reference node density"""
+    side = int(round(REFERENCE_SIDE * sqrt(total_nodes / REFERENCE_NODES)))
+    return {
+        **DEFAULT_CONFIG,
+        'width': side,
+        'height': side,
+        'total_nodes': total_nodes,
+        'num_rounds': rounds,
+        'partition': partition,
+        'coverage_resolution': max(1.0, side / sqrt(RASTER_CELLS)),
+    }
+
+def peak_rss_mb():
+    """Peak resident set size of this process (MiB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def benchmark_size(total_nodes, rounds=3, seed=1000, partition='fixed'):
+    """Stage / phase timings (ms), hot-path counters and RSS peaks for one network size"""
+    config = scaled_config(total_nodes, rounds, partition)
+    profiler = SimulationProfiler(capacity=rounds)
+    start_rss = peak_rss_mb()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = perf_counter_ns()
+        network, ch_selector, router, sleep_optimizer = build_simulation(seed, config)
+        build_ms = (perf_counter_ns() - start) / 1e6
+        deployment_rss = peak_rss_mb()
+
+        run_comprehensive_simulation(network, ch_selector, router, sleep_optimizer,
+                                     num_rounds=rounds, profiler=profiler)
+
+    summary = profiler.summary()
+    phases_ms = dict(network.deployment_timings)
+    phases_ms.update({phase: stats['mean_ms'] for phase, stats in summary['phases'].items()})
+
+    return {
+        'requested_nodes': total_nodes,
+        'nodes': len(network.nodes),
+        'regions': len(network.regions),
+        'field': config['width'],
+        'rounds': rounds,
+        'build_ms': build_ms,
+        'round_ms': summary['total_ms'] / max(1, summary['timed_rounds']),
+        'phases_ms': phases_ms,
+        'counters': summary['counters'],
+        'peak_rss_mb': {'start': start_rss, 'deployment': deployment_rss,
+                        'simulation': peak_rss_mb()},
+    }
+
+def run_sizes(sizes, rounds=3, seed=1000, partition='fixed'):
+    """Benchmark each size in its own worker process, one at a time (size order)"""
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for total_nodes in sizes:
+            yield executor.submit(benchmark_size, total_nodes, rounds, seed, partition).result()
+
+def benchmark_coverage_estimators(seed=1000, total_nodes=REFERENCE_NODES, coverage_samples=50,
+                                  repeats=5, reference_points_per_radius=100):
+    """
+    Time per node and error of each unique-coverage estimator
+    Errors are mean / max absolute differences in U(i) (percentage points)
+    against the grid estimator at reference_points_per_radius, averaged over
+    the repeats (Monte Carlo draws fresh samples on every repeat)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        network = build_simulation(seed, {'total_nodes': total_nodes})[0]
+        nodes = [node for node in network.nodes if node.alive and node.state != NodeState.SLEEP]
+
+        reference_optimizer = SleepWakeCoverageOptimizer(
+            network, coverage_estimator='grid', grid_points_per_radius=reference_points_per_radius)
+        reference, _ = reference_optimizer.estimate_unique_coverage(nodes, network.current_time)
+        reference = np.array([reference[node.id] for node in nodes])
+
+        estimators = {}
+        for estimator in SleepWakeCoverageOptimizer.COVERAGE_ESTIMATORS:
+            optimizer = SleepWakeCoverageOptimizer(
+                network, coverage_estimator=estimator, coverage_samples=coverage_samples,
+                rng=np.random.default_rng(seed))
+            timings, mean_errors, max_errors = [], [], []
+
+            for _ in range(repeats):
+                start = perf_counter_ns()
+                estimates, _ = optimizer.estimate_unique_coverage(nodes, network.current_time)
+                timings.append(perf_counter_ns() - start)
+
+                error = np.abs(np.array([estimates[node.id] for node in nodes]) - reference) * 100
+                mean_errors.append(error.mean())
+                max_errors.append(error.max())
+
+            estimators[estimator] = {
+                'ms_per_node': min(timings) / 1e6 / len(nodes),
+                'mean_abs_error_pct': float(np.mean(mean_errors)),
+                'max_abs_error_pct': float(np.mean(max_errors)),
+            }
+
+    return {
+        'nodes': len(nodes),
+        'coverage_samples': coverage_samples,
+        'grid_points_per_radius': optimizer.grid_points_per_radius,
+        'reference_points_per_radius': reference_points_per_radius,
+        'estimators': estimators,
+    }
+
+def compare_to_baseline(sizes, baseline, tolerance=0.25):
+    """
+    Phases and RSS peaks that grew by more than tolerance (relative) over the
+    baseline run of the same size; tiny absolute changes are ignored as noise
+    """
+    baseline_sizes = {entry['requested_nodes']: entry for entry in baseline.get('sizes', [])}
+    regressions = []
+
+    for entry in sizes:
+        reference = baseline_sizes.get(entry['requested_nodes'])
+        if reference is None:
+            continue
+
+        checks = [(phase, value, reference['phases_ms'].get(phase), MIN_REGRESSION_MS)
+                  for phase, value in entry['phases_ms'].items()]
+        checks += [(f'peak_rss_{stage}', value, reference['peak_rss_mb'].get(stage), MIN_REGRESSION_MB)
+                   for stage, value in entry['peak_rss_mb'].items()]
+
+        for metric, value, base, noise_floor in checks:
+            if base is None:
+                continue
+            if value > base * (1 + tolerance) and value - base > noise_floor:
+                regressions.append({
+                    'nodes': entry['requested_nodes'],
+                    'metric': metric,
+                    'baseline': base,
+                    'current': value,
+                    'ratio': value / base if base else float('inf'),
+                })
+
+    return regressions
+
+def main():
+    ap = argparse.ArgumentParser(description='Benchmark simulator phases across network sizes')
+    ap.add_argument('--sizes', type=int, nargs='+', default=list(BENCHMARK_SIZES))
+    ap.add_argument('--rounds', type=int, default=3, help='Simulation rounds per size')
+    ap.add_argument('--seed', type=int, default=1000)
+    ap.add_argument('--partition', default=DEFAULT_CONFIG['partition'], choices=PARTITIONERS)
+    ap.add_argument('--estimator-repeats', type=int, default=5)
+    ap.add_argument('--skip-estimators', action='store_true',
+                    help='Skip the coverage-estimator trade-off benchmark')
+    ap.add_argument('--baseline', default=None, help='Stored benchmark JSON to compare against')
+    ap.add_argument('--tolerance', type=float, default=0.25,
+                    help='Relative slowdown / memory growth flagged as a regression')
+    ap.add_argument('--out', default='benchmarks.json')
+    args = ap.parse_args()
+
+    sizes = []
+    for entry in run_sizes(args.sizes, args.rounds, args.seed, args.partition):
+        sizes.append(entry)
+        phases = '  '.join(f"{phase}={value:.1f}" for phase, value in entry['phases_ms'].items())
+        print(f"{entry['nodes']:>7} nodes ({entry['regions']} regions): "
+              f"build {entry['build_ms']:.0f} ms, round {entry['round_ms']:.1f} ms, "
+              f"peak RSS {entry['peak_rss_mb']['simulation']:.0f} MiB")
+        print(f"        {phases}")
+
+    output = {
+        'config': {'sizes': args.sizes, 'rounds': args.rounds, 'seed': args.seed,
+                   'partition': args.partition},
+        'machine': {'platform': platform.platform(), 'python': platform.python_version(),
+                    'cpu_count': os.cpu_count()},
+        'code_version': code_version(),
+        'sizes': sizes,
+    }
+
+    if not args.skip_estimators:
+        tradeoff = benchmark_coverage_estimators(args.seed, repeats=args.estimator_repeats)
+        output['coverage_estimators'] = tradeoff
+        print(f"Coverage estimators ({tradeoff['nodes']} nodes):")
+        for estimator, stats in tradeoff['estimators'].items():
+            print(f"   {estimator:<12} {stats['ms_per_node']:.4f} ms/node  "
+                  f"error {stats['mean_abs_error_pct']:.2f}% (max {stats['max_abs_error_pct']:.2f}%)")
+
+    regressions = []
+    if args.baseline is not None:
+        regressions = compare_to_baseline(sizes, json.loads(Path(args.baseline).read_text()),
+                                          args.tolerance)
+        output['baseline'] = args.baseline
+        output['regressions'] = regressions
+        for regression in regressions:
+            print(f"! Regression at {regression['nodes']} nodes: {regression['metric']} "
+                  f"{regression['baseline']:.1f} -> {regression['current']:.1f} "
+                  f"({regression['ratio']:.2f}x)")
+        if not regressions:
+            print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+    Path(args.out).write_text(json.dumps(output, indent=2))
+    print(f"Wrote {args.out}")
+
+    if regressions:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
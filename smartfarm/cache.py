@@ -0,0 +1,192 @@
+"""
+Content-addressed on-disk cache for simulation runs
+
+Entries are keyed by a hash of the full run config, the seed and the source of
+the simulation modules, so any change to parameters or code misses the cache.
+Per-round metrics are stored as compressed NumPy columns (one .npz per run);
+the least recently used entries are evicted once the cache exceeds max_bytes.
+
+Usage:
+    python -m smartfarm.cache report
+    python -m smartfarm.cache evict --max-size 512
+    python -m smartfarm.cache clear
+"""
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from .history import MetricStore
+
+# Modules whose source determines simulation results
+SIMULATION_MODULES = ('nodes', 'deployment', 'regions', 'network', 'clustering', 'routing',
+                      'sleep_wake', 'running_stats', 'history', 'simulation', 'experiments')
+
+DEFAULT_CACHE_DIR = os.environ.get('SMARTFARM_CACHE_DIR', '.smartfarm_cache')
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+
+_code_version = None
+
+def code_version():
+    """Hash of the simulation module sources (computed once per process)"""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        package_dir = Path(__file__).parent
+        for module in SIMULATION_MODULES:
+            digest.update((package_dir / f'{module}.py').read_bytes())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+def run_key(config, seed):
+    """Content address of one run: config + seed + code version"""
+    payload = json.dumps({'config': config, 'seed': seed, 'code': code_version()},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of run results (see run_single) on disk
+    Hit/miss counters are kept in memory and merged into stats.json by
+    flush_stats, so only the coordinating process writes them
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _path(self, key):
+        return self.cache_dir / f'{key}.npz'
+
+    def get(self, config, seed):
+        """Cached result for (config, seed), or None"""
+        path = self._path(run_key(config, seed))
+        try:
+            with np.load(path) as data:
+                columns = {name[6:]: data[name] for name in data.files
+                           if name.startswith('round_')}
+                summary = json.loads(str(data['summary']))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # Corrupt or truncated entry: drop it so the run is recomputed and re-stored
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        os.utime(path)  # Mark as recently used for LRU eviction
+        self.hits += 1
+
+        return {'seed': seed, 'round_data': MetricStore.from_columns(columns), 'summary': summary}
+
+    def put(self, config, seed, result):
+        """Store a run result; writes are atomic so concurrent readers never see partial files"""
+        round_data = result['round_data']
+        columns = {f'round_{name}': round_data[name] for name in round_data.keys()}
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as handle:
+            np.savez_compressed(handle, summary=np.array(json.dumps(result['summary'])), **columns)
+        os.replace(tmp_path, self._path(run_key(config, seed)))
+
+        self.stores += 1
+        self.evict()
+
+    def entries(self):
+        """Cache files, least recently used first"""
+        files = [(path.stat().st_mtime, path) for path in self.cache_dir.glob('*.npz')]
+        return [path for _, path in sorted(files)]
+
+    def size_bytes(self):
+        return sum(path.stat().st_size for path in self.cache_dir.glob('*.npz'))
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        sizes = {path: path.stat().st_size for path in entries}
+        total = sum(sizes.values())
+        evicted = 0
+
+        for path in entries:
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= sizes[path]
+            evicted += 1
+
+        return evicted
+
+    def clear(self):
+        for path in self.cache_dir.glob('*.npz'):
+            path.unlink()
+        (self.cache_dir / 'stats.json').unlink(missing_ok=True)
+
+    def load_stats(self):
+        stats_path = self.cache_dir / 'stats.json'
+        if stats_path.exists():
+            return json.loads(stats_path.read_text())
+        return {'hits': 0, 'misses': 0, 'stores': 0}
+
+    def flush_stats(self):
+        """Merge this session's counters into the persistent stats file"""
+        stats = self.load_stats()
+        stats['hits'] += self.hits
+        stats['misses'] += self.misses
+        stats['stores'] += self.stores
+        (self.cache_dir / 'stats.json').write_text(json.dumps(stats, indent=2))
+        self.hits = self.misses = self.stores = 0
+        return stats
+
+    def get_statistics(self):
+        """Persistent plus in-session counters, size and hit rate"""
+        stats = self.load_stats()
+        hits = stats['hits'] + self.hits
+        misses = stats['misses'] + self.misses
+        return {
+            'entries': len(self.entries()),
+            'size_bytes': self.size_bytes(),
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'stores': stats['stores'] + self.stores,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'code_version': code_version(),
+        }
+
+def main():
+    ap = argparse.ArgumentParser(description='Inspect or manage the simulation result cache')
+    ap.add_argument('command', choices=['report', 'evict', 'clear'])
+    ap.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    ap.add_argument('--max-size', type=float, default=DEFAULT_MAX_BYTES / (1 << 20),
+                    help='Size bound in MiB (evict)')
+    args = ap.parse_args()
+
+    cache = ResultCache(args.cache_dir, max_bytes=int(args.max_size * (1 << 20)))
+
+    if args.command == 'clear':
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+    elif args.command == 'evict':
+        evicted = cache.evict()
+        print(f"Evicted {evicted} entries; {cache.size_bytes() / (1 << 20):.1f} MiB remain")
+    else:
+        stats = cache.get_statistics()
+        print(f"Cache directory: {cache.cache_dir}")
+        print(f"   Entries: {stats['entries']} ({stats['size_bytes'] / (1 << 20):.2f} MiB)")
+        print(f"   Hits: {stats['hits']}  Misses: {stats['misses']}  Stores: {stats['stores']}")
+        print(f"   Hit rate: {stats['hit_rate']:.1%}")
+        print(f"   Code version: {stats['code_version']}")
+
+if __name__ == '__main__':
+    main()
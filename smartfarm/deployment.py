@@ -0,0 +1,222 @@
+"""
+Vectorized node deployment generation
+
+A Deployment holds node positions, energy tiers and region ids as arrays, so
+a million-node field is generated in about a second and can be saved with
+save() and reused across runs (EnhancedSmartFarmingNetwork.deploy_nodes).
+
+Layouts (see LAYOUTS):
+    jittered_grid  sqrt(n) x sqrt(n) grid with Gaussian jitter (the paper's deployment)
+    uniform        uniform random positions
+    poisson_disc   random positions with a minimum spacing between nodes
+    crop_rows      nodes along evenly spaced crop-row strips
+"""
+import json
+from math import sqrt
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+LAYOUTS = ('jittered_grid', 'uniform', 'poisson_disc', 'crop_rows')
+
+# Energy tiers (NoN base energy; AdN get 50% more)
+BASE_ENERGY = 2.0
+ADVANCED_ENERGY = BASE_ENERGY * (1 + 0.5)
+
+
+class Deployment:
+    """
+    Arrays describing one deployment (index = node id)
+    initial_energy is the generated tier; energy additionally includes the
+    upgrades applied by assign_regions
+    """
+
+    def __init__(self, x, y, advanced, width, height, layout, initial_energy=None,
+                 energy=None, region_id=None):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.advanced = np.asarray(advanced, dtype=np.bool_)
+        self.width = width
+        self.height = height
+        self.layout = layout
+
+        if initial_energy is None:
+            initial_energy = np.where(self.advanced, ADVANCED_ENERGY, BASE_ENERGY)
+        self.initial_energy = np.asarray(initial_energy, dtype=np.float64)
+        self.energy = self.initial_energy.copy() if energy is None else np.asarray(energy, dtype=np.float64)
+        self.region_id = None if region_id is None else np.asarray(region_id, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.x)
+
+    def assign_regions(self, partition):
+        """
+        Label every node with its region and ensure each region has an Advanced Node
+        A region without one gets its node closest to the region center upgraded
+        to AdN (ties go to the lowest node id). Returns [(node id, region id)]
+        of the upgraded nodes in region order
+        """
+        self.region_id = partition.assign(self.x, self.y).astype(np.int64)
+
+        region_count = len(partition)
+        has_advanced = np.bincount(self.region_id[self.advanced], minlength=region_count) > 0
+        lacking = np.flatnonzero(~has_advanced[self.region_id])
+        if not len(lacking):
+            return []
+
+        region = self.region_id[lacking]
+        center_x, center_y = partition.centers[region, 0], partition.centers[region, 1]
+        distance = np.sqrt((self.x[lacking] - center_x)**2 + (self.y[lacking] - center_y)**2)
+
+        order = np.lexsort((lacking, distance, region))
+        _, first = np.unique(region[order], return_index=True)
+        upgraded = lacking[order[first]]
+
+        self.advanced[upgraded] = True
+        self.energy[upgraded] = ADVANCED_ENERGY
+        return [(int(node_id), int(self.region_id[node_id])) for node_id in upgraded]
+
+    def save(self, path):
+        """Write the deployment to a .npz file"""
+        arrays = {'x': self.x, 'y': self.y, 'advanced': self.advanced,
+                  'initial_energy': self.initial_energy, 'energy': self.energy}
+        if self.region_id is not None:
+            arrays['region_id'] = self.region_id
+        meta = {'width': self.width, 'height': self.height, 'layout': self.layout}
+        np.savez_compressed(path, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Read a deployment written by save()"""
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            return cls(data['x'], data['y'], data['advanced'], meta['width'], meta['height'],
+                       meta['layout'], initial_energy=data['initial_energy'],
+                       energy=data['energy'],
+                       region_id=data['region_id'] if 'region_id' in data.files else None)
+
+def jittered_grid_positions(total_nodes, width, height, rng, margin=25):
+    """
+    Grid of int(sqrt(n))^2 cells, one node per cell with N(0, step/4) jitter;
+    the n - int(sqrt(n))^2 nodes left over are placed uniformly. The grid draws
+    the same random stream as the original per-node loop (x then y per node,
+    column by column), so seeded grid positions are unchanged
+    """
+    grid_size = int(sqrt(total_nodes))
+    x_step = width / grid_size
+    y_step = height / grid_size
+
+    i, j = np.meshgrid(np.arange(grid_size), np.arange(grid_size), indexing='ij')
+    noise = rng.normal(0, [x_step / 4, y_step / 4], size=(grid_size * grid_size, 2))
+
+    x = np.clip((i.ravel() + 0.5) * x_step + noise[:, 0], margin, width - margin)
+    y = np.clip((j.ravel() + 0.5) * y_step + noise[:, 1], margin, height - margin)
+
+    extra = total_nodes - grid_size * grid_size
+    if extra:
+        extra_x, extra_y = uniform_positions(extra, width, height, rng, margin)
+        x, y = np.concatenate([x, extra_x]), np.concatenate([y, extra_y])
+    return x, y
+
+def uniform_positions(total_nodes, width, height, rng, margin=25):
+    """Independent uniform positions inside the margin"""
+    x = rng.uniform(margin, width - margin, size=total_nodes)
+    y = rng.uniform(margin, height - margin, size=total_nodes)
+    return x, y
+
+def poisson_disc_positions(total_nodes, width, height, rng, margin=25, min_distance=None):
+    """
+    Random positions at least min_distance apart (blue-noise coverage)
+    One candidate is drawn per cell of a min_distance/sqrt(2) grid and a
+    maximal conflict-free subset is kept (Luby's randomized independent set:
+    each round keeps the candidates whose random priority beats all their
+    conflicting neighbours), then total_nodes of the survivors are sampled.
+    The default spacing leaves ~10% spare survivors; it is shrunk if too few remain
+    """
+    span_x, span_y = width - 2 * margin, height - 2 * margin
+    shrink = min_distance is None
+    if shrink:
+        # A maximal set holds ~0.5 points per min_distance² of area
+        min_distance = sqrt(0.45 * span_x * span_y / total_nodes)
+
+    while True:
+        cell = min_distance / sqrt(2)
+        cols, rows = max(1, int(span_x / cell)), max(1, int(span_y / cell))
+        col, row = np.meshgrid(np.arange(cols), np.arange(rows))
+        x = margin + (col.ravel() + rng.random(cols * rows)) * (span_x / cols)
+        y = margin + (row.ravel() + rng.random(cols * rows)) * (span_y / rows)
+
+        conflicts = cKDTree(np.column_stack([x, y])).query_pairs(min_distance, output_type='ndarray')
+        first, second = conflicts[:, 0], conflicts[:, 1]
+        priority = rng.random(len(x))
+        active = np.ones(len(x), dtype=bool)
+        kept = np.zeros(len(x), dtype=bool)
+
+        while active.any():
+            winners = active.copy()
+            winners[np.where(priority[first] < priority[second], second, first)] = False
+            kept |= winners
+            active &= ~winners
+            active[second[winners[first]]] = False
+            active[first[winners[second]]] = False
+            live = active[first] & active[second]
+            first, second = first[live], second[live]
+
+        survivors = np.flatnonzero(kept)
+        if len(survivors) >= total_nodes or not shrink:
+            break
+        min_distance *= 0.9
+
+    chosen = rng.permutation(survivors)[:total_nodes]
+    return x[chosen], y[chosen]
+
+def crop_row_positions(total_nodes, width, height, rng, margin=25, row_spacing=None):
+    """
+    Nodes along horizontal crop-row strips, evenly spaced within each row
+    with small along-row and across-row jitter
+    """
+    span_x, span_y = width - 2 * margin, height - 2 * margin
+    if row_spacing is None:
+        row_spacing = sqrt(span_x * span_y / total_nodes) * 2
+    row_count = max(1, int(round(span_y / row_spacing)) + 1)
+    per_row = int(np.ceil(total_nodes / row_count))
+
+    row_y = np.linspace(margin, height - margin, row_count)
+    along = (np.arange(per_row) + 0.5) * (span_x / per_row)
+
+    x = (margin + np.tile(along, row_count))[:total_nodes]
+    y = np.repeat(row_y, per_row)[:total_nodes]
+    x = np.clip(x + rng.normal(0, span_x / per_row / 10, size=len(x)), margin, width - margin)
+    y = np.clip(y + rng.normal(0, row_spacing / 20, size=len(y)), margin, height - margin)
+    return x, y
+
+_POSITION_GENERATORS = {
+    'jittered_grid': jittered_grid_positions,
+    'uniform': uniform_positions,
+    'poisson_disc': poisson_disc_positions,
+    'crop_rows': crop_row_positions,
+}
+
+def generate_deployment(layout, total_nodes, width, height, rng=None, advanced_count=None,
+                        **options):
+    """
+    Generate a deployment with one of LAYOUTS
+    advanced_count nodes (default 20% of total_nodes) become AdN: the first
+    ones for the jittered grid, as in the paper's deployment, and a random
+    subset otherwise. options go to the layout (margin, min_distance, row_spacing)
+    """
+    if layout not in _POSITION_GENERATORS:
+        raise ValueError(f"layout must be one of {LAYOUTS}")
+    rng = np.random.default_rng() if rng is None else rng
+    if advanced_count is None:
+        advanced_count = total_nodes - int(0.8 * total_nodes)
+
+    x, y = _POSITION_GENERATORS[layout](total_nodes, width, height, rng, **options)
+
+    advanced = np.zeros(len(x), dtype=bool)
+    if layout == 'jittered_grid':
+        advanced[:advanced_count] = True
+    else:
+        advanced[rng.choice(len(x), size=min(advanced_count, len(x)), replace=False)] = True
+
+    return Deployment(x, y, advanced, width, height, layout)
@@ -0,0 +1,260 @@
+"""
+Parallel Monte Carlo experiment runner
+
+Each run builds a fresh network, CH selector, router and sleep-wake optimizer
+from its own seed, so results depend only on (config, seed) and are identical
+regardless of how many worker processes are used.
+
+Usage:
+    python -m smartfarm.experiments --runs 50 --seed-start 1000 --rounds 50 --out mc_results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .cache import DEFAULT_CACHE_DIR, ResultCache
+from .clustering import EnhancedClusterHeadSelection
+from .deployment import LAYOUTS
+from .network import EnhancedSmartFarmingNetwork
+from .regions import PARTITIONERS
+from .routing import CoolingAwareRouter
+from .simulation import run_comprehensive_simulation
+from .sleep_wake import SleepWakeCoverageOptimizer
+
+CONF_Z = 1.96  # 95% normal approximation
+
+# Default experiment configuration (matches the notebook demo network)
+DEFAULT_CONFIG = {
+    'width': 500,
+    'height': 500,
+    'total_nodes': 200,
+    'num_rounds': 50,
+    'coverage_estimator': 'analytic',
+    'coverage_resolution': 1.0,    # Coverage raster cell size (meters)
+    'layout': 'jittered_grid',     # Deployment layout (see deployment.LAYOUTS)
+    'partition': 'fixed',          # Region partitioner (see regions.PARTITIONERS)
+    'partition_options': None,     # Partitioner options, e.g. {'max_nodes': 500} for quadtree
+    'cost_weights': None,          # CH cost weight overrides, e.g. {'cooling': 0.15}
+    'max_sleep_fraction': 0.2,     # f_max sleep cap in optimize_sleep_schedule
+    'min_rest_period': 2.0,        # MinRest cooling period of every node
+}
+
+def build_simulation(seed, config=None):
+    """
+    Build network, CH selector, router and optimizer for one run
+    The seed is split into independent streams for deployment/sensing and
+    coverage estimation, so the two never share random draws
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    network_seed, optimizer_seed = np.random.SeedSequence(seed).spawn(2)
+
+    network = EnhancedSmartFarmingNetwork(
+        width=config['width'], height=config['height'], total_nodes=config['total_nodes'],
+        coverage_resolution=config['coverage_resolution'],
+        rng=np.random.default_rng(network_seed), partition=config['partition'],
+        partition_options=config['partition_options'], layout=config['layout'])
+    network.deploy_nodes()
+    network.node_arrays.column('min_rest_period')[:] = config['min_rest_period']
+    network.calculate_network_metrics()
+    network.update_history()
+
+    ch_selector = EnhancedClusterHeadSelection(network)
+    ch_selector.cost_weights.update(config['cost_weights'] or {})
+    router = CoolingAwareRouter(network)
+    sleep_optimizer = SleepWakeCoverageOptimizer(
+        network, coverage_estimator=config['coverage_estimator'],
+        rng=np.random.default_rng(optimizer_seed))
+    sleep_optimizer.max_sleep_fraction = config['max_sleep_fraction']
+
+    return network, ch_selector, router, sleep_optimizer
+
+def cluster_stability(selection_history):
+    """Fraction of CH elections that keep the region's previous cluster head"""
+    previous_ch = {}
+    kept = elections = 0
+
+    for record in selection_history:
+        region_id = record['region_id']
+        if region_id in previous_ch:
+            elections += 1
+            kept += previous_ch[region_id] == record['node_id']
+        previous_ch[region_id] = record['node_id']
+
+    return kept / elections if elections else 1.0
+
+def summarize_run(network, ch_selector, simulation_results):
+    """Scalar end-of-run metrics for one simulation"""
+    round_data = simulation_results['round_data']
+    routing_stats = simulation_results['algorithm_performance']['routing_stats']
+    initial_energy = float(network.node_arrays.column('initial_energy').sum())
+    final = round_data[-1]
+
+    # Lifetime: first round with a dead node (censored at the run length)
+    deaths = round_data['round'][round_data['alive_nodes'] < len(network.nodes)]
+    transmissions = final['successful_transmissions'] + final['failed_transmissions']
+
+    return {
+        'lifetime': int(deaths[0]) if deaths.size else len(round_data),
+        'alive_nodes': final['alive_nodes'],
+        'energy_per_round': (initial_energy - final['total_energy']) / len(round_data),
+        'union_coverage': float(round_data['union_coverage'].mean()),
+        'cooling_violations': float(round_data['cooling_violations'].mean()),
+        'successful_transmissions': final['successful_transmissions'],
+        'failed_transmissions': final['failed_transmissions'],
+        'pdr': final['successful_transmissions'] / transmissions if transmissions else 0.0,
+        'average_path_length': float(routing_stats['average_path_length'].mean()),
+        'cluster_stability': cluster_stability(ch_selector.selection_history),
+        'optimization_effectiveness': float(round_data['optimization_effectiveness'].mean()),
+    }
+
+def run_single(seed, config=None, quiet=True):
+    """Run one seeded simulation and return its per-round data and summary"""
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+
+    with output:
+        network, ch_selector, router, sleep_optimizer = build_simulation(seed, config)
+        simulation_results = run_comprehensive_simulation(
+            network, ch_selector, router, sleep_optimizer, num_rounds=config['num_rounds'])
+
+    return {
+        'seed': seed,
+        'round_data': simulation_results['round_data'],
+        'summary': summarize_run(network, ch_selector, simulation_results),
+    }
+
+def run_monte_carlo(seeds, config=None, workers=None, cache=None):
+    """
+    Run one simulation per seed across a process pool
+    Yields per-run results as they complete (completion order); workers=1
+    runs in-process. Aggregate with aggregate_runs, which orders by seed.
+    With a ResultCache, cached runs are yielded first and new runs are stored
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    workers = workers or os.cpu_count() or 1
+
+    pending = []
+    for seed in seeds:
+        cached = cache.get(config, seed) if cache is not None else None
+        if cached is not None:
+            yield cached
+        else:
+            pending.append(seed)
+
+    if not pending:
+        return
+
+    if workers == 1:
+        completed = (run_single(seed, config) for seed in pending)
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+        futures = [executor.submit(run_single, seed, config) for seed in pending]
+        completed = (future.result() for future in as_completed(futures))
+
+    try:
+        for result in completed:
+            if cache is not None:
+                cache.put(config, result['seed'], result)
+            yield result
+    finally:
+        if workers != 1:
+            executor.shutdown(cancel_futures=True)
+
+def mean_ci(values):
+    """Mean and 95% CI half-width (population stdev, as in generate_tables.py)"""
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return None, None
+    ci = CONF_Z * values.std() / math.sqrt(values.size) if values.size > 1 else 0.0
+    return float(values.mean()), float(ci)
+
+def aggregate_runs(results):
+    """
+    Aggregate per-run results into mean/CI summaries and per-round trajectories
+    Runs are ordered by seed first, so the output is independent of completion order
+    """
+    results = sorted(results, key=lambda result: result['seed'])
+    if not results:
+        return {}
+
+    summary = {}
+    for key in results[0]['summary']:
+        values = [r['summary'][key] for r in results if r['summary'][key] is not None]
+        mean, ci = mean_ci(values)
+        summary[key] = {'mean': mean, 'ci95': ci, 'n': len(values)}
+
+    per_round = {}
+    for key in results[0]['round_data'].keys():
+        if key == 'round':
+            continue
+        matrix = np.array([result['round_data'][key] for result in results], dtype=float)
+        per_round[key] = {
+            'mean': matrix.mean(axis=0).tolist(),
+            'ci95': (CONF_Z * matrix.std(axis=0) / math.sqrt(len(results))).tolist(),
+        }
+
+    return {
+        'seeds': [result['seed'] for result in results],
+        'summary': summary,
+        'per_round': per_round,
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description='Run seeded Monte Carlo simulations in parallel')
+    ap.add_argument('--runs', type=int, default=50, help='Number of runs (seeds seed-start .. seed-start+runs-1)')
+    ap.add_argument('--seed-start', type=int, default=1000)
+    ap.add_argument('--rounds', type=int, default=DEFAULT_CONFIG['num_rounds'])
+    ap.add_argument('--nodes', type=int, default=DEFAULT_CONFIG['total_nodes'])
+    ap.add_argument('--width', type=int, default=DEFAULT_CONFIG['width'])
+    ap.add_argument('--height', type=int, default=DEFAULT_CONFIG['height'])
+    ap.add_argument('--coverage-estimator', default=DEFAULT_CONFIG['coverage_estimator'],
+                    choices=SleepWakeCoverageOptimizer.COVERAGE_ESTIMATORS)
+    ap.add_argument('--layout', default=DEFAULT_CONFIG['layout'], choices=LAYOUTS,
+                    help='Deployment layout')
+    ap.add_argument('--partition', default=DEFAULT_CONFIG['partition'], choices=PARTITIONERS,
+                    help='Region partitioner')
+    ap.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    ap.add_argument('--out', default='mc_results.json')
+    ap.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Result cache directory')
+    ap.add_argument('--no-cache', action='store_true', help='Always re-run simulations')
+    args = ap.parse_args()
+
+    config = {
+        'width': args.width,
+        'height': args.height,
+        'total_nodes': args.nodes,
+        'num_rounds': args.rounds,
+        'coverage_estimator': args.coverage_estimator,
+        'layout': args.layout,
+        'partition': args.partition,
+    }
+    seeds = range(args.seed_start, args.seed_start + args.runs)
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+
+    results = []
+    for result in run_monte_carlo(seeds, config, workers=args.workers, cache=cache):
+        results.append(result)
+        print(f"[{len(results)}/{args.runs}] seed {result['seed']}: "
+              f"alive={result['summary']['alive_nodes']} "
+              f"coverage={result['summary']['union_coverage']:.3f}")
+
+    # Completion order depends on the worker count; write runs in seed order
+    results.sort(key=lambda result: result['seed'])
+    runs = [{**result, 'round_data': result['round_data'].to_records()} for result in results]
+    output = {'config': config, 'runs': runs, 'aggregate': aggregate_runs(results)}
+    Path(args.out).write_text(json.dumps(output, indent=2))
+    print(f"Wrote {args.out}")
+
+    if cache is not None:
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+        cache.flush_stats()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""Preallocated columnar per-round metric store"""
+from pathlib import Path
+
+import numpy as np
+
+
+class MetricStore:
+    """
+    Per-round metrics as growable NumPy columns (one array per field)
+
+    fields maps name -> dtype, or name -> (dtype, shape) for fixed-size vector
+    fields such as per-region energy. Capacity doubles on demand, so appends
+    are amortized O(1) with no per-round dict or list allocation. With a
+    directory, columns are memory-mapped files that grow in place, so very long
+    runs stay within bounded resident memory and the history survives on disk.
+
+    Indexing by field name returns the column view (history['alive_nodes']);
+    indexing by position returns one round as a dict (round_data[-1]), so the
+    store reads like both the old dict-of-lists and list-of-dicts layouts.
+    """
+
+    def __init__(self, fields, capacity=256, directory=None):
+        self.fields = {}
+        for name, spec in fields.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            self.fields[name] = (np.dtype(dtype), tuple(shape))
+
+        self.size = 0
+        self.capacity = max(1, capacity)
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.columns = {name: self._allocate(name, self.capacity) for name in self.fields}
+
+    @classmethod
+    def from_columns(cls, columns):
+        """In-memory store wrapping existing equal-length column arrays"""
+        columns = {name: np.asarray(column) for name, column in columns.items()}
+        size = len(next(iter(columns.values()))) if columns else 0
+        store = cls({name: (column.dtype, column.shape[1:]) for name, column in columns.items()},
+                    capacity=size)
+        store.columns = columns
+        store.size = size
+        return store
+
+    def _allocate(self, name, capacity):
+        """Column storage for `capacity` rows (in memory or memory-mapped)"""
+        dtype, shape = self.fields[name]
+        if self.directory is None:
+            return np.zeros((capacity,) + shape, dtype=dtype)
+
+        path = self.directory / f'{name}.bin'
+        nbytes = capacity * dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        with open(path, 'ab') as handle:
+            handle.truncate(nbytes)  # Extends the file; existing rows stay in place
+        return np.memmap(path, dtype=dtype, mode='r+', shape=(capacity,) + shape)
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            if self.directory is None:
+                grown = self._allocate(name, self.capacity)
+                grown[:self.size] = column[:self.size]
+            else:
+                column.flush()
+                grown = self._allocate(name, self.capacity)
+            self.columns[name] = grown
+
+    def append(self, record):
+        """Append one round; missing fields are NaN (floats) or 0"""
+        if self.size == self.capacity:
+            self._grow()
+
+        for name, column in self.columns.items():
+            if name in record:
+                column[self.size] = record[name]
+            else:
+                column[self.size] = np.nan if column.dtype.kind == 'f' else 0
+        self.size += 1
+
+    def column(self, name):
+        """View of one field over the recorded rounds (no copy)"""
+        return self.columns[name][:self.size]
+
+    def row(self, index):
+        """One round as a dict of Python scalars (vector fields stay arrays)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('round index out of range')
+
+        return {name: (column[index].item() if column.ndim == 1 else column[index].copy())
+                for name, column in self.columns.items()}
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, slice):
+            return [self.row(i) for i in range(*key.indices(self.size))]
+        return self.row(key)
+
+    def __iter__(self):
+        for index in range(self.size):
+            yield self.row(index)
+
+    def keys(self):
+        return self.fields.keys()
+
+    def flush(self):
+        """Write memory-mapped columns to disk"""
+        for column in self.columns.values():
+            if isinstance(column, np.memmap):
+                column.flush()
+
+    def to_records(self):
+        """Rounds as a list of dicts (JSON-friendly)"""
+        return [{name: (value.tolist() if isinstance(value, np.ndarray) else value)
+                 for name, value in row.items()} for row in self]
+
+    def _flat_columns(self):
+        """1-D column views; vector fields are split into name_0, name_1, ..."""
+        flat = {}
+        for name in self.fields:
+            column = self.column(name)
+            if column.ndim == 1:
+                flat[name] = column
+            else:
+                for i in range(column.shape[1]):
+                    flat[f'{name}_{i}'] = column[:, i]
+        return flat
+
+    def to_pandas(self):
+        """DataFrame over the column views (copy=False avoids duplicating the data)"""
+        import pandas as pd
+        return pd.DataFrame(self._flat_columns(), copy=False)
+
+    def to_arrow(self):
+        """pyarrow Table; numeric columns are wrapped without copying"""
+        import pyarrow as pa
+        flat = self._flat_columns()
+        return pa.table({name: pa.array(np.ascontiguousarray(column)) for name, column in flat.items()})
@@ -0,0 +1,560 @@
+"""Smart farming network: deployment, spatial indexing, coverage raster and event scheduling"""
+import heapq
+import itertools
+from time import perf_counter_ns
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .deployment import LAYOUTS, generate_deployment
+from .history import MetricStore
+from .regions import PARTITIONERS, build_partition
+from .nodes import BaseStation, NodeArrays, NodeState, SmartFarmingNode
+
+
+class SpatialIndex:
+    """
+    KD-tree spatial index over node positions
+    Replaces all-pairs distance scans in neighbor discovery, routing and clustering
+    """
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+        self.positions = np.array([(node.x, node.y) for node in self.nodes], dtype=float).reshape(-1, 2)
+        self.rows = np.array([node._row for node in self.nodes], dtype=np.int64)  # NodeArrays rows
+        self.tree = cKDTree(self.positions) if self.nodes else None
+
+    def query_radius(self, x, y, radius):
+        """
+        Return nodes within radius of (x, y) in deployment order
+        A small tolerance keeps boundary nodes; callers apply the exact distance test
+        """
+        if self.tree is None:
+            return []
+
+        indices = self.tree.query_ball_point((x, y), radius + 1e-9)
+        indices.sort()
+        return [self.nodes[i] for i in indices]
+
+    def nearest(self, x, y):
+        """Return the indexed node closest to (x, y)"""
+        if self.tree is None:
+            return None
+
+        _, index = self.tree.query((x, y))
+        return self.nodes[index]
+
+class CoverageRaster:
+    """
+    Count grid over the field for true (union) and k-coverage
+    Each covering node stamps +1 on the cells inside its sensing disc; sleep,
+    wake, death and radius changes update only the cells they touch
+    """
+
+    def __init__(self, width, height, resolution=1.0, partition=None, max_k=3):
+        self.resolution = resolution
+        self.max_k = max_k
+        self.nx = int(np.ceil(width / resolution))
+        self.ny = int(np.ceil(height / resolution))
+        self.counts = np.zeros((self.ny, self.nx), dtype=np.int32)
+
+        # Label each cell with its region (same partition rule as node assignment)
+        self.region_ids = list(range(len(partition))) if partition is not None else [0]
+        self.labels = np.zeros((self.ny, self.nx), dtype=np.int64)
+        if partition is not None:
+            cx = (np.arange(self.nx) + 0.5) * resolution
+            for row in range(self.ny):
+                self.labels[row] = partition.assign(cx, np.full(self.nx, (row + 0.5) * resolution))
+
+        self.region_cells = np.bincount(self.labels.ravel(), minlength=len(self.region_ids))
+
+        # level_cells[g, k]: cells in region g covered by at least k nodes (k >= 1)
+        self.level_cells = np.zeros((len(self.region_ids), max_k + 1), dtype=np.int64)
+        self.stamps = {}  # node id -> (x, y, radius) currently stamped
+
+    def _footprint(self, x, y, radius):
+        """Row/column indices of the cells whose centers lie inside a disc"""
+        res = self.resolution
+        i0, i1 = max(0, int(np.floor((x - radius) / res))), min(self.nx, int(np.ceil((x + radius) / res)) + 1)
+        j0, j1 = max(0, int(np.floor((y - radius) / res))), min(self.ny, int(np.ceil((y + radius) / res)) + 1)
+
+        cx = (np.arange(i0, i1) + 0.5) * res
+        cy = (np.arange(j0, j1) + 0.5) * res
+        inside = (cx[None, :] - x)**2 + (cy[:, None] - y)**2 <= radius**2
+        rows, cols = np.nonzero(inside)
+        return rows + j0, cols + i0
+
+    def _apply(self, x, y, radius, delta):
+        rows, cols = self._footprint(x, y, radius)
+
+        if delta > 0:
+            self.counts[rows, cols] += 1
+            levels = self.counts[rows, cols]  # Level each cell just reached
+        else:
+            levels = self.counts[rows, cols]  # Level each cell is about to lose
+            self.counts[rows, cols] -= 1
+
+        tracked = levels <= self.max_k
+        np.add.at(self.level_cells, (self.labels[rows, cols][tracked], levels[tracked]), delta)
+
+    def add_node(self, node):
+        """Stamp a covering node (no-op if already stamped)"""
+        if node.id not in self.stamps:
+            self.stamps[node.id] = (node.x, node.y, node.sensing_radius)
+            self._apply(node.x, node.y, node.sensing_radius, 1)
+
+    def remove_node(self, node):
+        """Remove a node's stamp (no-op if not stamped)"""
+        stamp = self.stamps.pop(node.id, None)
+        if stamp is not None:
+            self._apply(*stamp, -1)
+
+    @staticmethod
+    def is_covering(node):
+        """Nodes sense while alive and not asleep"""
+        return node.alive and node.state != NodeState.SLEEP
+
+    def on_node_state_change(self, node, event):
+        """Node state observer: keep the raster in step with sleep/wake/death/radius"""
+        if event in ('death', 'sleep'):
+            self.remove_node(node)
+        elif event == 'wake':
+            if self.is_covering(node):
+                self.add_node(node)
+        elif event == 'radius_change' and node.id in self.stamps:
+            self.remove_node(node)
+            self.add_node(node)
+
+    def attach(self, nodes):
+        """Stamp all covering nodes and subscribe to their state changes"""
+        for node in nodes:
+            if self.is_covering(node):
+                self.add_node(node)
+            node.add_state_observer(self.on_node_state_change)
+
+    def coverage_fraction(self, k=1, region_id=None):
+        """Fraction of the field (or of one region) covered by at least k nodes"""
+        if region_id is None:
+            return self.level_cells[:, k].sum() / self.counts.size
+
+        label = self.region_ids.index(region_id)
+        return self.level_cells[label, k] / max(1, self.region_cells[label])
+
+    def region_coverage(self, k=1):
+        """Per-region fraction covered by at least k nodes"""
+        fractions = self.level_cells[:, k] / np.maximum(1, self.region_cells)
+        return {region_id: float(fractions[label]) for label, region_id in enumerate(self.region_ids)}
+
+class EventQueue:
+    """
+    Heap-based discrete-event scheduler for timed node events
+    One heap per event type; rescheduling a (node, type) pair supersedes the
+    earlier entry, which is skipped lazily when it reaches the top
+    """
+
+    EVENT_TYPES = ('wake_up', 'sleep_start', 'cooling_expiry')
+
+    def __init__(self):
+        self.heaps = {event_type: [] for event_type in self.EVENT_TYPES}
+        self.pending = {}  # (node id, event type) -> sequence number of the live entry
+        self.sequence = itertools.count()
+        self.events_processed = 0
+
+    def schedule(self, event_time, event_type, node, payload=None):
+        """Schedule (or reschedule) an event for a node"""
+        sequence = next(self.sequence)
+        self.pending[(node.id, event_type)] = sequence
+        heapq.heappush(self.heaps[event_type], (event_time, sequence, node, payload))
+
+    def cancel(self, node, event_type):
+        """Cancel a node's pending event of the given type, if any"""
+        self.pending.pop((node.id, event_type), None)
+
+    def is_scheduled(self, node, event_type):
+        return (node.id, event_type) in self.pending
+
+    def scheduled_nodes(self, event_type):
+        """Nodes with a live pending event of the given type"""
+        return [node for _, sequence, node, _ in self.heaps[event_type]
+                if self.pending.get((node.id, event_type)) == sequence]
+
+    def pop_due(self, event_type, current_time):
+        """Pop every live event of a type due by current_time: [(time, node, payload)]"""
+        heap = self.heaps[event_type]
+        due = []
+
+        while heap and heap[0][0] <= current_time:
+            event_time, sequence, node, payload = heapq.heappop(heap)
+            if self.pending.get((node.id, event_type)) == sequence:
+                del self.pending[(node.id, event_type)]
+                due.append((event_time, node, payload))
+
+        self.events_processed += len(due)
+        return due
+
+    def __len__(self):
+        return len(self.pending)
+
+class EnhancedSmartFarmingNetwork:
+    """
+    Enhanced clustered smart farming network with cooling period optimization
+    Implements cooling period minimization
+    The field is split into regions by a partitioner (see regions.PARTITIONERS):
+    the paper's 5 fixed regions by default, or grid / k-means / quadtree
+    partitions whose region count scales with the field
+    """
+
+    def __init__(self, width=500, height=500, total_nodes=200, coverage_resolution=1.0, rng=None,
+                 history_dir=None, partition='fixed', partition_options=None,
+                 layout='jittered_grid', layout_options=None):
+        self.width = width
+        self.height = height
+        self.total_nodes = total_nodes
+        self.current_time = 0
+
+        # Random source for deployment jitter and sensing noise
+        # (global np.random unless a per-run Generator is supplied)
+        self.rng = np.random if rng is None else rng
+
+        # Network composition (80% NoN, 20% AdN as per research)
+        self.normal_nodes_count = int(0.8 * total_nodes)  # 160 NoN
+        self.advanced_nodes_count = total_nodes - self.normal_nodes_count  # 40 AdN
+
+        # Deployment layout (see deployment.LAYOUTS) and the generated Deployment
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}")
+        self.layout = layout
+        self.layout_options = layout_options or {}
+        self.deployment = None
+        self.deployment_timings = {}  # deploy_nodes stage -> wall time (ms)
+
+        # Node collections (numeric node state lives in node_arrays)
+        self.node_arrays = NodeArrays(capacity=total_nodes)
+        self.nodes = []
+        self.alive_nodes = []
+        self._alive_version = -1  # node_arrays.alive_version alive_nodes was built at
+        self.base_station = None
+        self.spatial_index = None  # Built once node positions are known
+        self.coverage_resolution = coverage_resolution  # Raster cell size (meters)
+        self.coverage_raster = None
+
+        # Discrete-event scheduler (wake-ups, scheduled sleeps, cooling expiry)
+        self.event_queue = EventQueue()
+        self.cooling_nodes = {}  # NodeArrays row -> scheduled cooling expiry time
+
+        # Regional structure - Complete network coverage
+        # Position-independent partitions are built now; k-means and quadtree
+        # partitions adapt to the deployment and are built in deploy_nodes
+        if partition not in PARTITIONERS:
+            raise ValueError(f"partition must be one of {PARTITIONERS}")
+        self.partition_method = partition
+        self.partition_options = partition_options or {}
+        self.partition = None
+        self.regions = {}
+        if partition in ('fixed', 'grid'):
+            self._set_partition(build_partition(partition, width, height, **self.partition_options))
+
+        # Network metrics for analysis
+        self.metrics = {
+            'round': 0,
+            'alive_nodes': 0,
+            'total_energy': 0,
+            'cooling_violations': 0,
+            'successful_transmissions': 0,
+            'failed_transmissions': 0,
+            'coverage_efficiency': 0,
+            'union_coverage': 0,
+            'k_coverage': {},
+            'region_union_coverage': {},
+            'network_lifetime': 0,
+            'data_packets_delivered': 0,
+            'average_cooling_period': 0,
+            'region_energy_balance': {},
+            'clustering_overhead': 0
+        }
+
+        # Performance tracking (columnar; memory-mapped under history_dir if given)
+        self.history_dir = history_dir
+        self._init_history()
+
+        print(f" Smart Farming Network Initialized:")
+        print(f"    Dimensions: {width}x{height} meters")
+        print(f"    Total nodes: {total_nodes} ({self.normal_nodes_count} NoN + {self.advanced_nodes_count} AdN)")
+        if self.regions:
+            print(f"     {len(self.regions)} strategic regions with dedicated cluster heads")
+        else:
+            print(f"     Regions partitioned at deployment ({partition})")
+
+    def _set_partition(self, partition):
+        """Install a RegionPartition and rebuild the region table"""
+        self.partition = partition
+        self.regions = partition.regions()
+
+    def _init_history(self):
+        """Empty history store sized for the current region count"""
+        self.history = MetricStore({
+            'round': np.int64,
+            'alive_nodes': np.int64,
+            'total_energy': np.float64,
+            'cooling_violations': np.int64,
+            'coverage_efficiency': np.float64,
+            'union_coverage': np.float64,
+            'successful_transmissions': np.int64,
+            'average_cooling_period': np.float64,
+            'region_energy_distribution': (np.float64, (len(self.regions),))
+        }, directory=None if self.history_dir is None else f'{self.history_dir}/network')
+
+    def deploy_nodes(self, deployment=None):
+        """
+        Deploy nodes across the regions with strategic energy allocation
+        and priority-based placement for complete network coverage
+        Positions, energy tiers and regions come from a vectorized Deployment
+        (generated with this network's layout unless one is given, e.g. loaded
+        with Deployment.load) and the node rows are filled in bulk
+        """
+        print(f" Deploying nodes across {len(self.regions) or 'adaptive'} regions for complete network coverage...")
+        stage_start = perf_counter_ns()
+
+        if deployment is None:
+            deployment = generate_deployment(self.layout, self.total_nodes, self.width, self.height,
+                                             rng=self.rng, advanced_count=self.advanced_nodes_count,
+                                             **self.layout_options)
+        self.deployment = deployment
+
+        # Partition the field (adaptive partitions follow the node positions)
+        if self.partition is None:
+            self._set_partition(build_partition(self.partition_method, self.width, self.height,
+                                                deployment.x, deployment.y, rng=self.rng,
+                                                **self.partition_options))
+            self._init_history()
+
+        # Assign nodes to regions; each region gets at least one Advanced Node for CH selection
+        upgraded = deployment.assign_regions(self.partition)
+
+        # Create all node rows at once, then the node views onto them
+        rows = self.node_arrays.add_rows(
+            len(deployment), x=deployment.x, y=deployment.y,
+            initial_energy=deployment.initial_energy, energy=deployment.energy,
+            advanced=deployment.advanced, region_id=deployment.region_id)
+        self.nodes = [SmartFarmingNode.from_row(self.node_arrays, row, node_id)
+                      for node_id, row in enumerate(rows.tolist())]
+
+        for node, region_id in zip(self.nodes, deployment.region_id.tolist()):
+            self.regions[region_id]['nodes'].append(node)
+
+        for node_id, region_id in upgraded:
+            print(f"    Converted Node {node_id} to AdN in Region {region_id}")
+
+        # Initialize base station at network center
+        self.base_station = BaseStation(self.width/2, self.height/2)
+
+        # Update alive nodes list
+        self.alive_nodes = [node for node in self.nodes if node.alive]
+        self._alive_version = self.node_arrays.alive_version
+
+        # Build spatial index (nodes are static, so positions never change)
+        self.spatial_index = SpatialIndex(self.nodes)
+
+        # Track cooling windows so expiry is event-driven rather than a full scan
+        for node in self.nodes:
+            node.add_state_observer(self._on_node_state_change)
+
+        # Calculate initial neighbor relationships
+        neighbors_start = perf_counter_ns()
+        self._calculate_neighbor_relationships()
+
+        # Coverage raster tracks true coverage incrementally from here on
+        raster_start = perf_counter_ns()
+        self.coverage_raster = CoverageRaster(
+            self.width, self.height, self.coverage_resolution, self.partition)
+        self.coverage_raster.attach(self.nodes)
+
+        self.deployment_timings = {
+            'deployment': (neighbors_start - stage_start) / 1e6,
+            'neighbor_discovery': (raster_start - neighbors_start) / 1e6,
+            'coverage_raster': (perf_counter_ns() - raster_start) / 1e6,
+        }
+
+        # Print deployment statistics
+        print(f"Node deployment completed with full network coverage:")
+        print(f"    Total nodes deployed: {len(self.nodes)}")
+        print(f"    Base station positioned at network center: ({self.width/2}, {self.height/2})")
+
+        region_counts = np.bincount(deployment.region_id, minlength=len(self.regions))
+        adn_counts = np.bincount(deployment.region_id[deployment.advanced], minlength=len(self.regions))
+        for region_id in self.regions:
+            adn_count, node_count = int(adn_counts[region_id]), int(region_counts[region_id])
+            print(f"   Region {region_id}: {node_count} nodes ({adn_count} AdN + {node_count - adn_count} NoN)")
+
+        print(f"    Neighbor relationships calculated for coverage optimization")
+
+    def _calculate_neighbor_relationships(self):
+        """
+        Calculate neighbor relationships for dynamic sensing radius optimization
+        Critical for coverage efficiency and cooling period management
+        Candidates come from the spatial index, so discovery is O(n log n)
+        """
+        neighbor_count = 0
+
+        # Radii only grow up to 1.5x their original value while this loop runs,
+        # so this bound covers every pair that can satisfy the sensing-range test
+        max_radius = max((max(node.sensing_radius, 1.5 * node.original_sensing_radius)
+                          for node in self.nodes), default=0)
+
+        for node in self.nodes:
+            node.neighbor_nodes = []
+
+            if not node.alive:
+                node.update_sensing_radius(node.neighbor_nodes)
+                continue
+
+            candidates = self.spatial_index.query_radius(node.x, node.y,
+                                                         node.sensing_radius + max_radius)
+
+            for other_node in candidates:
+                if node.id != other_node.id and other_node.alive:
+                    distance = node.distance(other_node)
+
+                    # Nodes are neighbors if within combined sensing range
+                    if distance <= (node.sensing_radius + other_node.sensing_radius):
+                        node.neighbor_nodes.append(other_node)
+                        neighbor_count += 1
+
+            # Update sensing radius based on neighbors
+            node.update_sensing_radius(node.neighbor_nodes)
+
+        avg_neighbors = neighbor_count / len(self.alive_nodes) if self.alive_nodes else 0
+        print(f"   Average neighbors per node: {avg_neighbors:.2f}")
+
+        # From here on the lists are maintained incrementally (see _update_neighbor_graph)
+        self.max_sensing_radius = max((node.sensing_radius for node in self.nodes), default=0)
+        for node in self.nodes:
+            node.add_state_observer(self._update_neighbor_graph)
+
+    def _update_neighbor_graph(self, node, event):
+        """
+        Node state observer keeping neighbor lists current at O(local degree) per event
+        A dead node leaves every neighbor list; a radius change re-tests only the
+        pairs involving the node (d <= r_i + r_j, both alive). Sleeping nodes stay
+        listed: they still sense on waking, and coverage and routing skip them
+        """
+        if event == 'death':
+            for other in self.spatial_index.query_radius(node.x, node.y, 2 * self.max_sensing_radius):
+                other.remove_neighbor(node)
+            node.neighbor_nodes = []
+
+        elif event == 'radius_change' and node.alive:
+            self.max_sensing_radius = max(self.max_sensing_radius, node.sensing_radius)
+            neighbors = []
+
+            for other in self.spatial_index.query_radius(node.x, node.y, 2 * self.max_sensing_radius):
+                if other.id == node.id or not other.alive:
+                    continue
+                if node.distance(other) <= node.sensing_radius + other.sensing_radius:
+                    neighbors.append(other)
+                    other.add_neighbor(node)
+                else:
+                    other.remove_neighbor(node)
+
+            node.neighbor_nodes = neighbors
+
+    def _on_node_state_change(self, node, event):
+        """Schedule cooling expiry on transmission; drop pending events on death"""
+        if event == 'cooling_start':
+            expiry_time = node.cooling_until
+            if self.cooling_nodes.get(node._row) != expiry_time:
+                self.cooling_nodes[node._row] = expiry_time
+                self.event_queue.schedule(expiry_time, 'cooling_expiry', node)
+        elif event == 'death':
+            self.cooling_nodes.pop(node._row, None)
+            for event_type in EventQueue.EVENT_TYPES:
+                self.event_queue.cancel(node, event_type)
+
+    def process_cooling_expiry(self, current_time):
+        """
+        Per-round cooling update driven by the event queue
+        The COOLING <-> ACTIVE transitions of the time step are applied as one
+        array operation over the nodes whose cooling window expires and the
+        nodes still cooling; availability checks in between only compare
+        against the cooling_until timestamps
+        """
+        expired = self.event_queue.pop_due('cooling_expiry', current_time)
+
+        rows = []
+        for _, node, _ in expired:
+            self.cooling_nodes.pop(node._row, None)
+            if node.alive:
+                rows.append(node._row)
+        rows.extend(self.cooling_nodes)
+
+        if rows:
+            self.node_arrays.update_cooling_periods(current_time, rows=rows)
+
+        return len(expired)
+
+    def calculate_network_metrics(self):
+        """
+        Calculate comprehensive network performance metrics
+        Essential for analysis and cooling period optimization
+        Totals come from the running aggregates kept by node_arrays, so the
+        cost is O(changes): the alive list is rebuilt only after deaths and the
+        cooling average only visits nodes that are currently cooling
+        """
+        arrays = self.node_arrays
+        totals = arrays.totals
+        if self._alive_version != arrays.alive_version:
+            self.alive_nodes = [self.nodes[row] for row in np.flatnonzero(arrays.column('alive'))]
+            self._alive_version = arrays.alive_version
+
+        if not self.alive_nodes:
+            return
+
+        # Basic network metrics
+        self.metrics['alive_nodes'] = totals['alive']
+        self.metrics['total_energy'] = totals['alive_energy']
+
+        # Cooling period analysis (Key research contribution)
+        # Every node with a non-zero cooling period is tracked in cooling_nodes
+        cooling_rows = np.sort(np.fromiter(self.cooling_nodes, dtype=np.int64,
+                                           count=len(self.cooling_nodes)))
+        cooling_period = arrays.cooling_period[cooling_rows]
+        active_cooling_periods = cooling_period[arrays.alive[cooling_rows] & (cooling_period > 0)]
+
+        self.metrics['cooling_violations'] = totals['cooling_violations']
+        self.metrics['average_cooling_period'] = (float(active_cooling_periods.mean())
+                                                if active_cooling_periods.size else 0)
+
+        # Transmission success analysis
+        self.metrics['successful_transmissions'] = totals['successful_transmissions']
+        self.metrics['failed_transmissions'] = totals['failed_transmissions']
+        self.metrics['data_packets_delivered'] = self.base_station.packets_received
+
+        # Coverage efficiency calculation
+        total_coverage_area = totals['alive_coverage_area']
+        network_area = self.width * self.height
+        self.metrics['coverage_efficiency'] = min(1.0, total_coverage_area / network_area)
+
+        # True coverage: union and k-coverage fractions from the raster (no overlap double-counting)
+        raster = self.coverage_raster
+        self.metrics['union_coverage'] = float(raster.coverage_fraction(1))
+        self.metrics['k_coverage'] = {k: float(raster.coverage_fraction(k))
+                                      for k in range(1, raster.max_k + 1)}
+        self.metrics['region_union_coverage'] = raster.region_coverage(1)
+
+        # Regional energy balance analysis
+        for region_id in self.regions.keys():
+            if region_id < len(arrays.region_alive) and arrays.region_alive[region_id] > 0:
+                self.metrics['region_energy_balance'][region_id] = float(arrays.region_energy[region_id])
+
+        # Network lifetime (rounds until first node death)
+        if self.metrics['network_lifetime'] == 0 and len(self.alive_nodes) < self.total_nodes:
+            self.metrics['network_lifetime'] = self.metrics['round']
+
+    def update_history(self):
+        """Update performance history for trend analysis (one columnar append)"""
+        region_energy = self.metrics['region_energy_balance']
+        self.history.append({
+            **self.metrics,
+            'region_energy_distribution': [region_energy.get(region_id, 0.0)
+                                           for region_id in sorted(self.regions)]
+        })
@@ -0,0 +1,221 @@
+"""
+Per-phase profiling of the simulation loop
+
+A SimulationProfiler passed to run_comprehensive_simulation times every phase
+of a round with perf_counter_ns and records, per round, the deltas of the
+hot-path counters (Dijkstra expansions, coverage overlap computations, events
+processed). Timers and counter snapshots cost a few microseconds per round;
+cProfile and tracemalloc are only switched on for every Nth round
+(profile_every / memory_every), and those rounds are flagged so the phase
+summary leaves them out.
+
+Usage:
+    python -m smartfarm.profiling --nodes 1000 --rounds 20 --out profile.json
+    python -m smartfarm.profiling --profile-every 10 --memory-every 5 --out profile.json
+"""
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+from time import perf_counter_ns
+
+import numpy as np
+
+from .experiments import DEFAULT_CONFIG, build_simulation
+from .history import MetricStore
+from .simulation import run_comprehensive_simulation
+
+# Phases of one simulation round, in execution order
+PHASES = ('cooling_update', 'ch_selection', 'routing', 'sleep_wake', 'sensing', 'metrics')
+
+# Cumulative hot-path counters; the report holds their per-round deltas
+COUNTERS = ('dijkstra_expansions', 'overlap_computations', 'events_processed')
+
+
+class _PhaseTimer:
+    """Reusable context manager adding elapsed nanoseconds to one phase"""
+
+    __slots__ = ('timings', 'name', 'start')
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timings[self.name] += perf_counter_ns() - self.start
+        return False
+
+class SimulationProfiler:
+    """
+    Per-round phase timings and hot-path counter deltas as a MetricStore
+
+    profile_every / memory_every > 0 capture cProfile statistics (top_functions
+    entries by cumulative time) / the tracemalloc peak every that many rounds
+    """
+
+    def __init__(self, profile_every=0, memory_every=0, top_functions=20, capacity=256):
+        self.profile_every = profile_every
+        self.memory_every = memory_every
+        self.top_functions = top_functions
+
+        fields = {'round': np.int64, 'total_ns': np.int64, 'captured': np.bool_,
+                  'peak_memory_bytes': np.int64}
+        fields.update({f'{phase}_ns': np.int64 for phase in PHASES})
+        fields.update({counter: np.int64 for counter in COUNTERS})
+        self.rounds = MetricStore(fields, capacity=capacity)
+        self.captures = []  # [{'round', 'functions': [...]}] from cProfile rounds
+
+        self.timings = dict.fromkeys(PHASES, 0)
+        self._timers = {phase: _PhaseTimer(self.timings, phase) for phase in PHASES}
+        self._readers = {}
+        self._counters = {}
+        self._round = None
+        self._round_start = 0
+        self._cprofile = None
+        self._tracing = False
+
+    def attach(self, network, ch_selector, router, sleep_optimizer):
+        """Bind the counter sources of one simulation"""
+        self._readers = {
+            'dijkstra_expansions': lambda: router.dijkstra_expansions,
+            'overlap_computations': lambda: sleep_optimizer.overlap_computations,
+            'events_processed': lambda: network.event_queue.events_processed,
+        }
+
+    def _read_counters(self):
+        return {name: read() for name, read in self._readers.items()}
+
+    def begin_round(self, round_num):
+        self._round = round_num
+        for phase in PHASES:
+            self.timings[phase] = 0
+        self._counters = self._read_counters()
+
+        if self.memory_every and round_num % self.memory_every == 0:
+            self._tracing = not tracemalloc.is_tracing()
+            if self._tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        if self.profile_every and round_num % self.profile_every == 0:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+        self._round_start = perf_counter_ns()
+
+    def phase(self, name):
+        """Context manager timing one phase of the current round"""
+        return self._timers[name]
+
+    def end_round(self):
+        total_ns = perf_counter_ns() - self._round_start
+        captured = False
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self.captures.append({'round': self._round,
+                                  'functions': self._top_functions(self._cprofile)})
+            self._cprofile = None
+            captured = True
+
+        peak_memory = -1
+        if self.memory_every and self._round % self.memory_every == 0:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+            captured = True
+
+        counters = self._read_counters()
+        record = {'round': self._round, 'total_ns': total_ns, 'captured': captured,
+                  'peak_memory_bytes': peak_memory}
+        record.update({f'{phase}_ns': elapsed for phase, elapsed in self.timings.items()})
+        record.update({name: counters[name] - self._counters[name] for name in counters})
+        self.rounds.append(record)
+
+    def _top_functions(self, profile):
+        """Top functions of one cProfile capture by cumulative time"""
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        return [{'function': f'{filename}:{line}({name})', 'calls': calls,
+                 'total_s': total_time, 'cumulative_s': cumulative_time}
+                for (filename, line, name), (_, calls, total_time, cumulative_time, _)
+                in rows[:self.top_functions]]
+
+    def summary(self):
+        """Per-phase total / mean ms and share of round time over uncaptured rounds"""
+        uncaptured = ~self.rounds['captured']
+        total = float(self.rounds['total_ns'][uncaptured].sum())
+        phases = {}
+        for phase in PHASES:
+            elapsed = self.rounds[f'{phase}_ns'][uncaptured]
+            phases[phase] = {
+                'total_ms': float(elapsed.sum()) / 1e6,
+                'mean_ms': float(elapsed.mean()) / 1e6 if elapsed.size else 0.0,
+                'share': float(elapsed.sum()) / total if total else 0.0,
+            }
+
+        return {
+            'rounds': len(self.rounds),
+            'timed_rounds': int(uncaptured.sum()),
+            'total_ms': total / 1e6,
+            'phases': phases,
+            'counters': {name: int(self.rounds[name].sum()) for name in COUNTERS},
+        }
+
+    def report(self):
+        """Machine-readable report: per-round records, summary and cProfile captures"""
+        return {
+            'phases': list(PHASES),
+            'counters': list(COUNTERS),
+            'rounds': self.rounds.to_records(),
+            'summary': self.summary(),
+            'captures': self.captures,
+        }
+
+    def save(self, path):
+        Path(path).write_text(json.dumps(self.report(), indent=2))
+
+def main():
+    ap = argparse.ArgumentParser(description='Profile the phases of one seeded simulation')
+    ap.add_argument('--seed', type=int, default=1000)
+    ap.add_argument('--rounds', type=int, default=DEFAULT_CONFIG['num_rounds'])
+    ap.add_argument('--nodes', type=int, default=DEFAULT_CONFIG['total_nodes'])
+    ap.add_argument('--width', type=int, default=DEFAULT_CONFIG['width'])
+    ap.add_argument('--height', type=int, default=DEFAULT_CONFIG['height'])
+    ap.add_argument('--profile-every', type=int, default=0, help='cProfile every N rounds (0: off)')
+    ap.add_argument('--memory-every', type=int, default=0, help='tracemalloc peak every N rounds (0: off)')
+    ap.add_argument('--out', default='profile.json')
+    args = ap.parse_args()
+
+    config = {'width': args.width, 'height': args.height, 'total_nodes': args.nodes,
+              'num_rounds': args.rounds}
+    profiler = SimulationProfiler(profile_every=args.profile_every, memory_every=args.memory_every,
+                                  capacity=args.rounds)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        network, ch_selector, router, sleep_optimizer = build_simulation(args.seed, config)
+        run_comprehensive_simulation(network, ch_selector, router, sleep_optimizer,
+                                     num_rounds=args.rounds, profiler=profiler)
+
+    summary = profiler.summary()
+    print(f"Profiled {summary['rounds']} rounds ({summary['timed_rounds']} timed): "
+          f"{summary['total_ms']:.1f} ms")
+    for phase, stats in summary['phases'].items():
+        print(f"   {phase:<15} {stats['mean_ms']:9.3f} ms/round  {stats['share']:6.1%}")
+    for name, value in summary['counters'].items():
+        print(f"   {name:<21} {value}")
+
+    profiler.save(args.out)
+    print(f"Wrote {args.out}")
+
+if __name__ == '__main__':
+    main()
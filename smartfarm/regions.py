@@ -0,0 +1,229 @@
+"""
+Region partitioners: how the field is split into clusters
+
+Every partitioner yields a RegionPartition with one center per region and a
+vectorized assign(x, y) that maps positions to region ids, so deployments of
+tens of thousands of nodes are labelled in a few array passes and the region
+count scales with the field instead of being fixed at five.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+PARTITIONERS = ('fixed', 'grid', 'kmeans', 'quadtree')
+
+# Above this many regions, nearest-center lookups go through a k-d tree
+_BRUTE_FORCE_REGIONS = 32
+_ASSIGN_CHUNK = 1 << 16
+
+
+class RegionPartition:
+    """
+    Regions as centers; positions belong to the nearest center
+    (first center wins ties, as in the original per-node assignment loop)
+    """
+
+    def __init__(self, centers, radii=None, areas=None):
+        self.centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        count = len(self.centers)
+        self.radii = np.zeros(count) if radii is None else np.asarray(radii, dtype=np.float64)
+        self.areas = np.zeros(count) if areas is None else np.asarray(areas, dtype=np.float64)
+        self._tree = None
+
+    def __len__(self):
+        return len(self.centers)
+
+    def assign(self, x, y):
+        """Region id of every position (arrays of any matching shape)"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        flat_x, flat_y = x.ravel(), y.ravel()
+
+        if len(self) > _BRUTE_FORCE_REGIONS:
+            if self._tree is None:
+                self._tree = cKDTree(self.centers)
+            _, labels = self._tree.query(np.column_stack([flat_x, flat_y]))
+            return labels.astype(np.int64).reshape(x.shape)
+
+        labels = np.empty(flat_x.size, dtype=np.int64)
+        center_x, center_y = self.centers[:, 0], self.centers[:, 1]
+        for start in range(0, flat_x.size, _ASSIGN_CHUNK):
+            chunk = slice(start, start + _ASSIGN_CHUNK)
+            distance = np.sqrt((flat_x[chunk, None] - center_x)**2 +
+                               (flat_y[chunk, None] - center_y)**2)
+            labels[chunk] = np.argmin(distance, axis=1)
+        return labels.reshape(x.shape)
+
+    def cell_areas(self, width, height, resolution=None):
+        """
+        Area of every region's cell in a width x height field
+        The field is rasterized (cell side resolution, by default 1/512 of the
+        longer side) and raster cells are counted per assigned region
+        """
+        if resolution is None:
+            resolution = max(width, height) / 512
+        nx = max(1, int(np.ceil(width / resolution)))
+        ny = max(1, int(np.ceil(height / resolution)))
+        grid_x, grid_y = np.meshgrid((np.arange(nx) + 0.5) * (width / nx),
+                                     (np.arange(ny) + 0.5) * (height / ny))
+        counts = np.bincount(self.assign(grid_x, grid_y).ravel(), minlength=len(self))
+        return counts * (width / nx) * (height / ny)
+
+    def regions(self):
+        """Network region table: {region_id: {'center', 'radius', 'area', 'nodes', 'CH'}}"""
+        return {
+            region_id: {
+                'center': (float(center[0]), float(center[1])),
+                'radius': float(self.radii[region_id]),
+                'area': float(self.areas[region_id]),
+                'nodes': [],
+                'CH': None
+            }
+            for region_id, center in enumerate(self.centers)
+        }
+
+class FixedRegions(RegionPartition):
+    """
+    The five strategic regions of the reference 500x500 farm
+    (four quadrants plus the center), scaled to the field size
+    Region areas are the nearest-center cells, so they tile the field
+    """
+
+    CENTERS = [(125, 125), (375, 125), (250, 250), (125, 375), (375, 375)]
+    RADII = [120, 120, 110, 120, 120]
+
+    def __init__(self, width=500, height=500):
+        scale_x, scale_y = width / 500, height / 500
+        centers = [(cx * scale_x, cy * scale_y) for cx, cy in self.CENTERS]
+        radii = [radius * min(scale_x, scale_y) for radius in self.RADII]
+        super().__init__(centers, radii)
+        self.areas = self.cell_areas(width, height)
+
+class GridRegions(RegionPartition):
+    """
+    Rectangular tiling with roughly square tiles of side region_size
+    Assignment is pure index arithmetic, so it is O(n) for any region count
+    """
+
+    def __init__(self, width, height, region_size=250.0):
+        self.width = width
+        self.height = height
+        self.cols = max(1, int(round(width / region_size)))
+        self.rows = max(1, int(round(height / region_size)))
+        self.tile_width = width / self.cols
+        self.tile_height = height / self.rows
+
+        col, row = np.meshgrid(np.arange(self.cols), np.arange(self.rows))
+        centers = np.column_stack([((col + 0.5) * self.tile_width).ravel(),
+                                   ((row + 0.5) * self.tile_height).ravel()])
+        radius = 0.5 * np.hypot(self.tile_width, self.tile_height)
+        super().__init__(centers, np.full(len(centers), radius),
+                         np.full(len(centers), self.tile_width * self.tile_height))
+
+    def assign(self, x, y):
+        col = np.clip((np.asarray(x) // self.tile_width).astype(np.int64), 0, self.cols - 1)
+        row = np.clip((np.asarray(y) // self.tile_height).astype(np.int64), 0, self.rows - 1)
+        return row * self.cols + col
+
+class KMeansRegions(RegionPartition):
+    """
+    Lloyd's k-means over node positions, so regions follow irregular fields
+    Each iteration is one vectorized assignment plus bincount centroid updates
+    """
+
+    def __init__(self, x, y, k, width, height, rng=None, iterations=20):
+        rng = np.random.default_rng() if rng is None else rng
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        k = max(1, min(k, len(x)))
+
+        super().__init__(np.column_stack([x, y])[rng.choice(len(x), size=k, replace=False)])
+
+        for _ in range(iterations):
+            self._tree = None
+            labels = self.assign(x, y)
+            counts = np.bincount(labels, minlength=k)
+            occupied = counts > 0
+            centers = self.centers.copy()
+            centers[occupied, 0] = np.bincount(labels, weights=x, minlength=k)[occupied] / counts[occupied]
+            centers[occupied, 1] = np.bincount(labels, weights=y, minlength=k)[occupied] / counts[occupied]
+            if np.allclose(centers, self.centers):
+                break
+            self.centers = centers  # Empty clusters keep their previous center
+
+        self._tree = None
+        labels = self.assign(x, y)
+        distance = np.hypot(x - self.centers[labels, 0], y - self.centers[labels, 1])
+        self.radii = np.zeros(k)
+        np.maximum.at(self.radii, labels, distance)
+        self.areas = self.cell_areas(width, height)  # Voronoi cells clipped to the field
+
+class QuadtreeRegions(RegionPartition):
+    """
+    Quadtree over node positions: a cell is split into quadrants while it
+    holds more than max_nodes nodes, so dense areas get small regions and
+    every region stays bounded in size. Leaves are the regions.
+    """
+
+    def __init__(self, x, y, width, height, max_nodes=200, max_depth=10):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        leaves = []  # (depth, column, row) in the grid of that depth
+        pending = [(0, 0, 0, np.arange(len(x)))]
+        while pending:
+            depth, col, row, members = pending.pop()
+            if len(members) <= max_nodes or depth == max_depth:
+                leaves.append((depth, col, row))
+                continue
+
+            cells = 1 << (depth + 1)
+            sub_col = np.clip((x[members] * cells // width).astype(np.int64), 2 * col, 2 * col + 1)
+            sub_row = np.clip((y[members] * cells // height).astype(np.int64), 2 * row, 2 * row + 1)
+            for quadrant in range(4):
+                qcol, qrow = 2 * col + (quadrant & 1), 2 * row + (quadrant >> 1)
+                inside = (sub_col == qcol) & (sub_row == qrow)
+                pending.append((depth + 1, qcol, qrow, members[inside]))
+
+        leaves.sort()
+        self.width = width
+        self.height = height
+        self.depth = max(depth for depth, _, _ in leaves)
+
+        # Lookup table over the finest grid: cell -> leaf (region) id
+        cells = 1 << self.depth
+        self.lookup = np.empty((cells, cells), dtype=np.int64)
+        centers, radii, areas = [], [], []
+        for region_id, (depth, col, row) in enumerate(leaves):
+            span = 1 << (self.depth - depth)
+            self.lookup[row * span:(row + 1) * span, col * span:(col + 1) * span] = region_id
+
+            leaf_width, leaf_height = width / (1 << depth), height / (1 << depth)
+            centers.append(((col + 0.5) * leaf_width, (row + 0.5) * leaf_height))
+            radii.append(0.5 * np.hypot(leaf_width, leaf_height))
+            areas.append(leaf_width * leaf_height)
+
+        super().__init__(centers, radii, areas)
+
+    def assign(self, x, y):
+        cells = 1 << self.depth
+        col = np.clip((np.asarray(x) * cells // self.width).astype(np.int64), 0, cells - 1)
+        row = np.clip((np.asarray(y) * cells // self.height).astype(np.int64), 0, cells - 1)
+        return self.lookup[row, col]
+
+def build_partition(method, width, height, x=None, y=None, rng=None, **options):
+    """
+    Partition the field with one of PARTITIONERS
+    'kmeans' and 'quadtree' adapt to node positions (x, y); options are passed
+    to the partitioner (region_size, k, max_nodes, ...). 'kmeans' defaults to
+    one region per ~250 nodes
+    """
+    if method == 'fixed':
+        return FixedRegions(width, height)
+    if method == 'grid':
+        return GridRegions(width, height, **options)
+    if method == 'kmeans':
+        options.setdefault('k', max(1, round(len(x) / 250)))
+        return KMeansRegions(x, y, width=width, height=height, rng=rng, **options)
+    if method == 'quadtree':
+        return QuadtreeRegions(x, y, width, height, **options)
+    raise ValueError(f"partition must be one of {PARTITIONERS}")
@@ -0,0 +1,551 @@
+"""Cooling-aware multi-hop routing over a CSR communication graph"""
+import heapq
+
+import numpy as np
+
+
+class CommunicationGraph:
+    """
+    CSR adjacency of the communication graph (links within max transmission range)
+    Built once from the network spatial index; node ids map to rows in O(1)
+    Each link stores its distance and per-unit transmission energy
+    (E_elec + ε_amp·d², in nJ), so routing never recomputes them
+    An optional sink (the base station) is the last vertex: its row lists the
+    nodes within range of it, but no node row lists the sink, so only
+    searches rooted at the sink reach it and nodes never relay through it
+    Dead vertices are removed incrementally: their links are masked out and
+    the arrays are compacted once a quarter of the stored links are dead
+    """
+
+    COMPACT_FRACTION = 0.25
+
+    def __init__(self, network, max_range, energy_electronics=50e-9, energy_amplifier=10e-12,
+                 sink=None):
+        self.nodes = list(network.nodes)
+        self.index_of = {node.id: i for i, node in enumerate(self.nodes)}
+        self.max_range = max_range
+        self.sink = None
+
+        n = len(self.nodes)
+        positions = network.spatial_index.positions
+        pairs = (network.spatial_index.tree.query_pairs(max_range + 1e-9, output_type='ndarray')
+                 if n > 1 else np.empty((0, 2), dtype=int))
+
+        # Exact range test on the candidate pairs, then store both directions
+        i, j = pairs[:, 0], pairs[:, 1]
+        d = np.sqrt((positions[i, 0] - positions[j, 0])**2 + (positions[i, 1] - positions[j, 1])**2)
+        keep = d <= max_range
+        rows = np.concatenate([i[keep], j[keep]])
+        cols = np.concatenate([j[keep], i[keep]])
+        dists = np.concatenate([d[keep], d[keep]])
+
+        if sink is not None:
+            candidates = np.asarray(network.spatial_index.tree.query_ball_point(
+                [sink.x, sink.y], max_range + 1e-9), dtype=np.int64)
+            sink_d = np.sqrt((positions[candidates, 0] - sink.x)**2 +
+                             (positions[candidates, 1] - sink.y)**2)
+            in_range = sink_d <= max_range
+
+            self.sink = n
+            self.nodes.append(sink)
+            n += 1
+            rows = np.concatenate([rows, np.full(int(in_range.sum()), self.sink)])
+            cols = np.concatenate([cols, candidates[in_range]])
+            dists = np.concatenate([dists, sink_d[in_range]])
+
+        # Sort by (row, col) so each row lists neighbors in deployment order
+        order = np.lexsort((cols, rows))
+        self.indices = cols[order]
+        self.distances = dists[order]
+        self.energies = (energy_electronics + energy_amplifier * self.distances**2) * 1e9
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self.indptr[1:])
+
+        self.removed = np.zeros(n, dtype=bool)
+        self.dead_links = 0
+        self.remove_vertices([row for row, node in enumerate(network.nodes) if not node.alive])
+
+    def remove_vertices(self, rows):
+        """Remove vertices (e.g. dead nodes) and every link touching them"""
+        rows = [row for row in rows if not self.removed[row]]
+        if not rows:
+            return
+
+        self.removed[rows] = True
+        degrees = self.indptr[np.asarray(rows) + 1] - self.indptr[rows]
+        self.dead_links += 2 * int(degrees.sum())  # Each link is stored in both directions
+
+        if self.dead_links > self.COMPACT_FRACTION * len(self.indices):
+            self._compact()
+
+    def _compact(self):
+        """Drop links touching removed vertices, keeping each row's neighbor order"""
+        n = len(self.nodes)
+        source = np.repeat(np.arange(n), np.diff(self.indptr))
+        keep = ~(self.removed[source] | self.removed[self.indices])
+
+        self.indices = self.indices[keep]
+        self.distances = self.distances[keep]
+        self.energies = self.energies[keep]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source[keep], minlength=n), out=self.indptr[1:])
+        self.dead_links = 0
+
+    def on_node_state_change(self, node, event):
+        """Node state observer: dead nodes leave the graph"""
+        if event == 'death':
+            row = self.index_of.get(node.id)
+            if row is not None:
+                self.remove_vertices([row])
+
+    def neighbors(self, index):
+        """Return (neighbor rows, link distances, link energies) for a row as Python lists"""
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return (self.indices[start:end].tolist(), self.distances[start:end].tolist(),
+                self.energies[start:end].tolist())
+
+    def link(self, source, target):
+        """
+        (distance, per-unit energy) of the live source -> target link
+        Raises KeyError if there is no such link or either end has been removed
+        """
+        start, end = self.indptr[source], self.indptr[source + 1]
+        position = start + int(np.searchsorted(self.indices[start:end], target))
+        if (position < end and self.indices[position] == target and
+                not self.removed[source] and not self.removed[target]):
+            return self.distances[position].item(), self.energies[position].item()
+        raise KeyError((source, target))
+
+class ShortestPathTree:
+    """
+    Reverse shortest-path tree toward a single root (cluster head)
+    Stores each node's next hop, so any member's path is a tree walk
+    """
+
+    def __init__(self, graph, root, next_hop, costs, built_at):
+        self.graph = graph
+        self.root = root
+        self.next_hop = next_hop
+        self.costs = costs
+        self.built_at = built_at
+
+    def path_from(self, node):
+        """Return the node path from node to the root, or None if unreachable"""
+        row = self.graph.index_of.get(node.id)
+        if row is None or (row != self.root and row not in self.next_hop):
+            return None
+
+        path = [self.graph.nodes[row]]
+        while row != self.root:
+            row = self.next_hop[row]
+            path.append(self.graph.nodes[row])
+
+        return path
+
+class CoolingAwareRouter:
+    """
+    Multi-hop Routing Algorithm with Cooling Period Optimization
+    Implements Research objective for efficient data transmission
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self.routing_history = []
+        self.communication_graph = None  # Built lazily on first route search
+        self.ch_path_trees = {}  # CH id -> ShortestPathTree for the current round
+        self.sink_tree = None  # ShortestPathTree toward the base station for the current round
+        self.dijkstra_expansions = 0  # Vertices settled by all route searches (profiling counter)
+
+        # Transmission costs (research-calibrated values)
+        self.transmission_costs = {
+            'energy_per_bit_per_meter': 50e-12,  # 50 pJ/bit/m
+            'energy_amplifier': 10e-12,          # 10 pJ/bit/m²
+            'energy_electronics': 50e-9,         # 50 nJ/bit
+            'max_transmission_range': 75.0       # Maximum transmission range (meters)
+        }
+
+    def calculate_transmission_energy(self, sender, receiver, data_size=1):
+        """
+        Calculate energy required for transmission between two nodes
+        E_tx = E_elec × k + ε_amp × k × d²
+        """
+        distance = sender.distance(receiver)
+
+        if distance > self.transmission_costs['max_transmission_range']:
+            return float('inf')  # Cannot transmit beyond range
+
+        # Electronics energy
+        e_elec = self.transmission_costs['energy_electronics'] * data_size
+
+        # Amplifier energy (d² for short distances)
+        e_amp = (self.transmission_costs['energy_amplifier'] *
+                data_size * distance ** 2)
+
+        total_energy = e_elec + e_amp
+        return total_energy * 1e9  # Convert to nanojoules
+
+    def link_energy(self, sender, receiver, data_size=1):
+        """
+        Transmission energy and distance over a communication-graph link
+        The per-unit link energy is precomputed and scaled by data_size; energy
+        is inf (distance None) if the nodes share no live link
+        """
+        graph = self.get_communication_graph()
+        try:
+            distance, energy = graph.link(graph.index_of[sender.id], graph.index_of[receiver.id])
+        except KeyError:
+            return float('inf'), None
+        return energy * data_size, distance
+
+    def calculate_route_cost(self, path, current_time, data_size=1):
+        """
+        Calculate comprehensive routing cost for a given path
+        Considers cooling periods, energy consumption, and path length
+        """
+        if len(path) < 2:
+            return float('inf')
+
+        total_cost = 0
+        path_valid = True
+
+        for i in range(len(path) - 1):
+            sender = path[i]
+            receiver = path[i + 1]
+
+            # Check if sender can transmit (not in cooling period)
+            if not sender.can_transmit(current_time):
+                path_valid = False
+                total_cost += 1000  # Heavy penalty for cooling violation
+
+            # Energy cost for transmission
+            energy_cost = self.calculate_transmission_energy(sender, receiver, data_size)
+            if energy_cost == float('inf'):
+                path_valid = False
+                break
+
+            # Distance cost
+            distance_cost = sender.distance(receiver)
+
+            # Cooling penalty if sender will enter cooling period
+            cooling_penalty = 0
+            remaining_cooling = sender.remaining_cooling(current_time)
+            if remaining_cooling > 0:
+                cooling_penalty = remaining_cooling * 100
+
+            # Node energy level (prefer nodes with higher energy)
+            energy_penalty = max(0, (3.0 - sender.energy) * 50)
+
+            total_cost += energy_cost + distance_cost + cooling_penalty + energy_penalty
+
+        return total_cost if path_valid else float('inf')
+
+    def get_communication_graph(self):
+        """Return the CSR communication graph, building it on first use"""
+        if self.communication_graph is None:
+            self.communication_graph = CommunicationGraph(
+                self.network, self.transmission_costs['max_transmission_range'],
+                energy_electronics=self.transmission_costs['energy_electronics'],
+                energy_amplifier=self.transmission_costs['energy_amplifier'],
+                sink=self.network.base_station)
+            for node in self.network.nodes:
+                node.add_state_observer(self.communication_graph.on_node_state_change)
+        return self.communication_graph
+
+    def build_path_tree(self, cluster_head, current_time):
+        """Build the reverse shortest-path tree rooted at a cluster head"""
+        graph = self.get_communication_graph()
+        tree = self._build_reverse_tree(graph, graph.index_of[cluster_head.id], current_time)
+        self.ch_path_trees[cluster_head.id] = tree
+        return tree
+
+    def build_sink_tree(self, current_time):
+        """Build the reverse shortest-path tree rooted at the base station vertex"""
+        graph = self.get_communication_graph()
+        self.sink_tree = self._build_reverse_tree(graph, graph.sink, current_time)
+        return self.sink_tree
+
+    def _build_reverse_tree(self, graph, root, current_time):
+        """
+        One Dijkstra over reversed links gives every node its cheapest path to root,
+        weighting each link by the sender's transmission energy, link distance
+        and cooling penalty
+        """
+        costs = {root: 0}
+        next_hop = {}
+        visited = set()
+        can_send = {}  # Memoized transmit checks (one per node per build)
+        heap = [(0, root)]
+
+        while heap:
+            current_cost, current = heapq.heappop(heap)
+            if current in visited:
+                continue
+
+            visited.add(current)
+            sender_rows, link_distances, link_energies = graph.neighbors(current)
+
+            for sender_row, distance_cost, transmission_cost in zip(
+                    sender_rows, link_distances, link_energies):
+                if sender_row in visited:
+                    continue
+
+                sender = graph.nodes[sender_row]
+                if sender_row not in can_send:
+                    can_send[sender_row] = sender.alive and sender.can_transmit(current_time)
+                if not can_send[sender_row]:
+                    continue
+
+                alt_cost = (current_cost + transmission_cost + distance_cost +
+                            sender.remaining_cooling(current_time) * 100)
+
+                if alt_cost < costs.get(sender_row, float('inf')):
+                    costs[sender_row] = alt_cost
+                    next_hop[sender_row] = current
+                    heapq.heappush(heap, (alt_cost, sender_row))
+
+        self.dijkstra_expansions += len(visited)
+        return ShortestPathTree(graph, root, next_hop, costs, current_time)
+
+    def find_path_to_cluster_head(self, cluster_member, cluster_head, current_time):
+        """
+        Find a member's path to its CH by walking the CH's shortest-path tree
+        The tree is built once per CH per round and rebuilt only if a node on
+        the walked path has started cooling since it was built
+        """
+        tree = self.ch_path_trees.get(cluster_head.id)
+        if tree is None or tree.built_at != current_time:
+            tree = self.build_path_tree(cluster_head, current_time)
+
+        path = tree.path_from(cluster_member)
+        if path and not all(node.can_transmit(current_time) for node in path[:-1]):
+            tree = self.build_path_tree(cluster_head, current_time)
+            path = tree.path_from(cluster_member)
+
+        if not path or len(path) < 2:
+            return None
+
+        return path
+
+    def transmit_data_along_path(self, path, current_time, data_size=1):
+        """
+        Execute data transmission along the calculated path
+        Returns success status and transmission details
+        """
+        if not path or len(path) < 2:
+            return False, {"error": "Invalid path"}
+
+        transmission_log = {
+            'path_length': len(path),
+            'hops': [],
+            'total_energy_consumed': 0,
+            'transmission_delays': [],
+            'cooling_violations': 0,
+            'success': False
+        }
+
+        # Execute transmission hop by hop
+        for i in range(len(path) - 1):
+            sender = path[i]
+            receiver = path[i + 1]
+
+            # Check transmission capability
+            if not sender.can_transmit(current_time):
+                transmission_log['cooling_violations'] += 1
+                # Wait for cooling period to end
+                wait_time = sender.remaining_cooling(current_time)
+                current_time += wait_time
+                transmission_log['transmission_delays'].append(wait_time)
+
+            # Transmission energy from the precomputed link table
+            energy_cost, distance = self.link_energy(sender, receiver, data_size)
+
+            if energy_cost == float('inf') or sender.energy < energy_cost:
+                transmission_log['error'] = f"Insufficient energy at node {sender.id}"
+                return False, transmission_log
+
+            # Perform transmission
+            if sender.transmit_data(current_time, data_size):
+                sender.consume_energy(energy_cost)
+                transmission_log['total_energy_consumed'] += energy_cost
+
+                hop_info = {
+                    'sender_id': sender.id,
+                    'receiver_id': receiver.id,
+                    'distance': distance,
+                    'energy_cost': energy_cost,
+                    'transmission_time': current_time
+                }
+                transmission_log['hops'].append(hop_info)
+
+                # Small delay for processing
+                current_time += 0.1
+            else:
+                transmission_log['error'] = f"Transmission failed at node {sender.id}"
+                return False, transmission_log
+
+        transmission_log['success'] = True
+        return True, transmission_log
+
+    def route_cluster_data_to_ch(self, cluster_member, cluster_head, current_time):
+        """
+        Route data from cluster member to cluster head
+        """
+        # Direct transmission if within range
+        if (cluster_member.distance(cluster_head) <=
+            self.transmission_costs['max_transmission_range'] and
+            cluster_member.can_transmit(current_time)):
+
+            success, log = self.transmit_data_along_path(
+                [cluster_member, cluster_head], current_time)
+            return success, log
+
+        # Multi-hop transmission along the CH's shortest-path tree
+        path = self.find_path_to_cluster_head(cluster_member, cluster_head, current_time)
+        if path:
+            success, log = self.transmit_data_along_path(path, current_time)
+            return success, log
+
+        return False, {"error": "No path to cluster head"}
+
+    def find_path_to_base_station(self, cluster_head, current_time):
+        """
+        Find a CH's path to the base station by walking the sink tree
+        The tree is built once per round and rebuilt only if a node on the
+        walked path has started cooling since it was built (e.g. as a relay
+        for another CH)
+        """
+        tree = self.sink_tree
+        if tree is None or tree.built_at != current_time:
+            tree = self.build_sink_tree(current_time)
+
+        path = tree.path_from(cluster_head)
+        if path and not all(node.can_transmit(current_time) for node in path[:-1]):
+            tree = self.build_sink_tree(current_time)
+            path = tree.path_from(cluster_head)
+
+        if not path or len(path) < 2:
+            return None
+
+        return path
+
+    def route_ch_data_to_bs(self, cluster_head, current_time, aggregated_data_size=5):
+        """
+        Route aggregated data from cluster head to base station
+        Multi-hop over the cooling-penalized sink tree; each relay forwards 0.1
+        time units after the previous hop
+        """
+        path = self.find_path_to_base_station(cluster_head, current_time)
+        if path is None:
+            return False, {"error": "No path to base station"}
+
+        graph = self.get_communication_graph()
+        hops = []
+        total_energy = 0.0
+
+        for hop, (sender, receiver) in enumerate(zip(path[:-1], path[1:])):
+            # Links are looked up from the receiver side (sink links live only in the
+            # sink row), before transmitting: a sender drained by its transmission
+            # leaves the graph
+            receiver_row = graph.sink if receiver is self.network.base_station else graph.index_of[receiver.id]
+            try:
+                _, energy = graph.link(receiver_row, graph.index_of[sender.id])
+            except KeyError:
+                return False, {"error": f"No link from node {sender.id}", 'hops': hops}
+
+            if not sender.transmit_data(current_time + 0.1 * hop, aggregated_data_size):
+                return False, {"error": f"Transmission failed at node {sender.id}", 'hops': hops}
+
+            total_energy += energy * aggregated_data_size
+            hops.append({'sender_id': sender.id,
+                         'receiver_id': 'BS' if receiver_row == graph.sink else receiver.id})
+
+        # Base station receives the CH's data
+        sensor_data = cluster_head.sense_environment(current_time)
+        self.network.base_station.receive_data(cluster_head, sensor_data, current_time)
+
+        return True, {
+            'hops': hops,
+            'success': True,
+            'path_length': len(hops),
+            'total_energy_consumed': total_energy
+        }
+
+    def execute_full_network_routing(self, current_time):
+        """
+        Execute complete network routing cycle:
+        1. Cluster members → Cluster heads
+        2. Cluster heads → Base station
+        """
+        routing_statistics = {
+            'member_to_ch_success': 0,
+            'member_to_ch_failed': 0,
+            'ch_to_bs_success': 0,
+            'ch_to_bs_failed': 0,
+            'total_energy_consumed': 0,
+            'total_cooling_violations': 0,
+            'average_path_length': 0,
+            'routing_efficiency': 0
+        }
+
+        print(f"\n Network Routing Cycle - Time {current_time}")
+
+        # Phase 1: Route data from cluster members to cluster heads
+        member_transmissions = []
+        alive_by_id = {node.id: node for node in self.network.alive_nodes}
+        for node in self.network.alive_nodes:
+            if not node.is_CH and node.cluster_id is not None:
+                # Find cluster head
+                ch_node = alive_by_id.get(node.cluster_id)
+
+                if ch_node and ch_node.alive:
+                    success, log = self.route_cluster_data_to_ch(node, ch_node, current_time)
+                    member_transmissions.append((success, log))
+
+                    if success:
+                        routing_statistics['member_to_ch_success'] += 1
+                        routing_statistics['total_energy_consumed'] += log.get('total_energy_consumed', 0)
+                        routing_statistics['total_cooling_violations'] += log.get('cooling_violations', 0)
+                    else:
+                        routing_statistics['member_to_ch_failed'] += 1
+
+        # Phase 2: Route aggregated data from cluster heads to base station
+        ch_transmissions = []
+        for region_id, region_info in self.network.regions.items():
+            ch_node = region_info.get('CH')
+            if ch_node and ch_node.alive:
+                success, log = self.route_ch_data_to_bs(ch_node, current_time)
+                ch_transmissions.append((success, log))
+
+                if success:
+                    routing_statistics['ch_to_bs_success'] += 1
+                else:
+                    routing_statistics['ch_to_bs_failed'] += 1
+
+        # Calculate routing efficiency
+        total_attempts = (routing_statistics['member_to_ch_success'] +
+                         routing_statistics['member_to_ch_failed'] +
+                         routing_statistics['ch_to_bs_success'] +
+                         routing_statistics['ch_to_bs_failed'])
+
+        total_successes = (routing_statistics['member_to_ch_success'] +
+                          routing_statistics['ch_to_bs_success'])
+
+        routing_statistics['routing_efficiency'] = (total_successes / total_attempts
+                                                   if total_attempts > 0 else 0)
+
+        # Average path length
+        successful_logs = [log for success, log in member_transmissions + ch_transmissions if success]
+        if successful_logs:
+            routing_statistics['average_path_length'] = np.mean([
+                log.get('path_length', 1) for log in successful_logs
+            ])
+
+        print(f"    Member→CH: {routing_statistics['member_to_ch_success']} success, "
+              f"{routing_statistics['member_to_ch_failed']} failed")
+        print(f"    CH→BS: {routing_statistics['ch_to_bs_success']} success, "
+              f"{routing_statistics['ch_to_bs_failed']} failed")
+        print(f"    Energy consumed: {routing_statistics['total_energy_consumed']:.4f}")
+        print(f"    Cooling violations: {routing_statistics['total_cooling_violations']}")
+        print(f"    Routing efficiency: {routing_statistics['routing_efficiency']:.2%}")
+
+        return routing_statistics
@@ -0,0 +1,47 @@
+"""Streaming aggregates for per-round algorithm statistics"""
+from math import sqrt
+
+
+class RunningStatistics:
+    """
+    O(1) streaming count / mean / variance (Welford) plus sum, extremes and
+    first/last values, so history statistics never rescan the history
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.first = None
+        self.last = None
+
+    def update(self, value):
+        """Add one observation"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.total += value
+
+        if self.count == 1:
+            self.first = self.minimum = self.maximum = value
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+        self.last = value
+
+    @property
+    def variance(self):
+        """Population variance (matches np.var)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        return sqrt(self.variance)
+
+    def trend(self):
+        """'improving' if the latest value exceeds the first one, else 'stable'"""
+        return 'improving' if self.count > 1 and self.last > self.first else 'stable'
@@ -0,0 +1,205 @@
+"""Multi-round simulation driver"""
+import contextlib
+
+import numpy as np
+
+from .history import MetricStore
+
+# Per-round columns recorded by run_comprehensive_simulation
+ROUND_FIELDS = {
+    'round': np.int64,
+    'alive_nodes': np.int64,
+    'total_energy': np.float64,
+    'cooling_violations': np.int64,
+    'average_cooling_period': np.float64,
+    'coverage_efficiency': np.float64,
+    'union_coverage': np.float64,
+    'successful_transmissions': np.int64,
+    'failed_transmissions': np.int64,
+    'sensor_data_collected': np.int64,
+    'actuator_commands_sent': np.int64,
+    'optimization_effectiveness': np.float64,
+    'energy_efficiency': np.float64,
+    'routing_efficiency': np.float64,
+}
+
+ROUTING_FIELDS = {
+    'member_to_ch_success': np.int64,
+    'member_to_ch_failed': np.int64,
+    'ch_to_bs_success': np.int64,
+    'ch_to_bs_failed': np.int64,
+    'total_energy_consumed': np.float64,
+    'total_cooling_violations': np.int64,
+    'average_path_length': np.float64,
+    'routing_efficiency': np.float64,
+}
+
+# Scalar fields of the cumulative selection / optimization statistics per round
+CH_SELECTION_FIELDS = {
+    'total_selections': np.int64,
+    'average_selection_cost': np.float64,
+    'selection_cost_std': np.float64,
+    'average_cooling_penalty': np.float64,
+    'cooling_violations': np.int64,
+    'selection_efficiency': np.float64,
+}
+
+SLEEP_OPTIMIZATION_FIELDS = {
+    'total_optimization_cycles': np.int64,
+    'total_energy_saved': np.float64,
+    'average_redundant_nodes': np.float64,
+    'average_coverage_impact': np.float64,
+    'coverage_impact_std': np.float64,
+    'algorithm_effectiveness': np.float64,
+}
+
+class NullProfiler:
+    """Profiler stand-in used when profiling is off (see profiling.SimulationProfiler)"""
+
+    _phase = contextlib.nullcontext()
+
+    def attach(self, network, ch_selector, router, sleep_optimizer):
+        pass
+
+    def begin_round(self, round_num):
+        pass
+
+    def phase(self, name):
+        return self._phase
+
+    def end_round(self):
+        pass
+
+def run_comprehensive_simulation(network, ch_selector, router, sleep_optimizer, num_rounds=50,
+                                 profiler=None):
+    """
+    Run comprehensive multi-round simulation to validate Cooling Period Minimization algorithms
+    Per-round results are columnar MetricStores (memory-mapped under network.history_dir if set)
+    A SimulationProfiler (see profiling.py) records per-phase timings and hot-path counters
+    """
+    print(" Starting Comprehensive Network Simulation...")
+    print(f"    Simulation rounds: {num_rounds}")
+    print(f"    Objectives: Cooling period minimization & energy optimization")
+
+    def store(fields, name):
+        directory = None if network.history_dir is None else f'{network.history_dir}/{name}'
+        return MetricStore(fields, capacity=num_rounds, directory=directory)
+
+    simulation_results = {
+        'round_data': store(ROUND_FIELDS, 'rounds'),
+        'performance_metrics': {
+            'network_lifetime_events': []
+        },
+        'algorithm_performance': {
+            'ch_selection_stats': store(CH_SELECTION_FIELDS, 'ch_selection'),
+            'routing_stats': store(ROUTING_FIELDS, 'routing'),
+            'sleep_optimization_stats': store(SLEEP_OPTIMIZATION_FIELDS, 'sleep_optimization')
+        }
+    }
+
+    profiler = NullProfiler() if profiler is None else profiler
+    profiler.attach(network, ch_selector, router, sleep_optimizer)
+
+    # Run simulation rounds
+    for round_num in range(1, num_rounds + 1):
+        print(f"\n === ROUND {round_num} ===")
+        profiler.begin_round(round_num)
+
+        # Update network time
+        network.current_time = round_num
+        network.metrics['round'] = round_num
+
+        # Update cooling periods (expiry events plus nodes still cooling)
+        with profiler.phase('cooling_update'):
+            network.process_cooling_expiry(network.current_time)
+
+        # Phase 1: Cluster Head Selection with cooling optimization
+        with profiler.phase('ch_selection'):
+            selected_chs = ch_selector.perform_cluster_head_selection(network.current_time)
+
+        # Phase 2: Multi-hop routing with cooling awareness
+        with profiler.phase('routing'):
+            routing_stats = router.execute_full_network_routing(network.current_time)
+
+        # Phase 3: Sleep-wake coverage optimization (Cooling Period Minimization Algorithm)
+        with profiler.phase('sleep_wake'):
+            optimization_results = sleep_optimizer.execute_sleep_wake_optimization(network.current_time)
+
+        # Phase 4: Sensor data collection and actuator control
+        # (batched: one draw for all sensing nodes, vectorized actuator rules)
+        with profiler.phase('sensing'):
+            sensing_rows = network.node_arrays.sensing_rows()
+            readings = network.node_arrays.sense_environment(
+                sensing_rows, network.current_time, rng=network.rng)
+            sensor_data_collected = len(sensing_rows)
+
+            commands = network.base_station.generate_actuator_commands_batch(readings)
+            actuator_commands_sent = network.node_arrays.control_actuators(sensing_rows, commands)
+
+        # Update network metrics
+        with profiler.phase('metrics'):
+            network.calculate_network_metrics()
+            network.update_history()
+
+        # Record round data (one columnar append)
+        simulation_results['round_data'].append({
+            'round': round_num,
+            'alive_nodes': network.metrics['alive_nodes'],
+            'total_energy': network.metrics['total_energy'],
+            'cooling_violations': network.metrics['cooling_violations'],
+            'average_cooling_period': network.metrics['average_cooling_period'],
+            'coverage_efficiency': network.metrics['coverage_efficiency'],
+            'union_coverage': network.metrics['union_coverage'],
+            'successful_transmissions': network.metrics['successful_transmissions'],
+            'failed_transmissions': network.metrics['failed_transmissions'],
+            'sensor_data_collected': sensor_data_collected,
+            'actuator_commands_sent': actuator_commands_sent,
+            'optimization_effectiveness': optimization_results['cooling_improvements']['optimization_effectiveness'],
+            'energy_efficiency': optimization_results['cooling_improvements']['energy_efficiency'],
+            'routing_efficiency': routing_stats['routing_efficiency']
+        })
+
+        # Record algorithm-specific statistics
+        simulation_results['algorithm_performance']['ch_selection_stats'].append(
+            ch_selector.get_selection_statistics())
+        simulation_results['algorithm_performance']['routing_stats'].append(routing_stats)
+        simulation_results['algorithm_performance']['sleep_optimization_stats'].append(
+            sleep_optimizer.get_optimization_statistics())
+
+        # Check for network lifetime events
+        if network.metrics['network_lifetime'] > 0 and len(simulation_results['performance_metrics']['network_lifetime_events']) == 0:
+            simulation_results['performance_metrics']['network_lifetime_events'].append({
+                'event': 'first_node_death',
+                'round': round_num,
+                'remaining_nodes': network.metrics['alive_nodes']
+            })
+
+        # Progress indicator
+        if round_num % 10 == 0:
+            print(f"    Progress: {round_num}/{num_rounds} rounds completed")
+            print(f"       Alive nodes: {network.metrics['alive_nodes']}")
+            print(f"       Total energy: {network.metrics['total_energy']:.2f}")
+            print(f"       Cooling violations: {network.metrics['cooling_violations']}")
+
+        profiler.end_round()
+
+    # Trend series are views over the round columns (no copies)
+    round_data = simulation_results['round_data']
+    simulation_results['performance_metrics'].update({
+        'cooling_violations_trend': round_data['cooling_violations'],
+        'energy_efficiency_trend': round_data['energy_efficiency'],
+        'coverage_efficiency_trend': round_data['coverage_efficiency'],
+        'optimization_effectiveness': round_data['optimization_effectiveness']
+    })
+
+    # Final cumulative statistics, including the nested breakdowns
+    simulation_results['algorithm_performance']['ch_selection_summary'] = ch_selector.get_selection_statistics()
+    simulation_results['algorithm_performance']['sleep_optimization_summary'] = (
+        sleep_optimizer.get_optimization_statistics())
+
+    for metric_store in [round_data, *simulation_results['algorithm_performance'].values()]:
+        if isinstance(metric_store, MetricStore):
+            metric_store.flush()
+
+    print(f"\n🏁 Simulation Complete! {num_rounds} rounds executed.")
+    return simulation_results
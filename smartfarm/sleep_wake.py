@@ -0,0 +1,708 @@
+"""Sleep-wake coverage optimization (cooling period minimization algorithm)"""
+import heapq
+from math import pi
+
+import numpy as np
+
+from .nodes import STATE_CODES, NodeState
+from .running_stats import RunningStatistics
+
+
+class _CandidateDiscs:
+    """
+    Lattice coverage of sensing discs during one sleep selection
+    Tracked discs are the redundant candidates' and the sleepers' (nodes
+    asleep, scheduled to sleep or selected this cycle): per disc, the lattice
+    points (unit lattice scaled to the node's radius) and how many awake
+    neighbors cover each point. Discs are built on first use, so only discs
+    near a decision are ever evaluated
+    """
+
+    __slots__ = ('optimizer', 'candidates', 'index', 'unit_points', 'positions', 'radius',
+                 'max_radius', 'awake', 'discs', 'sleepers')
+
+    def __init__(self, optimizer, candidates, sleepers=()):
+        network = optimizer.network
+        arrays = network.node_arrays
+        index = network.spatial_index
+
+        self.optimizer = optimizer
+        self.candidates = candidates
+        self.index = index
+        self.unit_points = optimizer._unit_lattice()
+        self.positions = np.zeros((arrays.size, 2))
+        self.positions[index.rows] = index.positions
+        self.radius = arrays.column('sensing_radius').copy()  # Radii after this cycle's reductions
+        self.max_radius = self.radius.max() if arrays.size else 0.0
+        self.awake = arrays.column('alive') & (arrays.column('state') != STATE_CODES[NodeState.SLEEP])
+        self.discs = {}                # row -> [points, cover counts, initial uncovered fraction]
+        self.sleepers = set(sleepers)  # Rows whose discs rely on awake neighbors
+        self.awake[list(self.sleepers)] = False
+
+    def disc(self, row):
+        if row not in self.discs:
+            points = self.positions[row] + self.unit_points * self.radius[row]
+            neighbor_rows = self._overlapping(row)
+            neighbor_rows = neighbor_rows[self.awake[neighbor_rows]]
+
+            distance_sq = ((points[:, None, :] - self.positions[neighbor_rows][None, :, :])**2).sum(axis=-1)
+            counts = (distance_sq <= self.radius[neighbor_rows]**2).sum(axis=1)
+            self.optimizer.overlap_computations += len(neighbor_rows)
+
+            self.discs[row] = [points, counts, (counts == 0).mean()]
+        return self.discs[row]
+
+    def _overlapping(self, row):
+        """Rows whose sensing disc may overlap row's (spatial index; neighbor lists can lag radius changes)"""
+        x, y = self.positions[row]
+        rows = np.array([node._row for node in
+                         self.index.query_radius(x, y, self.radius[row] + self.max_radius)],
+                        dtype=np.int64)
+        return rows[rows != row]
+
+    def uncovered(self, row, lost=None):
+        """Uncovered fraction of a disc (after also losing the lost points)"""
+        counts = self.disc(row)[1]
+        return ((counts if lost is None else counts - lost) == 0).mean()
+
+    def unique_coverage(self, row):
+        """Estimated U(i), shifted by the lattice coverage the disc lost this cycle"""
+        _, counts, initial = self.disc(row)
+        return self.candidates[row]['unique_coverage'] + (counts == 0).mean() - initial
+
+    def losses(self, row, kept_radius):
+        """[(row, lost points)] of neighboring tracked discs that row stops covering at kept_radius"""
+        losses = []
+        for neighbor_row in self._overlapping(row).tolist():
+            if neighbor_row not in self.candidates and neighbor_row not in self.sleepers:
+                continue
+            distance_sq = ((self.disc(neighbor_row)[0] - self.positions[row])**2).sum(axis=1)
+            lost = (distance_sq <= self.radius[row]**2) & (distance_sq > kept_radius**2)
+            self.optimizer.overlap_computations += 1
+            if lost.any():
+                losses.append((neighbor_row, lost))
+        return losses
+
+    def apply(self, row, losses, kept_radius):
+        """Commit a decision: row sleeps (kept_radius 0) or keeps a reduced radius"""
+        for neighbor_row, lost in losses:
+            self.discs[neighbor_row][1] -= lost
+        self.radius[row] = kept_radius
+        if kept_radius == 0:
+            self.sleepers.add(row)
+            self.awake[row] = False
+
+class SleepWakeCoverageOptimizer:
+    """
+    Implementation: Cooling Period Minimization Algorithm
+
+    This class implements the novel sleep-wake coverage optimization algorithm
+    that minimizes cooling period violations while maintaining network coverage.
+
+    Research Contribution: Phase 3 Algorithm for Cooling Period Minimization
+    """
+
+    COVERAGE_ESTIMATORS = ('analytic', 'monte_carlo', 'grid')
+
+    def __init__(self, network, coverage_estimator='analytic', coverage_samples=50,
+                 grid_points_per_radius=10, rng=None):
+        self.network = network
+        self.coverage_threshold = 0.85  # Minimum coverage requirement (85%)
+        self.redundancy_threshold = 0.6  # Coverage overlap threshold for redundancy
+
+        # Unique-coverage estimator U(i): pairwise analytic overlaps, Monte Carlo
+        # sampling (M points per node) or a deterministic lattice per sensing disc
+        if coverage_estimator not in self.COVERAGE_ESTIMATORS:
+            raise ValueError(f"coverage_estimator must be one of {self.COVERAGE_ESTIMATORS}")
+        self.coverage_estimator = coverage_estimator
+        self.coverage_samples = coverage_samples
+        self.grid_points_per_radius = grid_points_per_radius
+        self.rng = rng if rng is not None else np.random.default_rng(42)
+
+        # Optimization parameters (research-calibrated)
+        self.sleep_duration_min = 5.0    # Minimum sleep duration (time units)
+        self.sleep_duration_max = 20.0   # Maximum sleep duration (time units)
+        self.cooling_optimization_factor = 0.8  # Factor for cooling period consideration
+        self.radius_reduction_factor = 0.9  # Sensing radius kept by moderately redundant nodes
+        self.max_sleep_fraction = 0.2    # f_max: at most 20% of alive nodes sleep per cycle
+
+        # Algorithm tracking
+        self.optimization_history = []
+
+        # Streaming aggregates over optimization_history (O(1) statistics)
+        self.redundant_candidate_stats = RunningStatistics()
+        self.coverage_impact_stats = RunningStatistics()
+        self.energy_savings_stats = RunningStatistics()
+        self.region_efficiency_stats = {}
+        self.coverage_analysis_cache = {}
+        self.overlap_computations = 0  # Pairwise disc overlaps evaluated (profiling counter)
+
+        print(" Algorithm Initialized: Cooling Period Minimization")
+        print(f"    Coverage threshold: {self.coverage_threshold:.1%}")
+        print(f"    Redundancy threshold: {self.redundancy_threshold:.1%}")
+        print(f"    Sleep duration range: {self.sleep_duration_min}-{self.sleep_duration_max} time units")
+        print(f"    Coverage estimator: {self.coverage_estimator}")
+
+    def calculate_node_coverage_contribution(self, node, current_time):
+        """
+        Calculate how much unique coverage a node provides
+        Critical for determining redundancy without coverage loss
+        """
+        if not node.alive or node.state == NodeState.SLEEP:
+            return 0.0
+
+        # Base coverage area
+        node_coverage = pi * (node.sensing_radius ** 2)
+
+        # Calculate overlapping coverage with neighbors
+        total_overlap = 0.0
+        for neighbor in node.neighbor_nodes:
+            if (neighbor.alive and neighbor.state != NodeState.SLEEP and
+                neighbor.id != node.id):
+
+                overlap_area = node._calculate_overlap_area(neighbor, node.distance(neighbor))
+                total_overlap += overlap_area
+                self.overlap_computations += 1
+
+        # Unique coverage contribution
+        unique_coverage = max(0, node_coverage - total_overlap)
+        coverage_contribution = unique_coverage / node_coverage if node_coverage > 0 else 0
+
+        return coverage_contribution
+
+    def estimate_unique_coverage(self, nodes, current_time):
+        """
+        Estimate unique coverage U(i) for a batch of active nodes
+        Returns ({node id: U(i)}, {node id: error bound}); the analytic
+        pairwise estimator has no error bound (None)
+        """
+        if self.coverage_estimator == 'analytic':
+            contributions = {node.id: self.calculate_node_coverage_contribution(node, current_time)
+                             for node in nodes}
+            return contributions, {node.id: None for node in nodes}
+
+        if self.coverage_estimator == 'monte_carlo':
+            # M uniform points per disc (area-uniform polar sampling on the unit disc)
+            radius = np.sqrt(self.rng.random((len(nodes), self.coverage_samples)))
+            angle = self.rng.random((len(nodes), self.coverage_samples)) * 2 * pi
+            unit_points = np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=-1)
+        else:
+            # Deterministic lattice with grid_points_per_radius steps across the radius
+            lattice = self._unit_lattice()
+            unit_points = np.broadcast_to(lattice, (len(nodes),) + lattice.shape)
+
+        uncovered, near_boundary = self._sample_unique_coverage(
+            nodes, unit_points, track_boundary=(self.coverage_estimator == 'grid'))
+        samples = unit_points.shape[1]
+
+        if self.coverage_estimator == 'monte_carlo':
+            # 95% confidence half-width of a binomial proportion (Agresti-Coull,
+            # so nodes sampled as fully covered or fully unique still get a bound)
+            adjusted = (uncovered * samples + 2) / (samples + 4)
+            errors = 1.96 * np.sqrt(adjusted * (1 - adjusted) / (samples + 4))
+        else:
+            # Lattice points too close to a disc boundary to classify reliably
+            errors = near_boundary
+
+        ids = [node.id for node in nodes]
+        return dict(zip(ids, uncovered.tolist())), dict(zip(ids, errors.tolist()))
+
+    def _sample_unique_coverage(self, nodes, unit_points, track_boundary=False, chunk_size=4_000_000):
+        """
+        Batched point test behind the sampling estimators
+        unit_points (nodes x S x 2) are offsets in the unit disc, scaled by each
+        node's radius. A point is covered if any other active node's disc holds it.
+        Candidate pairs come from one spatial-index query, then every point of
+        every pair is tested as array operations (in memory-bounded chunks).
+        Returns per-node uncovered fraction and (if track_boundary) the
+        fraction of points lying within half a lattice diagonal of a boundary.
+        """
+        if not nodes:
+            return np.zeros(0), np.zeros(0)
+
+        arrays = self.network.node_arrays
+        index = self.network.spatial_index
+        radius = arrays.column('sensing_radius')
+        active = arrays.column('alive') & (arrays.column('state') != STATE_CODES[NodeState.SLEEP])
+        positions = np.zeros((arrays.size, 2))
+        positions[index.rows] = index.positions
+
+        node_rows = np.array([node._row for node in nodes], dtype=np.int64)
+        slot = np.full(arrays.size, -1, dtype=np.int64)
+        slot[node_rows] = np.arange(len(nodes))
+
+        samples = unit_points.shape[1]
+        points = positions[node_rows][:, None, :] + unit_points * radius[node_rows][:, None, None]
+
+        # Only lattice points near a circle boundary are ambiguous (grid estimator)
+        half_diagonal = radius[node_rows] / (self.grid_points_per_radius * np.sqrt(2))
+        own_distance = np.sqrt((unit_points**2).sum(axis=-1)) * radius[node_rows][:, None]
+        near_boundary = np.abs(own_distance - radius[node_rows][:, None]) < half_diagonal[:, None]
+
+        # Overlapping active pairs (a is an estimated node, b covers part of it)
+        max_radius = radius[active].max() if active.any() else 0.0
+        pairs = index.tree.query_pairs(2 * max_radius, output_type='ndarray')
+        a = np.concatenate([index.rows[pairs[:, 0]], index.rows[pairs[:, 1]]])
+        b = np.concatenate([index.rows[pairs[:, 1]], index.rows[pairs[:, 0]]])
+        distance = np.sqrt(((positions[a] - positions[b])**2).sum(axis=1))
+        keep = (slot[a] >= 0) & active[b] & (distance < radius[a] + radius[b])
+        a, b = a[keep], b[keep]
+        order = np.argsort(slot[a], kind='stable')
+        a, b = a[order], b[order]
+        self.overlap_computations += len(a)
+
+        covered = np.zeros((len(nodes), samples), dtype=bool)
+        pairs_per_chunk = max(1, chunk_size // max(1, samples))
+
+        for start in range(0, len(a), pairs_per_chunk):
+            chunk_a, chunk_b = a[start:start + pairs_per_chunk], b[start:start + pairs_per_chunk]
+            chunk_slots = slot[chunk_a]
+
+            distance_to_b = np.sqrt(((points[chunk_slots] - positions[chunk_b][:, None, :])**2).sum(axis=-1))
+            hits = distance_to_b <= radius[chunk_b][:, None]
+
+            # Pairs are sorted by slot, so OR-reduce each run of equal slots
+            starts = np.flatnonzero(np.r_[True, chunk_slots[1:] != chunk_slots[:-1]])
+            run_slots = chunk_slots[starts]
+            covered[run_slots] |= np.logical_or.reduceat(hits, starts, axis=0)
+
+            if track_boundary:
+                ambiguous = (np.abs(distance_to_b - radius[chunk_b][:, None]) <
+                             half_diagonal[chunk_slots][:, None])
+                near_boundary[run_slots] |= np.logical_or.reduceat(ambiguous, starts, axis=0)
+
+        return 1.0 - covered.mean(axis=1), near_boundary.mean(axis=1)
+
+    def analyze_coverage_redundancy(self, current_time):
+        """
+        Analyze network coverage to identify redundant nodes
+        Implements core research algorithm for redundancy detection
+        """
+        redundant_candidates = []
+        coverage_analysis = {
+            'total_coverage_area': 0,
+            'unique_coverage_per_node': {},
+            'redundancy_levels': {},
+            'critical_nodes': [],
+            'region_coverage': {}
+        }
+
+        active_by_region = {
+            region_id: [node for node in region_info['nodes']
+                        if node.alive and node.state != NodeState.SLEEP]
+            for region_id, region_info in self.network.regions.items()
+        }
+
+        # Estimate unique coverage for every active node in one batch
+        unique_coverage, unique_coverage_error = self.estimate_unique_coverage(
+            [node for region_nodes in active_by_region.values() for node in region_nodes],
+            current_time)
+        coverage_analysis['coverage_estimator'] = self.coverage_estimator
+        coverage_analysis['unique_coverage_per_node'] = unique_coverage
+        coverage_analysis['unique_coverage_error'] = unique_coverage_error
+
+        # Analyze coverage per region
+        for region_id, region_nodes in active_by_region.items():
+            if not region_nodes:
+                continue
+
+            region_coverage = 0
+            region_unique_coverage = {}
+
+            for node in region_nodes:
+                # Unique coverage contribution
+                unique_contribution = unique_coverage[node.id]
+                region_unique_coverage[node.id] = unique_contribution
+                region_coverage += node.coverage_area
+
+                # Identify redundant candidates
+                if (unique_contribution < self.redundancy_threshold and
+                    not node.is_CH and  # Never put CHs to sleep
+                    node.cooling_period < node.min_rest_period * 0.5):  # Not in critical cooling
+
+                    energy_factor = node.energy / node.initial_energy
+                    cooling_factor = 1.0 - (node.cooling_period / node.min_rest_period)
+                    combined_score = self._redundancy_score(unique_contribution, energy_factor,
+                                                            cooling_factor)
+
+                    redundant_candidates.append({
+                        'node': node,
+                        'redundancy_score': combined_score,
+                        'unique_coverage': unique_contribution,
+                        'energy_level': energy_factor,
+                        'cooling_status': cooling_factor
+                    })
+
+            coverage_analysis['region_coverage'][region_id] = {
+                'total_area': region_coverage,
+                'node_contributions': region_unique_coverage,
+                'coverage_efficiency': min(1.0, region_coverage / self.network.regions[region_id]['area'])
+            }
+
+        # Sort candidates by redundancy score (higher = more redundant)
+        redundant_candidates.sort(key=lambda x: x['redundancy_score'], reverse=True)
+
+        coverage_analysis['redundant_candidates'] = redundant_candidates
+        coverage_analysis['total_redundant_nodes'] = len(redundant_candidates)
+
+        return coverage_analysis
+
+    @staticmethod
+    def _redundancy_score(unique_coverage, energy_factor, cooling_factor):
+        """Combined redundancy score for optimization (higher = more redundant)"""
+        return (0.5 * (1.0 - unique_coverage) +
+                0.3 * (1 - energy_factor) +
+                0.2 * cooling_factor)
+
+    def _unit_lattice(self):
+        """Lattice offsets in the unit disc, grid_points_per_radius steps across the radius"""
+        steps = np.arange(-self.grid_points_per_radius, self.grid_points_per_radius + 1)
+        lattice = np.stack(np.meshgrid(steps, steps), axis=-1).reshape(-1, 2) / self.grid_points_per_radius
+        return lattice[(lattice**2).sum(axis=1) <= 1.0]
+
+    def select_sleep_candidates(self, redundant_candidates, max_selected):
+        """
+        Lazy-greedy, coverage-preserving selection of up to max_selected candidates
+
+        Candidates are taken in redundancy-score order from a priority queue.
+        Each candidate's disc is tracked as a lattice of points with the number
+        of awake neighbors covering each point, built when first needed. A
+        decision (sleep, or a radius reduction for moderately redundant nodes)
+        only decrements the counts of the discs overlapping the deciding node, so
+        their unique coverage U(i) is updated locally instead of re-estimated.
+        U(i) only grows, so scores only drop: affected queue entries are
+        re-scored when popped rather than immediately (lazy greedy). Nodes
+        already asleep or scheduled to sleep count as sleepers from the start
+        (candidates among them are not selected again). A decision is accepted
+        only if the disc of every sleeper it affects, the node's own included,
+        stays at least coverage_threshold covered by awake neighbors. Selecting
+        k nodes costs O(k * degree * log n).
+        Returns [(candidate, redundancy_score, unique_coverage)] in selection
+        order and the candidates rejected to preserve coverage
+        """
+        max_uncovered = 1.0 - self.coverage_threshold
+        candidates = {candidate['node']._row: candidate for candidate in redundant_candidates}
+        version = dict.fromkeys(candidates, 0)
+        queue = [(-candidate['redundancy_score'], order, 0, candidate['node']._row)
+                 for order, candidate in enumerate(redundant_candidates)]
+        heapq.heapify(queue)
+
+        arrays = self.network.node_arrays
+        asleep = np.flatnonzero(arrays.column('alive') &
+                                (arrays.column('state') == STATE_CODES[NodeState.SLEEP]))
+        scheduled = [node._row for node in self.network.event_queue.scheduled_nodes('sleep_start')
+                     if node.alive]
+
+        selected, rejected = [], []
+        discs = _CandidateDiscs(self, candidates, sleepers=[*asleep.tolist(), *scheduled])
+        pending = set(candidates) - discs.sleepers
+
+        while queue and len(selected) < max_selected:
+            negative_score, order, entry_version, row = heapq.heappop(queue)
+            if row not in pending:
+                continue
+
+            candidate = candidates[row]
+            if entry_version != version[row]:
+                # A neighbor decided since this entry was queued: re-score lazily
+                unique = discs.unique_coverage(row)
+                if unique >= self.redundancy_threshold:
+                    pending.discard(row)
+                    continue
+                score = self._redundancy_score(unique, candidate['energy_level'],
+                                               candidate['cooling_status'])
+                heapq.heappush(queue, (-score, order, version[row], row))
+                continue
+
+            pending.discard(row)
+            node, score = candidate['node'], -negative_score
+            sleeps = score > 0.6
+            kept_radius = 0.0 if sleeps else node.sensing_radius * self.radius_reduction_factor
+
+            # Lattice points of neighboring tracked discs this decision uncovers
+            losses = discs.losses(row, kept_radius)
+            if ((sleeps and discs.uncovered(row) > max_uncovered) or
+                    any(discs.uncovered(neighbor_row, lost) > max_uncovered
+                        for neighbor_row, lost in losses if neighbor_row in discs.sleepers)):
+                rejected.append(candidate)
+                continue
+
+            discs.apply(row, losses, kept_radius)
+            for neighbor_row, _ in losses:
+                if neighbor_row in version:
+                    version[neighbor_row] += 1
+            selected.append((candidate, score, discs.unique_coverage(row)))
+
+        return selected, rejected
+
+    def optimize_sleep_schedule(self, redundant_candidates, current_time):
+        """
+        Optimize sleep schedules for redundant nodes to minimize cooling periods
+        Cooling Period Minimization algorithm implementation
+        Nodes are chosen by select_sleep_candidates, so no node put to sleep
+        here is left with less than coverage_threshold of its area covered
+        """
+        sleep_schedule = {
+            'immediate_sleep': [],
+            'scheduled_sleep': [],
+            'cooling_optimized': [],
+            'coverage_rejected': [],
+            'energy_savings': 0,
+            'coverage_impact': 0
+        }
+
+        selected, rejected = self.select_sleep_candidates(
+            redundant_candidates, int(len(self.network.alive_nodes) * self.max_sleep_fraction))
+        sleep_schedule['coverage_rejected'] = [candidate['node'].id for candidate in rejected]
+
+        for candidate, redundancy_score, unique_coverage in selected:
+            node = candidate['node']
+
+            # Calculate optimal sleep duration based on cooling periods
+            optimal_sleep_duration = self._calculate_optimal_sleep_duration(node, current_time)
+
+            # Immediate sleep for highly redundant nodes
+            if redundancy_score > 0.8:
+                node.go_to_sleep(current_time)
+                sleep_schedule['immediate_sleep'].append({
+                    'node_id': node.id,
+                    'sleep_duration': optimal_sleep_duration,
+                    'redundancy_score': redundancy_score,
+                    'unique_coverage': unique_coverage,
+                    'expected_energy_savings': optimal_sleep_duration * 0.001  # Sleep energy savings
+                })
+
+                # Schedule wake-up
+                self._schedule_wake_up(node, current_time + optimal_sleep_duration)
+
+            # Scheduled sleep for moderately redundant nodes
+            elif redundancy_score > 0.6:
+                # Wait for current cooling period to end, then sleep
+                sleep_start_time = current_time + node.cooling_period + 1.0
+                sleep_schedule['scheduled_sleep'].append({
+                    'node_id': node.id,
+                    'sleep_start_time': sleep_start_time,
+                    'sleep_duration': optimal_sleep_duration,
+                    'redundancy_score': redundancy_score
+                })
+                self.network.event_queue.schedule(
+                    sleep_start_time, 'sleep_start', node, payload=optimal_sleep_duration)
+
+            # Cooling-optimized scheduling
+            else:
+                # Adjust sensing radius instead of sleep
+                node.set_sensing_radius(node.sensing_radius * self.radius_reduction_factor)
+                sleep_schedule['cooling_optimized'].append({
+                    'node_id': node.id,
+                    'radius_reduction': 1.0 - self.radius_reduction_factor,
+                    'energy_savings': 0.01  # Small energy savings from reduced sensing
+                })
+
+        # Calculate total impact
+        sleep_schedule['energy_savings'] = sum(
+            item.get('expected_energy_savings', 0)
+            for item in sleep_schedule['immediate_sleep'] + sleep_schedule['cooling_optimized']
+        )
+
+        sleep_schedule['coverage_impact'] = sum(
+            item['unique_coverage'] for item in sleep_schedule['immediate_sleep'])
+
+        return sleep_schedule
+
+    def _calculate_optimal_sleep_duration(self, node, current_time):
+        """
+        Calculate optimal sleep duration based on cooling period and energy status
+        Research algorithm for cooling period minimization
+        """
+        # Base sleep duration
+        base_duration = self.sleep_duration_min
+
+        # Extend based on energy level (lower energy = longer sleep)
+        energy_factor = 1.0 - (node.energy / node.initial_energy)
+        energy_extension = energy_factor * (self.sleep_duration_max - self.sleep_duration_min)
+
+        # Cooling period consideration
+        cooling_extension = node.cooling_period * self.cooling_optimization_factor
+
+        # Neighbor density factor (more neighbors = can sleep longer)
+        neighbor_factor = min(2.0, len(node.neighbor_nodes) / 5.0)
+
+        optimal_duration = (base_duration + energy_extension +
+                          cooling_extension + neighbor_factor)
+
+        return min(self.sleep_duration_max, max(self.sleep_duration_min, optimal_duration))
+
+    def _schedule_wake_up(self, node, wake_up_time):
+        """Schedule node wake-up at specified time"""
+        self.network.event_queue.schedule(wake_up_time, 'wake_up', node)
+
+    def execute_sleep_wake_optimization(self, current_time):
+        """
+        Execute complete sleep-wake optimization cycle
+        Main function implemention for proposed algorithm
+        """
+        print(f"\n Sleep-Wake Optimization Cycle - Time {current_time}")
+
+        # Step 1: Analyze coverage redundancy
+        coverage_analysis = self.analyze_coverage_redundancy(current_time)
+
+        print(f"    Coverage Analysis:")
+        print(f"       Redundant candidates: {coverage_analysis['total_redundant_nodes']}")
+
+        for region_id, region_data in coverage_analysis['region_coverage'].items():
+            efficiency = region_data['coverage_efficiency']
+            print(f"       Region {region_id}: {efficiency:.1%} coverage efficiency")
+
+        # Step 2: Optimize sleep schedules
+        sleep_schedule = self.optimize_sleep_schedule(
+            coverage_analysis['redundant_candidates'], current_time)
+
+        print(f"    Sleep Optimization:")
+        print(f"       Immediate sleep: {len(sleep_schedule['immediate_sleep'])} nodes")
+        print(f"       Scheduled sleep: {len(sleep_schedule['scheduled_sleep'])} nodes")
+        print(f"       Radius optimized: {len(sleep_schedule['cooling_optimized'])} nodes")
+        print(f"       Kept awake for coverage: {len(sleep_schedule['coverage_rejected'])} nodes")
+        print(f"       Energy savings: {sleep_schedule['energy_savings']:.4f} units")
+        print(f"       Coverage impact: {sleep_schedule['coverage_impact']:.3f}")
+
+        # Step 3: Start due scheduled sleeps and wake up scheduled nodes
+        scheduled_sleeps_started = self._process_sleep_schedule(current_time)
+        if scheduled_sleeps_started > 0:
+            print(f"       Scheduled sleeps started: {scheduled_sleeps_started}")
+
+        nodes_awakened = self._process_wake_up_schedule(current_time)
+        if nodes_awakened > 0:
+            print(f"       Nodes awakened: {nodes_awakened}")
+
+        # Step 4: Update optimization history
+        optimization_record = {
+            'time': current_time,
+            'redundant_candidates': coverage_analysis['total_redundant_nodes'],
+            'nodes_put_to_sleep': len(sleep_schedule['immediate_sleep']),
+            'scheduled_sleeps_started': scheduled_sleeps_started,
+            'nodes_awakened': nodes_awakened,
+            'energy_savings': sleep_schedule['energy_savings'],
+            'coverage_impact': sleep_schedule['coverage_impact'],
+            'region_efficiencies': {
+                region_id: data['coverage_efficiency']
+                for region_id, data in coverage_analysis['region_coverage'].items()
+            }
+        }
+
+        self._record_optimization(optimization_record)
+
+        # Step 5: Calculate cooling period improvements
+        cooling_improvements = self._analyze_cooling_improvements(current_time)
+
+        return {
+            'coverage_analysis': coverage_analysis,
+            'sleep_schedule': sleep_schedule,
+            'optimization_record': optimization_record,
+            'cooling_improvements': cooling_improvements
+        }
+
+    def _process_sleep_schedule(self, current_time):
+        """Put nodes to sleep whose scheduled sleep start is due, then schedule their wake-up"""
+        started_count = 0
+
+        for _, node, sleep_duration in self.network.event_queue.pop_due('sleep_start', current_time):
+            if node.alive and node.state == NodeState.ACTIVE:
+                node.go_to_sleep(current_time)
+                self._schedule_wake_up(node, current_time + sleep_duration)
+                started_count += 1
+
+        return started_count
+
+    def _process_wake_up_schedule(self, current_time):
+        """Process scheduled wake-ups for sleeping nodes (only due events are visited)"""
+        awakened_count = 0
+
+        for _, node, _ in self.network.event_queue.pop_due('wake_up', current_time):
+            if node.alive and node.state == NodeState.SLEEP:
+                node.wake_up(current_time)
+                awakened_count += 1
+
+        return awakened_count
+
+    def _analyze_cooling_improvements(self, current_time):
+        """
+        Analyze improvements in cooling period management
+        Key metric for evaluation
+        """
+        arrays = self.network.node_arrays
+        active = arrays.column('alive') & (arrays.column('state') != STATE_CODES[NodeState.SLEEP])
+        active_count = int(active.sum())
+
+        if active_count == 0:
+            return {}
+
+        # Current cooling period statistics
+        cooling_periods = arrays.column('cooling_period')[active]
+        cooling_violations = int((cooling_periods > 0).sum())
+
+        # Energy efficiency metrics
+        total_energy = float(arrays.column('energy')[active].sum())
+        energy_efficiency = total_energy / (active_count * 3.0)  # Normalized by max energy
+
+        # Coverage efficiency with fewer active nodes
+        total_coverage = float(arrays.column('coverage_area')[active].sum())
+        network_area = self.network.width * self.network.height
+        coverage_efficiency = min(1.0, total_coverage / network_area)
+        union_coverage = float(self.network.coverage_raster.coverage_fraction(1))
+
+        improvements = {
+            'active_nodes': active_count,
+            'average_cooling_period': float(cooling_periods.mean()),
+            'cooling_violations': cooling_violations,
+            'cooling_violation_rate': cooling_violations / active_count,
+            'energy_efficiency': energy_efficiency,
+            'coverage_efficiency': coverage_efficiency,
+            'union_coverage': union_coverage,
+            'optimization_effectiveness': 1.0 - (cooling_violations / active_count)
+        }
+
+        return improvements
+
+    def _record_optimization(self, optimization_record):
+        """Append an optimization record and update the running aggregates"""
+        self.optimization_history.append(optimization_record)
+
+        self.redundant_candidate_stats.update(optimization_record['redundant_candidates'])
+        self.coverage_impact_stats.update(optimization_record['coverage_impact'])
+        self.energy_savings_stats.update(optimization_record['energy_savings'])
+
+        for region_id, efficiency in optimization_record['region_efficiencies'].items():
+            if region_id not in self.region_efficiency_stats:
+                self.region_efficiency_stats[region_id] = RunningStatistics()
+            self.region_efficiency_stats[region_id].update(efficiency)
+
+    def get_optimization_statistics(self):
+        """
+        Get comprehensive optimization statistics for analysis
+        Served from running aggregates, so the cost is independent of history length
+        """
+        if self.coverage_impact_stats.count == 0:
+            return {}
+
+        average_coverage_impact = self.coverage_impact_stats.mean
+
+        # Regional efficiency trends
+        region_efficiency_trends = {
+            region_id: {
+                'average': stats.mean,
+                'trend': stats.trend()
+            }
+            for region_id, stats in sorted(self.region_efficiency_stats.items())
+        }
+
+        statistics = {
+            'total_optimization_cycles': self.coverage_impact_stats.count,
+            'total_energy_saved': self.energy_savings_stats.total,
+            'average_redundant_nodes': self.redundant_candidate_stats.mean,
+            'average_coverage_impact': average_coverage_impact,
+            'coverage_impact_std': self.coverage_impact_stats.std,
+            'region_efficiency_trends': region_efficiency_trends,
+            'algorithm_effectiveness': 1.0 - average_coverage_impact  # Lower impact = better algorithm
+        }
+
+        return statistics
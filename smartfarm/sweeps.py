@@ -0,0 +1,157 @@
+"""
+Parameter-sweep engine for the δ / f_max / MinRest sensitivity analysis
+
+Runs every grid point × seed across a process pool and writes mean / 95% CI
+per point to JSON, which latex/scripts/generate_sensitivity_figures.py plots.
+
+Usage:
+    python -m smartfarm.sweeps --seeds 30 --out latex/data/sensitivity_sweeps.json
+    python -m smartfarm.sweeps --design oat --seeds 30   # one-at-a-time around the defaults
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .cache import DEFAULT_CACHE_DIR, ResultCache
+from .experiments import DEFAULT_CONFIG, mean_ci, run_single
+
+# Swept parameters and their grids (6 × 6 × 5)
+SWEEP_PARAMETERS = {
+    'delta': [0.00, 0.05, 0.10, 0.15, 0.20, 0.25],     # CH cooling-penalty weight
+    'fmax': [0.10, 0.15, 0.20, 0.25, 0.30, 0.35],      # Maximum sleep fraction
+    'min_rest': [1.0, 2.0, 3.0, 4.0, 5.0],             # Minimum cooling rest period
+}
+
+# Values used when a parameter is not being varied (the paper's settings)
+SWEEP_DEFAULTS = {'delta': 0.10, 'fmax': 0.20, 'min_rest': 2.0}
+
+def sweep_config(params, base_config=None):
+    """Translate sweep parameters into an experiment config"""
+    return {
+        **DEFAULT_CONFIG,
+        **(base_config or {}),
+        'cost_weights': {'cooling': params['delta']},
+        'max_sleep_fraction': params['fmax'],
+        'min_rest_period': params['min_rest'],
+    }
+
+def sweep_points(parameters=None, design='full'):
+    """
+    Grid points to evaluate
+    'full' is the factorial grid; 'oat' varies one parameter at a time with
+    the others held at SWEEP_DEFAULTS
+    """
+    parameters = parameters or SWEEP_PARAMETERS
+    names = list(parameters)
+
+    if design == 'full':
+        return [dict(zip(names, values)) for values in itertools.product(*parameters.values())]
+
+    if design == 'oat':
+        points = []
+        for name in names:
+            for value in parameters[name]:
+                point = {**SWEEP_DEFAULTS, name: value}
+                if point not in points:
+                    points.append(point)
+        return points
+
+    raise ValueError("design must be 'full' or 'oat'")
+
+def _run_task(task):
+    """Worker entry point: one (point, seed) simulation"""
+    point_index, seed, config = task
+    return point_index, seed, run_single(seed, config)
+
+def run_sweep(points, seeds, base_config=None, workers=None, cache=None):
+    """
+    Run every point × seed and aggregate per point
+    Runs found in the ResultCache (if given) are not recomputed
+    Returns [{'params': {...}, 'metrics': {name: {'mean', 'ci95', 'n'}}}]
+    """
+    seeds = list(seeds)
+    configs = [sweep_config(point, base_config) for point in points]
+    workers = workers or os.cpu_count() or 1
+
+    summaries = [dict() for _ in points]
+    tasks = []
+    for i, config in enumerate(configs):
+        for seed in seeds:
+            cached = cache.get(config, seed) if cache is not None else None
+            if cached is not None:
+                summaries[i][seed] = cached['summary']
+            else:
+                tasks.append((i, seed, config))
+
+    if cache is not None:
+        print(f"    {cache.hits} runs served from cache, {len(tasks)} to simulate")
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and tasks else contextlib.nullcontext()
+
+    with pool as executor:
+        if executor is None:
+            outcomes = map(_run_task, tasks)
+        else:
+            outcomes = executor.map(_run_task, tasks, chunksize=max(1, len(tasks) // (workers * 8)))
+
+        for done, (point_index, seed, result) in enumerate(outcomes, 1):
+            summaries[point_index][seed] = result['summary']
+            if cache is not None:
+                cache.put(configs[point_index], seed, result)
+            if done % max(1, len(tasks) // 20) == 0:
+                print(f"    {done}/{len(tasks)} runs completed")
+
+    results = []
+    for point, by_seed in zip(points, summaries):
+        runs = [by_seed[seed] for seed in seeds]
+        metrics = {}
+        for key in runs[0]:
+            values = [run[key] for run in runs if run[key] is not None]
+            mean, ci = mean_ci(values)
+            metrics[key] = {'mean': mean, 'ci95': ci, 'n': len(values)}
+        results.append({'params': point, 'metrics': metrics})
+
+    return results
+
+def main():
+    ap = argparse.ArgumentParser(description='Run the δ / f_max / MinRest sensitivity sweeps')
+    ap.add_argument('--design', choices=['full', 'oat'], default='full')
+    ap.add_argument('--seeds', type=int, default=30, help='Seeds per grid point')
+    ap.add_argument('--seed-start', type=int, default=1000)
+    ap.add_argument('--rounds', type=int, default=DEFAULT_CONFIG['num_rounds'])
+    ap.add_argument('--nodes', type=int, default=DEFAULT_CONFIG['total_nodes'])
+    ap.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    ap.add_argument('--out', default='latex/data/sensitivity_sweeps.json')
+    ap.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Result cache directory')
+    ap.add_argument('--no-cache', action='store_true', help='Always re-run simulations')
+    args = ap.parse_args()
+
+    base_config = {'num_rounds': args.rounds, 'total_nodes': args.nodes}
+    seeds = list(range(args.seed_start, args.seed_start + args.seeds))
+    points = sweep_points(design=args.design)
+
+    print(f"Sweep: {len(points)} points × {len(seeds)} seeds ({args.design} design)")
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    results = run_sweep(points, seeds, base_config, workers=args.workers, cache=cache)
+    if cache is not None:
+        cache.flush_stats()
+
+    output = {
+        'design': args.design,
+        'config': {**DEFAULT_CONFIG, **base_config},
+        'seeds': seeds,
+        'parameters': SWEEP_PARAMETERS,
+        'defaults': SWEEP_DEFAULTS,
+        'points': results,
+    }
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(output, indent=2))
+    print(f"Wrote {out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Shared fixtures: small seeded networks built the way experiments.py builds runs"""
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from smartfarm.experiments import build_simulation
+from smartfarm.simulation import run_comprehensive_simulation
+
+# Dense enough that sensing discs overlap and sleep-wake finds redundant nodes
+SMALL_CONFIG = {'total_nodes': 120, 'width': 80, 'height': 80, 'num_rounds': 5}
+
+
+def build_small(seed=1000, **overrides):
+    """(network, ch_selector, router, sleep_optimizer) for SMALL_CONFIG"""
+    return build_simulation(seed, {**SMALL_CONFIG, **overrides})
+
+
+@pytest.fixture
+def make_simulation():
+    """Factory for independent small simulations (e.g. to compare two code paths)"""
+    return build_small
+
+
+@pytest.fixture
+def simulation():
+    return build_small()
+
+
+@pytest.fixture
+def network(simulation):
+    return simulation[0]
+
+
+@pytest.fixture
+def churn():
+    """
+    Drive a simulation through a few rounds, then kill, resize, sleep and wake
+    a random sample of nodes, so incremental structures have changes to absorb
+    """
+    def apply(simulation, num_rounds=3, seed=7):
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_comprehensive_simulation(*simulation, num_rounds=num_rounds)
+        network = simulation[0]
+        rng = np.random.default_rng(seed)
+        alive = [node for node in network.nodes if node.alive]
+
+        for k, i in enumerate(rng.choice(len(alive), size=len(alive) // 3, replace=False)):
+            node = alive[i]
+            if k % 4 == 0:
+                node.consume_energy(node.energy)
+            elif k % 4 == 1:
+                node.set_sensing_radius(node.sensing_radius * rng.uniform(0.6, 1.4))
+            elif k % 4 == 2:
+                node.go_to_sleep(network.current_time)
+            else:
+                node.wake_up(network.current_time)
+        return simulation
+
+    return apply
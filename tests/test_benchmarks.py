@@ -0,0 +1,37 @@
+import json
+import sys
+
+from smartfarm import benchmarks
+from smartfarm.profiling import COUNTERS, PHASES
+
+
+def run_cli(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['benchmarks', '--sizes', '50', '--rounds', '2', *args])
+    benchmarks.main()
+
+
+def test_benchmark_cli_writes_sizes_and_estimator_tradeoff(monkeypatch, tmp_path):
+    out = tmp_path / 'benchmarks.json'
+    run_cli(monkeypatch, '--estimator-repeats', '1', '--out', str(out))
+    output = json.loads(out.read_text())
+
+    [entry] = output['sizes']
+    assert (entry['requested_nodes'], entry['nodes'], entry['rounds']) == (50, 50, 2)
+    assert set(entry['phases_ms']) == {'deployment', 'neighbor_discovery', 'coverage_raster', *PHASES}
+    assert set(entry['counters']) == set(COUNTERS)
+
+    # Fields the computational trade-off figure reads
+    tradeoff = output['coverage_estimators']
+    assert tradeoff['nodes'] > 0
+    assert tradeoff['coverage_samples'] == 50
+    assert tradeoff['grid_points_per_radius'] > 0
+    for estimator in ('monte_carlo', 'grid', 'analytic'):
+        stats = tradeoff['estimators'][estimator]
+        assert stats['ms_per_node'] > 0
+        assert 0 <= stats['mean_abs_error_pct'] <= stats['max_abs_error_pct']
+
+    # Comparing against itself (with generous tolerance) flags nothing
+    rerun = tmp_path / 'rerun.json'
+    run_cli(monkeypatch, '--skip-estimators', '--baseline', str(out), '--tolerance', '100',
+            '--out', str(rerun))
+    assert json.loads(rerun.read_text())['regressions'] == []
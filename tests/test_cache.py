@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+
+from smartfarm import cache
+from smartfarm.cache import ResultCache, run_key
+from smartfarm.history import MetricStore
+
+CONFIG = {'total_nodes': 40, 'width': 60, 'height': 60, 'num_rounds': 3}
+
+
+def make_result(seed, rounds=3):
+    round_data = MetricStore.from_columns({
+        'round': np.arange(rounds, dtype=np.int64),
+        'alive_nodes': np.full(rounds, 40 - seed % 5, dtype=np.int64),
+        'coverage_ratio': np.linspace(0.9, 0.8, rounds),
+        'region_energy': np.arange(rounds * 4, dtype=float).reshape(rounds, 4),
+    })
+    return {'seed': seed, 'round_data': round_data,
+            'summary': {'final_coverage': 0.8, 'network_lifetime': rounds, 'seed': seed}}
+
+
+def test_put_get_round_trip(tmp_path):
+    result_cache = ResultCache(tmp_path)
+    result = make_result(1000)
+    result_cache.put(CONFIG, 1000, result)
+
+    cached = result_cache.get(CONFIG, 1000)
+    assert cached['seed'] == 1000
+    assert cached['summary'] == result['summary']
+    assert set(cached['round_data'].keys()) == set(result['round_data'].keys())
+    for name in result['round_data'].keys():
+        np.testing.assert_array_equal(cached['round_data'][name], result['round_data'][name])
+
+    assert result_cache.get(CONFIG, 1001) is None
+    assert (result_cache.hits, result_cache.misses, result_cache.stores) == (1, 1, 1)
+
+
+def test_key_changes_with_config_seed_and_code(monkeypatch):
+    key = run_key(CONFIG, 1000)
+    assert run_key(dict(CONFIG), 1000) == key
+    assert run_key({**CONFIG, 'num_rounds': 4}, 1000) != key
+    assert run_key(CONFIG, 1001) != key
+
+    monkeypatch.setattr(cache, '_code_version', 'another-version')
+    assert run_key(CONFIG, 1000) != key
+
+
+def test_evict_removes_least_recently_used_first(tmp_path):
+    result_cache = ResultCache(tmp_path)
+    for seed in range(4):
+        result_cache.put(CONFIG, seed, make_result(seed))
+    paths = [result_cache._path(run_key(CONFIG, seed)) for seed in range(4)]
+    for age, path in enumerate(paths):
+        os.utime(path, (1000 + age, 1000 + age))
+
+    sizes = [path.stat().st_size for path in paths]
+    assert result_cache.evict(max_bytes=sum(sizes[2:])) == 2
+    assert [path.exists() for path in paths] == [False, False, True, True]
+    assert result_cache.size_bytes() <= sum(sizes[2:])
+
+    # A hit refreshes the entry, so the other one is evicted next
+    assert result_cache.get(CONFIG, 2) is not None
+    assert result_cache.evict(max_bytes=result_cache.size_bytes() - 1) == 1
+    assert [path.exists() for path in paths[2:]] == [True, False]
+
+
+def test_truncated_entry_is_a_miss_and_removed(tmp_path):
+    result_cache = ResultCache(tmp_path)
+    result_cache.put(CONFIG, 1000, make_result(1000))
+    path = result_cache._path(run_key(CONFIG, 1000))
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+    assert result_cache.get(CONFIG, 1000) is None
+    assert result_cache.misses == 1
+    assert not path.exists()
+
+    result_cache.put(CONFIG, 1000, make_result(1000))
+    assert result_cache.get(CONFIG, 1000)['summary']['seed'] == 1000
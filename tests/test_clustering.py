@@ -0,0 +1,44 @@
+import pytest
+
+
+def baseline_selection(ch_selector, region_id, current_time):
+    """Per-node CH selection: calculate_ch_cost for each candidate, AdN discount, first minimum wins"""
+    network = ch_selector.network
+    best_node, best_cost, best_breakdown = None, float('inf'), None
+    for node in network.nodes:
+        if node.region_id != region_id or not node.alive or node.energy <= 0.5:
+            continue
+        if node.cooling_period > node.min_rest_period * 0.5:
+            continue
+
+        cost, breakdown = ch_selector.calculate_ch_cost(node, current_time)
+        if node.type == 'AdN':
+            cost *= 0.9
+        if cost < best_cost:
+            best_node, best_cost, best_breakdown = node, cost, breakdown
+    return best_node, best_breakdown
+
+
+@pytest.mark.parametrize('current_time', [0.5, 1.5, 4.0])
+def test_batched_selection_matches_per_node_baseline(make_simulation, churn, current_time):
+    batched, baseline = make_simulation(), make_simulation()
+    for simulation in (batched, baseline):
+        churn(simulation)
+        network = simulation[0]
+        # Spread recent transmissions so cooling snapshots straddle the critical threshold
+        for node in network.nodes[::2]:
+            node.transmit_data(current_time - 2.5 + node.id % 21 * 0.1, forced=True)
+        network.process_cooling_expiry(current_time - 0.5)
+
+    ch_selector = batched[1]
+    selected = ch_selector.select_cluster_heads(current_time)
+
+    for region_id in sorted(baseline[0].regions):
+        node, breakdown = baseline_selection(baseline[1], region_id, current_time)
+        if node is None:
+            assert region_id not in selected
+            continue
+        assert selected[region_id].id == node.id
+        record = next(record for record in reversed(ch_selector.selection_history)
+                      if record['region_id'] == region_id)
+        assert record['cost_breakdown'] == pytest.approx(breakdown)
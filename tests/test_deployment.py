@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy.spatial import cKDTree
+
+from smartfarm.deployment import LAYOUTS, Deployment, generate_deployment, poisson_disc_positions
+from smartfarm.regions import build_partition
+
+WIDTH, HEIGHT = 400, 300
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_layouts_place_every_node_inside_the_field(layout):
+    # 410 is not a square, so the jittered grid has nodes left over
+    deployment = generate_deployment(layout, 410, WIDTH, HEIGHT, rng=np.random.default_rng(5))
+
+    assert len(deployment) == 410
+    assert ((deployment.x >= 0) & (deployment.x <= WIDTH)).all()
+    assert ((deployment.y >= 0) & (deployment.y <= HEIGHT)).all()
+    assert deployment.advanced.sum() == 410 - int(0.8 * 410)
+
+
+@pytest.mark.parametrize('min_distance', [8.0, 12.0])
+def test_poisson_disc_respects_minimum_spacing(min_distance):
+    x, y = poisson_disc_positions(300, WIDTH, HEIGHT, np.random.default_rng(11),
+                                  min_distance=min_distance)
+    assert len(x) == 300
+
+    positions = np.column_stack([x, y])
+    distance, _ = cKDTree(positions).query(positions, k=2)
+    assert distance[:, 1].min() >= min_distance
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_same_seed_gives_same_layout(layout):
+    first = generate_deployment(layout, 100, WIDTH, HEIGHT, rng=np.random.default_rng(21))
+    second = generate_deployment(layout, 100, WIDTH, HEIGHT, rng=np.random.default_rng(21))
+    other = generate_deployment(layout, 100, WIDTH, HEIGHT, rng=np.random.default_rng(22))
+
+    np.testing.assert_array_equal(first.x, second.x)
+    np.testing.assert_array_equal(first.y, second.y)
+    np.testing.assert_array_equal(first.advanced, second.advanced)
+    assert not np.array_equal(first.x, other.x)
+
+
+def test_save_load_round_trip(tmp_path):
+    deployment = generate_deployment('uniform', 200, WIDTH, HEIGHT, rng=np.random.default_rng(3))
+    deployment.save(tmp_path / 'plain.npz')
+    deployment.assign_regions(build_partition('fixed', WIDTH, HEIGHT))
+    deployment.save(tmp_path / 'regions.npz')
+
+    plain = Deployment.load(tmp_path / 'plain.npz')
+    assert plain.region_id is None
+    np.testing.assert_array_equal(plain.x, deployment.x)
+
+    loaded = Deployment.load(tmp_path / 'regions.npz')
+    assert (loaded.width, loaded.height, loaded.layout) == (WIDTH, HEIGHT, 'uniform')
+    for name in ('x', 'y', 'advanced', 'initial_energy', 'energy', 'region_id'):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(deployment, name))
@@ -0,0 +1,17 @@
+import sys
+
+from smartfarm import experiments
+
+
+def run_cli(monkeypatch, out, workers):
+    monkeypatch.setattr(sys, 'argv', [
+        'experiments', '--runs', '3', '--rounds', '2', '--nodes', '40', '--width', '60',
+        '--height', '60', '--workers', str(workers), '--no-cache', '--out', str(out)])
+    experiments.main()
+    return out.read_bytes()
+
+
+def test_cli_output_is_independent_of_worker_count(monkeypatch, tmp_path):
+    serial = run_cli(monkeypatch, tmp_path / 'serial.json', workers=1)
+    parallel = run_cli(monkeypatch, tmp_path / 'parallel.json', workers=2)
+    assert serial == parallel
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from smartfarm.history import MetricStore
+
+FIELDS = {'round': np.int64, 'coverage': np.float64, 'region_energy': (np.float64, (3,))}
+
+
+def make_records(count):
+    return [{'round': i, 'coverage': 1.0 / (i + 1), 'region_energy': [i, 2.0 * i, 3.0 * i]}
+            for i in range(count)]
+
+
+def assert_columns(store, records):
+    assert len(store) == len(records)
+    np.testing.assert_array_equal(store['round'], [record['round'] for record in records])
+    np.testing.assert_array_equal(store['coverage'], [record['coverage'] for record in records])
+    np.testing.assert_array_equal(store['region_energy'], [record['region_energy'] for record in records])
+
+
+@pytest.mark.parametrize('on_disk', [False, True])
+def test_appends_past_capacity_keep_every_round(tmp_path, on_disk):
+    store = MetricStore(FIELDS, capacity=2, directory=tmp_path / 'history' if on_disk else None)
+    records = make_records(11)
+    for record in records:
+        store.append(record)
+    store.append({'round': 11})  # Missing fields are NaN / 0
+    assert store.capacity == 16
+
+    assert_columns(store, records + [{'round': 11, 'coverage': np.nan, 'region_energy': [np.nan] * 3}])
+    assert store[-1]['round'] == 11
+    assert store[3]['coverage'] == 0.25
+    assert [row['round'] for row in store[2:5]] == [2, 3, 4]
+
+    if on_disk:
+        store.flush()
+        # The grown files hold every appended row, readable without the store
+        for name, (dtype, shape) in store.fields.items():
+            reopened = np.memmap(tmp_path / 'history' / f'{name}.bin', dtype=dtype, mode='r')
+            assert len(reopened) == store.capacity * int(np.prod(shape, dtype=np.int64))
+            np.testing.assert_array_equal(reopened.reshape((store.capacity,) + shape)[:len(store)],
+                                          store[name])
+
+
+def test_exports_match_appended_rounds(tmp_path):
+    store = MetricStore(FIELDS, capacity=1, directory=tmp_path)
+    records = make_records(5)
+    for record in records:
+        store.append(record)
+
+    assert store.to_records() == records
+
+    copy = MetricStore.from_columns({name: store[name] for name in store.keys()})
+    assert_columns(copy, records)
+    assert copy.to_records() == records
+
+
+def test_pandas_export_splits_vector_fields(tmp_path):
+    pytest.importorskip('pandas')
+    store = MetricStore(FIELDS, capacity=1, directory=tmp_path)
+    records = make_records(5)
+    for record in records:
+        store.append(record)
+
+    frame = store.to_pandas()
+    assert list(frame.columns) == ['round', 'coverage', 'region_energy_0', 'region_energy_1',
+                                   'region_energy_2']
+    assert frame['region_energy_2'].tolist() == [record['region_energy'][2] for record in records]
+    assert frame['coverage'].tolist() == [record['coverage'] for record in records]
+
+
+def test_arrow_export_matches_pandas(tmp_path):
+    pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    store = MetricStore(FIELDS, capacity=1, directory=tmp_path)
+    for record in make_records(5):
+        store.append(record)
+
+    assert store.to_arrow().to_pandas().equals(store.to_pandas())
@@ -0,0 +1,135 @@
+import numpy as np
+
+from smartfarm.network import CoverageRaster
+from smartfarm.routing import CommunicationGraph
+
+
+def test_coverage_raster_matches_rebuild(simulation, churn):
+    network = simulation[0]
+    churn(simulation)
+    raster = network.coverage_raster
+
+    rebuilt = CoverageRaster(network.width, network.height, resolution=raster.resolution,
+                             partition=network.partition, max_k=raster.max_k)
+    for node in network.nodes:
+        if CoverageRaster.is_covering(node):
+            rebuilt.add_node(node)
+
+    assert np.array_equal(raster.counts, rebuilt.counts)
+    assert np.array_equal(raster.level_cells, rebuilt.level_cells)
+    assert raster.stamps == rebuilt.stamps
+
+
+def test_event_queue_reschedule_supersedes_and_cancel_drops(network):
+    queue = network.event_queue
+    first, second, third = network.nodes[:3]
+    queue.schedule(3.0, 'wake_up', first)
+    queue.schedule(1.0, 'wake_up', second)
+    queue.schedule(2.0, 'wake_up', third)
+    queue.schedule(5.0, 'wake_up', first)  # Supersedes the 3.0 entry
+    queue.cancel(third, 'wake_up')
+
+    assert {node.id for node in queue.scheduled_nodes('wake_up')} == {first.id, second.id}
+    assert [(time, node.id) for time, node, _ in queue.pop_due('wake_up', 4.0)] == [(1.0, second.id)]
+    assert [(time, node.id) for time, node, _ in queue.pop_due('wake_up', 5.0)] == [(5.0, first.id)]
+    assert not queue.is_scheduled(first, 'wake_up')
+
+
+def test_event_driven_cooling_matches_full_sweep(make_simulation):
+    """Cooling expiry driven by the event queue gives the states of updating every node each step"""
+    event_driven, swept = make_simulation()[0], make_simulation()[0]
+    rng = np.random.default_rng(3)
+    steps = np.arange(0.0, 8.0, 0.5)
+    senders = [rng.choice(len(event_driven.nodes), size=15, replace=False) for _ in steps]
+
+    for current_time, rows in zip(steps, senders):
+        for network in (event_driven, swept):
+            for row in rows:
+                network.nodes[row].transmit_data(current_time)
+            network.nodes[int(rows[0])].consume_energy(0.3)
+
+        event_driven.process_cooling_expiry(current_time + 0.25)
+        for node in swept.nodes:
+            if node.alive:
+                node.update_cooling_period(current_time + 0.25)
+
+        for name in ('state', 'cooling_period', 'alive'):
+            np.testing.assert_array_equal(event_driven.node_arrays.column(name),
+                                          swept.node_arrays.column(name))
+
+
+def neighbor_ids(network):
+    return {node.id: {other.id for other in node.neighbor_nodes} for node in network.nodes}
+
+
+def in_sensing_range(node, other):
+    return (other.id != node.id and other.alive and
+            node.distance(other) <= node.sensing_radius + other.sensing_radius)
+
+
+def test_neighbor_graph_matches_reference_rebuild(simulation, churn):
+    """
+    Replay every death and radius change against the post-deployment lists with
+    an all-pairs recompute: the incremental lists must end up identical
+    """
+    network = simulation[0]
+    expected = neighbor_ids(network)
+
+    def replay(node, event):
+        if event == 'death':
+            for neighbors in expected.values():
+                neighbors.discard(node.id)
+            expected[node.id] = set()
+        elif event == 'radius_change' and node.alive:
+            expected[node.id] = set()
+            for other in network.nodes:
+                if in_sensing_range(node, other):
+                    expected[node.id].add(other.id)
+                    expected[other.id].add(node.id)
+                elif other.id != node.id:
+                    expected[other.id].discard(node.id)
+
+    for node in network.nodes:
+        node.add_state_observer(replay)
+    churn(simulation)
+
+    assert neighbor_ids(network) == expected
+    arrays = network.node_arrays
+    assert arrays.column('neighbor_count').tolist() == [len(node.neighbor_nodes) for node in network.nodes]
+
+
+def test_neighbor_graph_matches_geometry_once_every_radius_changed(simulation, churn):
+    network = simulation[0]
+    churn(simulation)
+    for node in network.nodes:
+        if node.alive:
+            node.set_sensing_radius(node.sensing_radius * 0.95)
+
+    for node in network.nodes:
+        expected = {other.id for other in network.nodes if node.alive and in_sensing_range(node, other)}
+        assert {other.id for other in node.neighbor_nodes} == expected
+
+
+def live_links(graph):
+    links = {}
+    for row in np.flatnonzero(~graph.removed).tolist():
+        rows, distances, energies = graph.neighbors(row)
+        links[row] = [link for link in zip(rows, distances, energies) if not graph.removed[link[0]]]
+    return links
+
+
+def test_communication_graph_matches_fresh_build_after_deaths(simulation, churn):
+    network, _, router, _ = simulation
+    graph = router.get_communication_graph()
+    churn(simulation)
+    for node in network.nodes[::5]:
+        node.consume_energy(node.energy)
+
+    costs = router.transmission_costs
+    rebuilt = CommunicationGraph(network, costs['max_transmission_range'],
+                                 energy_electronics=costs['energy_electronics'],
+                                 energy_amplifier=costs['energy_amplifier'],
+                                 sink=network.base_station)
+
+    assert np.array_equal(graph.removed, rebuilt.removed)
+    assert live_links(graph) == live_links(rebuilt)
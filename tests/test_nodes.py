@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from smartfarm.nodes import STATE_CODES, NodeArrays, NodeState, SmartFarmingNode
+
+
+def test_state_observers_see_each_transition_once(network):
+    node = network.nodes[3]
+    events = []
+    node.add_state_observer(lambda observed, event: events.append((observed.id, event)))
+
+    node.transmit_data(1.0)
+    node.update_cooling_period(1.5)
+    node.update_cooling_period(4.0)
+    node.go_to_sleep(4.0)
+    node.go_to_sleep(4.5)  # Already asleep: no event
+    node.wake_up(5.0)
+    node.consume_energy(node.energy)
+    node.consume_energy(1.0)  # Already dead: no second death
+
+    # Both the transmission and the switch to COOLING start the rest period
+    assert [event for _, event in events] == ['cooling_start', 'cooling_start', 'cooling_end',
+                                              'sleep', 'wake', 'death']
+    assert {node_id for node_id, _ in events} == {3}
+    assert node.state == NodeState.SLEEP and not node.alive
+
+
+def test_node_views_read_and_write_through_growing_arrays():
+    arrays = NodeArrays(capacity=1)
+    nodes = [SmartFarmingNode(i, x=float(i), y=2.0 * i, energy=1.0 + i, node_type='NoN',
+                              region_id=i % 3, arrays=arrays) for i in range(5)]
+    assert arrays.capacity >= 5
+
+    nodes[1].consume_energy(0.25)
+    nodes[3].state = NodeState.COOLING
+    arrays.cooling_until[4] = 7.5
+
+    assert arrays.column('energy').tolist() == [1.0, 1.75, 3.0, 4.0, 5.0]
+    assert arrays.column('state')[3] == STATE_CODES[NodeState.COOLING]
+    assert nodes[4].cooling_until == 7.5
+    assert [node.y for node in nodes] == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert arrays.totals['alive_energy'] == pytest.approx(14.75)
+    assert arrays.region_alive.tolist() == [2, 2, 1]
+
+
+def test_transmission_at_time_zero_cools_and_returns_to_active(network):
+    node = network.nodes[5]
+    assert node.transmit_data(0.0)
+    assert node.state == NodeState.TRANSMITTING
+    assert node.cooling_until == node.min_rest_period
+
+    network.process_cooling_expiry(1.0)
+    assert node.state == NodeState.COOLING
+    assert node.cooling_period == 1.0
+    assert not node.can_transmit(1.0)
+
+    network.process_cooling_expiry(2.0)
+    assert node.state == NodeState.ACTIVE
+    assert node.cooling_period == 0
+    assert node.can_transmit(2.0)
+
+
+def test_expired_transmitting_node_returns_to_active(network):
+    node = network.nodes[7]
+    node.min_rest_period = 0.5
+    assert node.transmit_data(3.0)
+
+    network.process_cooling_expiry(4.0)
+    assert node.state == NodeState.ACTIVE
+    assert node.cooling_period == 0
+
+
+def test_can_transmit_does_not_change_state(network):
+    node = network.nodes[3]
+    node.transmit_data(1.0)
+    state, cooling = node.state, node.cooling_period
+
+    assert not node.can_transmit(2.0)
+    assert node.can_transmit(3.0)
+    assert (node.state, node.cooling_period) == (state, cooling)
+
+
+def test_bulk_cooling_update_matches_per_node(make_simulation):
+    bulk, per_node = make_simulation()[0], make_simulation()[0]
+    times = [0.0, 0.0, 0.5, 1.0, 1.7, 2.0, 3.1]
+    events = {'bulk': [], 'per_node': []}
+
+    for name, network in (('bulk', bulk), ('per_node', per_node)):
+        for row, time in enumerate(times):
+            network.nodes[row].transmit_data(time)
+        for node in network.nodes:
+            node.add_state_observer(lambda node, event, log=events[name]: log.append((node.id, event)))
+
+    for current_time in (1.0, 2.0, 2.5, 4.0, 6.0):
+        bulk.node_arrays.update_cooling_periods(current_time)
+        for node in per_node.nodes:
+            node.update_cooling_period(current_time)
+
+        for name in ('state', 'cooling_period'):
+            np.testing.assert_array_equal(bulk.node_arrays.column(name),
+                                          per_node.node_arrays.column(name))
+
+    # Observers fire only for rows whose state changes
+    assert sorted(events['bulk']) == sorted(events['per_node'])
+    assert len(events['bulk']) == 2 * len(times)
+
+    active = STATE_CODES[NodeState.ACTIVE]
+    assert (bulk.node_arrays.column('state')[:len(times)] == active).all()
+
+
+def test_batched_sensing_and_actuation_match_per_node(make_simulation):
+    batched, per_node = make_simulation()[0], make_simulation()[0]
+    for network in (batched, per_node):
+        network.nodes[4].consume_energy(network.nodes[4].energy)
+        network.nodes[6].go_to_sleep(0.0)
+
+    rows = batched.node_arrays.sensing_rows()
+    assert 4 not in rows and 6 not in rows
+
+    readings = batched.node_arrays.sense_environment(rows, 3.0, rng=np.random.default_rng(5))
+    rng = np.random.default_rng(5)
+    per_node_readings = [per_node.nodes[row].sense_environment(3.0, rng=rng) for row in rows]
+    assert per_node.nodes[4].sense_environment(3.0, rng=rng) is None
+    np.testing.assert_allclose(readings, [[data[name] for name in NodeArrays.SENSOR_FIELDS]
+                                          for data in per_node_readings])
+
+    # Readings on both sides of every threshold, for every node (dead one included)
+    rows = np.arange(len(batched.nodes))
+    readings = np.column_stack([
+        np.resize([10.0, 25.0, 35.0, 29.0], len(rows)),   # temperature
+        np.resize([50.0, 85.0, 60.0], len(rows)),         # humidity
+        np.resize([25.0, 50.0, 75.0, 30.0, 70.0], len(rows)),  # soil moisture
+        np.full(len(rows), 6.5),
+        np.full(len(rows), 500.0),
+    ])
+    station = batched.base_station
+    accepted = batched.node_arrays.control_actuators(rows, station.generate_actuator_commands_batch(readings))
+
+    accepted_per_node = 0
+    for node, values in zip(per_node.nodes, readings):
+        data = dict(zip(NodeArrays.SENSOR_FIELDS, values))
+        accepted_per_node += node.control_actuators(station.generate_actuator_commands(node.id, data))
+
+    assert accepted == accepted_per_node == len(rows) - 1
+    for name in [*NodeArrays.ACTUATOR_FIELDS, 'energy', 'alive']:
+        np.testing.assert_allclose(batched.node_arrays.column(name), per_node.node_arrays.column(name))
+    for name in ('irrigation', 'ventilation_fan', 'heating_system'):
+        assert 0 < batched.node_arrays.column(name).sum() < len(rows)
+
+
+def test_running_totals_match_full_recompute(simulation, churn):
+    network = simulation[0]
+    churn(simulation)
+    for node in network.nodes[::9]:
+        node.region_id = (node.region_id + 1) % len(network.regions)
+
+    arrays = network.node_arrays
+    alive = arrays.column('alive')
+    energy = arrays.column('energy')
+    region = arrays.column('region_id')
+    regions = len(arrays.region_alive)
+
+    assert arrays.totals['alive'] == alive.sum()
+    assert arrays.totals['alive_energy'] == pytest.approx(energy[alive].sum())
+    assert arrays.totals['alive_coverage_area'] == pytest.approx(arrays.column('coverage_area')[alive].sum())
+    for name in ('cooling_violations', 'successful_transmissions', 'failed_transmissions'):
+        assert arrays.totals[name] == arrays.column(name).sum()
+    assert arrays.region_alive.tolist() == np.bincount(region[alive], minlength=regions).tolist()
+    assert np.allclose(arrays.region_energy, np.bincount(region[alive], weights=energy[alive],
+                                                         minlength=regions))
@@ -0,0 +1,35 @@
+import json
+
+from smartfarm.profiling import COUNTERS, PHASES, SimulationProfiler
+from smartfarm.simulation import run_comprehensive_simulation
+
+
+def test_profiler_records_phases_and_counters_per_round(simulation, tmp_path):
+    profiler = SimulationProfiler(profile_every=2, memory_every=3, top_functions=5)
+    run_comprehensive_simulation(*simulation, num_rounds=4, profiler=profiler)
+
+    report = profiler.report()
+    assert report['phases'] == list(PHASES)
+    assert report['counters'] == list(COUNTERS)
+
+    rounds = report['rounds']
+    assert [record['round'] for record in rounds] == [1, 2, 3, 4]
+    assert set(rounds[0]) == ({'round', 'total_ns', 'captured', 'peak_memory_bytes'} |
+                              {f'{phase}_ns' for phase in PHASES} | set(COUNTERS))
+    for record in rounds:
+        assert record['total_ns'] >= sum(record[f'{phase}_ns'] for phase in PHASES) > 0
+        assert record['captured'] == (record['round'] % 2 == 0 or record['round'] % 3 == 0)
+        assert (record['peak_memory_bytes'] > 0) == (record['round'] % 3 == 0)
+
+    counters = report['summary']['counters']
+    assert counters['dijkstra_expansions'] > 0
+    assert counters['overlap_computations'] > 0
+    assert counters['events_processed'] > 0
+    assert counters == {name: sum(record[name] for record in rounds) for name in COUNTERS}
+
+    assert report['summary']['timed_rounds'] == 1  # Rounds 2-4 were captured
+    assert [capture['round'] for capture in report['captures']] == [2, 4]
+    assert len(report['captures'][0]['functions']) == 5
+
+    profiler.save(tmp_path / 'profile.json')
+    assert json.loads((tmp_path / 'profile.json').read_text())['summary'] == report['summary']
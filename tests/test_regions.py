@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from smartfarm.regions import PARTITIONERS, build_partition
+
+OPTIONS = {'fixed': {}, 'grid': {'region_size': 70.0}, 'kmeans': {'k': 6}, 'quadtree': {'max_nodes': 60}}
+
+
+def clustered_positions(width, height, count=600, seed=3):
+    """Uneven field: most nodes in one corner, so adaptive regions differ in size"""
+    rng = np.random.default_rng(seed)
+    dense = rng.uniform(0, [width / 3, height / 3], size=(count * 2 // 3, 2))
+    sparse = rng.uniform(0, [width, height], size=(count - len(dense), 2))
+    positions = np.vstack([dense, sparse])
+    return positions[:, 0], positions[:, 1]
+
+
+@pytest.mark.parametrize('method', PARTITIONERS)
+def test_regions_tile_the_field(method):
+    width, height = 300.0, 200.0
+    x, y = clustered_positions(width, height)
+    partition = build_partition(method, width, height, x, y, rng=np.random.default_rng(0),
+                                **OPTIONS[method])
+
+    labels = partition.assign(x, y)
+    assert labels.shape == x.shape
+    assert ((labels >= 0) & (labels < len(partition))).all()
+
+    assert (partition.areas > 0).all()
+    assert partition.areas.sum() == pytest.approx(width * height)
+
+
+def test_kmeans_areas_follow_the_cells():
+    width, height = 300.0, 200.0
+    x, y = clustered_positions(width, height)
+    partition = build_partition('kmeans', width, height, x, y, rng=np.random.default_rng(0), k=6)
+
+    # Regions in the dense corner are small, those covering the sparse rest are large
+    assert partition.areas.max() > 4 * partition.areas.min()
+
+    # Fine Monte Carlo reference for the nearest-center cell areas
+    points = np.random.default_rng(1).uniform(0, [width, height], size=(200_000, 2))
+    share = np.bincount(partition.assign(points[:, 0], points[:, 1]), minlength=len(partition))
+    np.testing.assert_allclose(partition.areas, share / len(points) * width * height,
+                               rtol=0.05, atol=0.002 * width * height)
+
+
+@pytest.mark.parametrize('method', PARTITIONERS)
+def test_every_node_belongs_to_exactly_one_region(make_simulation, method):
+    network = make_simulation(partition=method, partition_options=OPTIONS[method])[0]
+
+    members = [node.id for region in network.regions.values() for node in region['nodes']]
+    assert sorted(members) == [node.id for node in network.nodes]
+    for region_id, region in network.regions.items():
+        assert all(node.region_id == region_id for node in region['nodes'])
+    assert sum(region['area'] for region in network.regions.values()) == pytest.approx(
+        network.width * network.height)
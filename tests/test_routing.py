@@ -0,0 +1,121 @@
+import heapq
+
+import pytest
+
+
+def test_link_matches_positions_and_radio_model(simulation):
+    network, _, router, _ = simulation
+    graph = router.get_communication_graph()
+
+    for source in range(0, len(network.nodes), 7):
+        rows, distances, energies = graph.neighbors(source)
+        for target, distance, energy in zip(rows, distances, energies):
+            assert graph.link(source, target) == (distance, energy)
+            assert distance == pytest.approx(network.nodes[source].distance(network.nodes[target]))
+            assert energy == pytest.approx(
+                router.calculate_transmission_energy(network.nodes[source], network.nodes[target]))
+
+
+def test_link_raises_for_missing_or_removed_links(simulation):
+    network, _, router, _ = simulation
+    graph = router.get_communication_graph()
+    source = 0
+    target = graph.neighbors(source)[0][0]
+
+    # Node rows never list the sink: only searches rooted at the sink reach it
+    with pytest.raises(KeyError):
+        graph.link(source, graph.sink)
+
+    network.nodes[target].consume_energy(network.nodes[target].energy + 1)
+    with pytest.raises(KeyError):
+        graph.link(source, target)
+    assert router.link_energy(network.nodes[source], network.nodes[target]) == (float('inf'), None)
+
+
+def test_ch_to_bs_energy_counts_a_sender_drained_by_its_hop(simulation):
+    network, _, router, _ = simulation
+    graph = router.get_communication_graph()
+    cluster_head = network.nodes[0]
+    path = router.find_path_to_base_station(cluster_head, 0.0)
+    assert path is not None
+
+    receiver_rows = [graph.index_of[node.id] for node in path[1:-1]] + [graph.sink]
+    expected = sum(graph.link(receiver_row, graph.index_of[sender.id])[1] * 5
+                   for sender, receiver_row in zip(path[:-1], receiver_rows))
+
+    # The CH's own transmission (0.05 J per unit) kills it and removes it from the graph
+    cluster_head.energy = 0.2
+    success, details = router.route_ch_data_to_bs(cluster_head, 0.0, aggregated_data_size=5)
+
+    assert not cluster_head.alive
+    assert success
+    assert details['total_energy_consumed'] == pytest.approx(expected)
+
+
+def path_cost(graph, path, current_time):
+    """Sender-side cost the route searches minimize: link energy + distance + cooling penalty"""
+    cost = 0.0
+    for sender, receiver in zip(path, path[1:]):
+        distance, energy = graph.link(graph.index_of[sender.id], graph.index_of[receiver.id])
+        cost += energy + distance + sender.remaining_cooling(current_time) * 100
+    return cost
+
+
+def reference_path(graph, source, target, current_time):
+    """Cheapest source -> target path by a forward Dijkstra per member (what the trees replace)"""
+    src, dst = graph.index_of[source.id], graph.index_of[target.id]
+    costs = {src: 0.0}
+    previous = {}
+    visited = set()
+    heap = [(0.0, src)]
+
+    while heap:
+        cost, row = heapq.heappop(heap)
+        if row in visited:
+            continue
+        if row == dst:
+            break
+        visited.add(row)
+
+        sender = graph.nodes[row]
+        if not sender.can_transmit(current_time):
+            continue
+        penalty = sender.remaining_cooling(current_time) * 100
+        for neighbor, distance, energy in zip(*graph.neighbors(row)):
+            if neighbor in visited or not graph.nodes[neighbor].alive:
+                continue
+            if cost + energy + distance + penalty < costs.get(neighbor, float('inf')):
+                costs[neighbor] = cost + energy + distance + penalty
+                previous[neighbor] = row
+                heapq.heappush(heap, (costs[neighbor], neighbor))
+
+    if dst not in previous:
+        return None
+    rows = [dst]
+    while rows[-1] != src:
+        rows.append(previous[rows[-1]])
+    return [graph.nodes[row] for row in reversed(rows)]
+
+
+def test_path_tree_matches_per_member_dijkstra(make_simulation, churn):
+    # A field wider than the radio range, so most paths are multi-hop
+    simulation = make_simulation(width=250, height=250)
+    network, _, router, _ = simulation
+    churn(simulation)
+    current_time = 10.0
+    for node in network.nodes[::6]:
+        node.transmit_data(current_time - 0.5)
+
+    graph = router.get_communication_graph()
+    alive = [node for node in network.nodes if node.alive]
+    for cluster_head in alive[::25]:
+        for member in alive:
+            if member is cluster_head:
+                continue
+            tree_path = router.find_path_to_cluster_head(member, cluster_head, current_time)
+            search_path = reference_path(graph, member, cluster_head, current_time)
+
+            assert (tree_path is None) == (search_path is None)
+            if tree_path is not None:
+                assert path_cost(graph, tree_path, current_time) == pytest.approx(
+                    path_cost(graph, search_path, current_time))
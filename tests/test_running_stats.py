@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from smartfarm.running_stats import RunningStatistics
+
+
+def test_empty_statistics():
+    stats = RunningStatistics()
+    assert (stats.count, stats.mean, stats.variance, stats.std, stats.total) == (0, 0.0, 0.0, 0.0, 0.0)
+    assert stats.minimum is None and stats.first is None
+    assert stats.trend() == 'stable'
+
+
+def test_single_value():
+    stats = RunningStatistics()
+    stats.update(3.5)
+    assert (stats.count, stats.mean, stats.variance, stats.std) == (1, 3.5, 0.0, 0.0)
+    assert stats.minimum == stats.maximum == stats.first == stats.last == 3.5
+    assert stats.trend() == 'stable'
+
+
+@pytest.mark.parametrize('size', [2, 17, 1000])
+def test_matches_numpy(size):
+    values = np.random.default_rng(size).normal(50.0, 7.0, size=size)
+    stats = RunningStatistics()
+    for value in values:
+        stats.update(float(value))
+
+    assert stats.count == size
+    assert stats.mean == pytest.approx(np.mean(values), rel=1e-12)
+    assert stats.variance == pytest.approx(np.var(values), rel=1e-9)
+    assert stats.std == pytest.approx(np.std(values, ddof=0), rel=1e-9)
+    assert stats.total == pytest.approx(values.sum(), rel=1e-12)
+    assert (stats.minimum, stats.maximum) == (values.min(), values.max())
+    assert (stats.first, stats.last) == (values[0], values[-1])
+    assert stats.trend() == ('improving' if values[-1] > values[0] else 'stable')
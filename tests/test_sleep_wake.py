@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from smartfarm.network import SpatialIndex
+from smartfarm.nodes import STATE_CODES, NodeState
+
+
+def sleeper_rows(network):
+    """Rows asleep or scheduled to sleep"""
+    arrays = network.node_arrays
+    asleep = np.flatnonzero(arrays.column('alive') &
+                            (arrays.column('state') == STATE_CODES[NodeState.SLEEP]))
+    scheduled = [node._row for node in network.event_queue.scheduled_nodes('sleep_start')]
+    return set(asleep.tolist()) | set(scheduled)
+
+
+def covered_fraction(optimizer, node, awake_nodes):
+    """Fraction of node's lattice points covered by any awake node (brute force)"""
+    points = np.array([node.x, node.y]) + optimizer._unit_lattice() * node.sensing_radius
+    centers = np.array([(other.x, other.y) for other in awake_nodes])
+    radii = np.array([other.sensing_radius for other in awake_nodes])
+    distance_sq = ((points[:, None, :] - centers[None, :, :])**2).sum(axis=-1)
+    return (distance_sq <= radii**2).any(axis=1).mean()
+
+
+def assert_sleepers_covered(network, optimizer):
+    sleepers = sleeper_rows(network)
+    awake = [node for node in network.nodes
+             if node.alive and node.state != NodeState.SLEEP and node._row not in sleepers]
+    for row in sleepers:
+        assert (covered_fraction(optimizer, network.nodes[row], awake) >=
+                optimizer.coverage_threshold - 1e-9)
+    return sleepers
+
+
+def test_sleepers_stay_covered_across_cycles(simulation):
+    network, _, _, optimizer = simulation
+
+    optimizer.execute_sleep_wake_optimization(1.0)
+    first = assert_sleepers_covered(network, optimizer)
+    assert first
+
+    # Cycle-one sleepers are asleep (sleeps last at least 5 time units) when cycle two runs
+    optimizer._process_sleep_schedule(4.0)
+    assert all(network.nodes[row].state == NodeState.SLEEP for row in first)
+
+    optimizer.execute_sleep_wake_optimization(4.0)
+    second = assert_sleepers_covered(network, optimizer)
+    assert second > first
+
+
+def test_selection_keeps_earlier_sleepers_covered(simulation):
+    network, _, _, optimizer = simulation
+    optimizer.execute_sleep_wake_optimization(1.0)
+    optimizer._process_sleep_schedule(4.0)
+    first = sleeper_rows(network)
+    assert first
+
+    # Offer every awake neighbor of a cycle-one sleeper as a highly redundant candidate
+    neighbors = {neighbor._row: neighbor for row in first
+                 for neighbor in network.nodes[row].neighbor_nodes
+                 if neighbor.alive and neighbor.state != NodeState.SLEEP and neighbor._row not in first}
+    candidates = [{'node': node, 'redundancy_score': 0.9, 'unique_coverage': 0.0,
+                   'energy_level': 1.0, 'cooling_status': 1.0} for node in neighbors.values()]
+
+    selected, rejected = optimizer.select_sleep_candidates(candidates, len(candidates))
+    assert rejected
+
+    # Candidates re-scored to 0.6 or less keep a reduced radius and stay awake
+    chosen = {candidate['node']._row for candidate, score, _ in selected if score > 0.6}
+    awake = [node for node in network.nodes if node.alive and node.state != NodeState.SLEEP and
+             node._row not in chosen and node._row not in first]
+    for row in first | chosen:
+        assert (covered_fraction(optimizer, network.nodes[row], awake) >=
+                optimizer.coverage_threshold - 1e-9)
+
+
+def test_scheduled_sleepers_are_not_selected_again(simulation):
+    network, _, _, optimizer = simulation
+    optimizer.execute_sleep_wake_optimization(1.0)
+    scheduled = {node.id for node in network.event_queue.scheduled_nodes('sleep_start')}
+    assert scheduled
+
+    schedule = optimizer.execute_sleep_wake_optimization(1.5)['sleep_schedule']
+    reselected = {item['node_id'] for item in schedule['immediate_sleep'] + schedule['scheduled_sleep']}
+    assert not reselected & scheduled
+
+
+def place_discs(network, discs):
+    """Move the first len(discs) nodes to (x, y, radius) and line the rest up out of range"""
+    far = [(10.0 + 12.0 * k, 100.0, 1.0) for k in range(len(network.nodes) - len(discs))]
+    for node, (x, y, radius) in zip(network.nodes, list(discs) + far):
+        node.x, node.y, node.sensing_radius = x, y, radius
+    network.spatial_index = SpatialIndex(network.nodes)
+    for node in network.nodes:
+        node.neighbor_nodes = [other for other in network.nodes if other is not node and
+                               node.distance(other) <= node.sensing_radius + other.sensing_radius]
+
+
+def reference_unique_coverage(nodes, resolution=0.02):
+    """U(i) on a dense square grid over each disc (brute force over all nodes)"""
+    unique = []
+    for node in nodes:
+        r = node.sensing_radius
+        offsets = np.arange(-r, r + resolution, resolution)
+        gx, gy = np.meshgrid(node.x + offsets, node.y + offsets)
+        inside = (gx - node.x)**2 + (gy - node.y)**2 <= r**2
+        covered = np.zeros_like(inside)
+        for other in nodes:
+            if other is not node:
+                covered |= (gx - other.x)**2 + (gy - other.y)**2 <= other.sensing_radius**2
+        unique.append((inside & ~covered).sum() / inside.sum())
+    return unique
+
+
+def test_estimators_match_dense_grid_reference(make_simulation):
+    network, _, _, optimizer = make_simulation(total_nodes=16, width=200, height=200)
+    # Overlapping pair, isolated disc, and a disc nested inside a larger one
+    place_discs(network, [(50, 50, 5.0), (56, 50, 5.0), (150, 150, 5.0), (50, 150, 8.0), (51, 150, 3.0)])
+    nodes = network.nodes[:5]
+    reference = reference_unique_coverage(network.nodes)[:5]
+
+    optimizer.coverage_estimator = 'analytic'
+    analytic, bounds = optimizer.estimate_unique_coverage(nodes, 1.0)
+    assert all(bound is None for bound in bounds.values())
+    # Overlaps are disjoint pairs here, so the pairwise estimator is exact
+    assert [analytic[node.id] for node in nodes] == pytest.approx(reference, abs=5e-3)
+    assert analytic[nodes[2].id] == 1.0
+    assert analytic[nodes[4].id] == 0.0
+
+    for estimator in ('monte_carlo', 'grid'):
+        optimizer.coverage_estimator = estimator
+        optimizer.coverage_samples = 2000
+        estimate, errors = optimizer.estimate_unique_coverage(nodes, 1.0)
+        for node, expected in zip(nodes, reference):
+            assert abs(estimate[node.id] - expected) <= errors[node.id] + 5e-3
+        assert estimate[nodes[2].id] == 1.0
+        assert estimate[nodes[4].id] == 0.0
@@ -0,0 +1,37 @@
+import json
+import sys
+
+from smartfarm import sweeps
+
+# Metrics latex/scripts/generate_sensitivity_figures.py plots along each parameter
+FIGURE_METRICS = ('lifetime', 'energy_per_round', 'cluster_stability', 'union_coverage', 'pdr',
+                  'average_path_length')
+
+
+def run_cli(monkeypatch, tmp_path, out):
+    monkeypatch.setattr(sweeps, 'SWEEP_PARAMETERS',
+                        {'delta': [0.05, 0.10], 'fmax': [0.20, 0.30], 'min_rest': [2.0]})
+    monkeypatch.setattr(sys, 'argv', [
+        'sweeps', '--design', 'oat', '--seeds', '1', '--rounds', '2', '--nodes', '40',
+        '--workers', '1', '--cache-dir', str(tmp_path / 'cache'), '--out', str(out)])
+    sweeps.main()
+    return json.loads(out.read_text())
+
+
+def test_sweep_cli_writes_figure_inputs(monkeypatch, tmp_path):
+    output = run_cli(monkeypatch, tmp_path, tmp_path / 'sweeps.json')
+
+    assert output['seeds'] == [1000]
+    assert output['defaults'] == sweeps.SWEEP_DEFAULTS
+    assert [point['params'] for point in output['points']] == [
+        {'delta': 0.05, 'fmax': 0.20, 'min_rest': 2.0},
+        {'delta': 0.10, 'fmax': 0.20, 'min_rest': 2.0},
+        {'delta': 0.10, 'fmax': 0.30, 'min_rest': 2.0},
+    ]
+    for point in output['points']:
+        for metric in FIGURE_METRICS:
+            assert set(point['metrics'][metric]) == {'mean', 'ci95', 'n'}
+            assert point['metrics'][metric]['n'] == 1
+
+    # A second run is served from the cache and writes the same results
+    assert run_cli(monkeypatch, tmp_path, tmp_path / 'cached.json') == output